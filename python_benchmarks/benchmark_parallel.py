@@ -0,0 +1,79 @@
+import argparse
+import random
+import sys
+import time
+from typing import Dict, List
+
+from python_code.get_acceptors_and_donors import (
+    DnaFragmentType,
+    get_donors,
+    get_fragments_parallel,
+    DEFAULT_CHUNK_SIZE,
+)
+
+
+def create_random_sequences(sequences_num: int, sequence_len: int, introns_num: int, seed: int = 42) -> List[Dict]:
+    """
+    Create random sequences in format returned by ``dna_data_read``.
+
+    Args:
+        sequences_num: Number of sequences.
+        sequence_len: Length of each sequence.
+        introns_num: Number of introns in each sequence.
+        seed: Seed of random generator.
+
+    Returns:
+        List of dictionaries: {"Introns", "Exons", "Sequence"}.
+    """
+    rng = random.Random(seed)
+    sequences = []
+    for _ in range(sequences_num):
+        bounds = sorted(rng.sample(range(1, sequence_len - 1), 2 * introns_num))
+        introns = list(zip(bounds[::2], bounds[1::2]))
+        sequences.append(
+            {
+                "Introns": introns,
+                "Exons": [],
+                "Sequence": "".join(rng.choice("ACGT") for _ in range(sequence_len)),
+            }
+        )
+    return sequences
+
+
+def benchmark_parallel_command(command_args: List[str]) -> None:
+    """
+    Measure time of getting donors serially and using worker processes, print speedup.
+
+    Args:
+        command_args: Arguments for command.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-A", "--a_len", default=190, type=int)
+    parser.add_argument("-B", "--b_len", default=190, type=int)
+    parser.add_argument("-n", "--sequences_num", default=2000, type=int)
+    parser.add_argument("-l", "--sequence_len", default=5000, type=int)
+    parser.add_argument("-w", "--workers", nargs="+", default=[2, 4, 8], type=int)
+    parser.add_argument("--chunk_size", default=DEFAULT_CHUNK_SIZE, type=int)
+    parser.add_argument("-o", "--overlap", action="store_true", default=False)
+    args = parser.parse_args(command_args)
+
+    sequences = create_random_sequences(args.sequences_num, args.sequence_len, 5)
+
+    start = time.perf_counter()
+    serial_result = get_donors(args.a_len, args.b_len, sequences, args.overlap)
+    serial_time = time.perf_counter() - start
+    print(f"serial: {serial_time:.3f}s")
+
+    for workers in args.workers:
+        start = time.perf_counter()
+        parallel_result = get_fragments_parallel(
+            args.a_len, args.b_len, sequences, [DnaFragmentType.DONOR], args.overlap, workers, args.chunk_size
+        )
+        parallel_time = time.perf_counter() - start
+
+        assert parallel_result[DnaFragmentType.DONOR] == serial_result
+        print(f"workers: {workers}, time: {parallel_time:.3f}s, speedup: {serial_time / parallel_time:.2f}x")
+
+
+if __name__ == "__main__":
+    benchmark_parallel_command(sys.argv[1:])
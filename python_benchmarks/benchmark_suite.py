@@ -0,0 +1,224 @@
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from python_code.get_acceptors_and_donors import (
+    DONOR_SEQ,
+    DnaFragmentType,
+    dna_data_read,
+    get_acceptors,
+    get_donors,
+    get_false_fragments,
+    get_true_positions,
+    save_sequences_to_file,
+)
+from python_code.synthetic_data import DEFAULT_INTRON_DENSITY, save_synthetic_data
+
+
+def measure(function: Callable, repeats: int) -> List[float]:
+    """
+    Measure wall time of ``function`` calls.
+
+    Args:
+        function: Function without arguments.
+        repeats: Number of calls.
+
+    Returns:
+        Times of calls in seconds.
+    """
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def get_git_commit() -> Optional[str]:
+    """
+    Returns:
+        Hash of current git commit, None when it can't be read.
+    """
+    try:
+        # capture_output and text arguments are missing in python 3.6
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(
+    input_path: str,
+    windows: List[Tuple[int, int]],
+    overlaps: List[bool],
+    repeats: int,
+    output_dir: str,
+) -> List[Dict]:
+    """
+    Time ``dna_data_read``, ``get_donors``, ``get_acceptors``, ``get_false_fragments`` and
+    ``save_sequences_to_file`` on one input file. ``dna_data_read`` depends only on input, other
+    benchmarks are run for every window and overlap mode.
+
+    Args:
+        input_path: Path to file with sequences.
+        windows: Windows (A, B).
+        overlaps: Overlap modes.
+        repeats: Number of runs of each benchmark.
+        output_dir: Directory for files written by ``save_sequences_to_file``.
+
+    Returns:
+        List of results: {"benchmark", "a_len", "b_len", "overlap", "times", "min", "mean"}.
+    """
+
+    def read():
+        with open(input_path) as dna_file:
+            return dna_data_read(dna_file)
+
+    dna_sequences = read()
+    results = [
+        {"benchmark": "dna_data_read", "a_len": None, "b_len": None, "overlap": None, "times": measure(read, repeats)}
+    ]
+
+    for a_len, b_len in windows:
+        for overlap in overlaps:
+
+            def false_donors():
+                for dna_sequence in dna_sequences:
+                    get_false_fragments(
+                        get_true_positions(dna_sequence, DnaFragmentType.DONOR),
+                        a_len,
+                        b_len,
+                        dna_sequence["Sequence"],
+                        DONOR_SEQ,
+                        overlap,
+                    )
+
+            true_donors, false_donors_list = get_donors(a_len, b_len, dna_sequences, overlap)
+            output = os.path.join(output_dir, "result.dat")
+            functions = {
+                "get_donors": lambda: get_donors(a_len, b_len, dna_sequences, overlap),
+                "get_acceptors": lambda: get_acceptors(a_len, b_len, dna_sequences, overlap),
+                "get_false_fragments": false_donors,
+                "save_sequences_to_file": lambda: save_sequences_to_file(true_donors, false_donors_list, output),
+            }
+            for name, function in functions.items():
+                results.append(
+                    {
+                        "benchmark": name,
+                        "a_len": a_len,
+                        "b_len": b_len,
+                        "overlap": overlap,
+                        "times": measure(function, repeats),
+                    }
+                )
+
+    for result in results:
+        result["min"] = min(result["times"])
+        result["mean"] = sum(result["times"]) / len(result["times"])
+    return results
+
+
+def get_result_key(result: Dict) -> Tuple:
+    """
+    Args:
+        result: Result of benchmark - look ``run_benchmarks``.
+
+    Returns:
+        Values which identify benchmark between runs.
+    """
+    return result["benchmark"], result["sequences_num"], result["a_len"], result["b_len"], result["overlap"]
+
+
+def compare_results(old_results: Dict, new_results: Dict) -> List[str]:
+    """
+    Compare minimal times of benchmarks from two runs of suite.
+
+    Args:
+        old_results: Saved results of suite.
+        new_results: Results of suite.
+
+    Returns:
+        Lines with ratio of new to old time for each benchmark found in both runs.
+    """
+    old_times = {get_result_key(x): x["min"] for x in old_results["results"]}
+    lines = []
+    for result in new_results["results"]:
+        key = get_result_key(result)
+        if key in old_times and old_times[key] > 0:
+            lines.append(
+                f"{key[0]} n={key[1]} A={key[2]} B={key[3]} overlap={key[4]}: "
+                f"{old_times[key]:.4f}s -> {result['min']:.4f}s ({result['min'] / old_times[key]:.2f}x)"
+            )
+    return lines
+
+
+def benchmark_suite_command(command_args: List[str]) -> None:
+    """
+    Generate synthetic araclean files of given sizes, time extraction functions for every size, window and
+    overlap mode and save results as JSON. With ``--compare`` times are compared with saved results.
+
+    Args:
+        command_args: Arguments for command.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-r", "--result", default="benchmark.json", help="JSON file with results", type=str)
+    parser.add_argument("-n", "--sequences_num", nargs="+", default=[100, 1000], type=int)
+    parser.add_argument("--min_len", default=1000, type=int)
+    parser.add_argument("--max_len", default=5000, type=int)
+    parser.add_argument("--intron_density", default=DEFAULT_INTRON_DENSITY, type=float)
+    parser.add_argument("--n_rate", default=0.001, type=float)
+    parser.add_argument("-w", "--windows", nargs="+", default=["10:10", "190:190"], help="windows A:B")
+    parser.add_argument("--repeats", default=3, type=int)
+    parser.add_argument("--seed", default=42, type=int)
+    parser.add_argument("--compare", default=None, help="JSON file with results of previous run")
+    args = parser.parse_args(command_args)
+
+    windows = [tuple(int(x) for x in window.split(":")) for window in args.windows]
+
+    results = {
+        "meta": {
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "commit": get_git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeats": args.repeats,
+        },
+        "results": [],
+    }
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for sequences_num in args.sequences_num:
+            input_path = os.path.join(tmp_dir, f"synthetic_{sequences_num}.dat")
+            bases_num = save_synthetic_data(
+                input_path, sequences_num, args.min_len, args.max_len, args.intron_density, args.n_rate, args.seed
+            )
+            for result in run_benchmarks(input_path, windows, [False, True], args.repeats, tmp_dir):
+                result.update(sequences_num=sequences_num, bases_num=bases_num)
+                results["results"].append(result)
+                print(
+                    f"{result['benchmark']} n={sequences_num} A={result['a_len']} B={result['b_len']} "
+                    f"overlap={result['overlap']}: {result['min']:.4f}s"
+                )
+
+    with open(args.result, "w") as result_f:
+        json.dump(results, result_f, indent=2)
+
+    if args.compare is not None:
+        with open(args.compare) as compare_f:
+            for line in compare_results(json.load(compare_f), results):
+                print(line)
+
+
+if __name__ == "__main__":
+    benchmark_suite_command(sys.argv[1:])
@@ -0,0 +1,250 @@
+import struct
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from python_code.compression import detect_compression, open_file
+
+# first bytes of binary fragments file
+BINARY_MAGIC: bytes = b"DNAF"
+# version of binary fragments file
+BINARY_VERSION: int = 1
+# header: magic, version, flags, fragment type, reserved, A, B, fragments number, exceptions number
+BINARY_HEADER = struct.Struct("<4sBBBBiiQQ")
+# flag set when file contains overlap fragments
+BINARY_OVERLAP_FLAG: int = 1
+# flag set when file contains weights - counts of deduplicated fragments
+BINARY_WEIGHTS_FLAG: int = 2
+# type of saved weights
+BINARY_WEIGHTS_DTYPE: str = "<u4"
+
+# nucleotides coded on 2 bits, other signs are saved in exceptions
+PACKED_NUCLEOTIDES: bytes = b"ACGT"
+
+# ASCII code -> 2 bit code
+PACK_TABLE: np.ndarray = np.zeros(256, dtype=np.uint8)
+# ASCII code -> true if sign can't be coded on 2 bits
+EXCEPTION_TABLE: np.ndarray = np.ones(256, dtype=bool)
+for code, nucleotide in enumerate(PACKED_NUCLEOTIDES):
+    PACK_TABLE[nucleotide] = code
+    EXCEPTION_TABLE[nucleotide] = False
+# 2 bit code -> ASCII code
+UNPACK_TABLE: np.ndarray = np.frombuffer(PACKED_NUCLEOTIDES, dtype=np.uint8)
+# byte -> number of set bits
+POPCOUNT_TABLE: np.ndarray = np.unpackbits(np.arange(256, dtype=np.uint8)[:, np.newaxis], axis=1).sum(axis=1)
+
+
+def fragments_list_to_array(fragments: List[str], fragment_len: int, skip_cut: bool = False) -> np.ndarray:
+    """
+    Convert list of fragments to 2-D array of ASCII codes, empty fragments are skipped
+    like in ``save_sequences_to_file``.
+
+    Args:
+        fragments: List of fragments.
+        fragment_len: Length of each fragment - A + B.
+        skip_cut: If true skip fragments of other length - python engine cuts fragments at edges of
+        sequence when A != B, numpy engine skips them - look ``numpy_fragments.get_edge_mask``. If false
+        such fragments raise ValueError.
+
+    Returns:
+        2-D uint8 array, each row is one fragment.
+    """
+    if skip_cut:
+        fragments = [x for x in fragments if len(x) == fragment_len]
+    fragments = [x for x in fragments if x != ""]
+    if any(len(x) != fragment_len for x in fragments):
+        raise ValueError(f"All fragments saved in binary file must have length {fragment_len}!")
+    if not fragments:
+        return np.empty((0, fragment_len), dtype=np.uint8)
+    return np.frombuffer("".join(fragments).encode("ascii"), dtype=np.uint8).reshape(-1, fragment_len)
+
+
+def pack_fragments(fragments: np.ndarray) -> np.ndarray:
+    """
+    Pack fragments on 2 bits per nucleotide, each row is padded to full bytes.
+
+    Args:
+        fragments: 2-D uint8 array of ASCII codes.
+
+    Returns:
+        2-D uint8 array with ``ceil(length / 4)`` bytes per fragment.
+    """
+    codes = PACK_TABLE[fragments]
+    padding = -codes.shape[1] % 4
+    codes = np.pad(codes, ((0, 0), (0, padding))).reshape(len(codes), (codes.shape[1] + padding) // 4, 4)
+    return (codes[:, :, 0] << 6) | (codes[:, :, 1] << 4) | (codes[:, :, 2] << 2) | codes[:, :, 3]
+
+
+def unpack_fragments(packed: np.ndarray, fragment_len: int) -> np.ndarray:
+    """
+    Reverse of ``pack_fragments``, without restoring exceptions.
+
+    Args:
+        packed: 2-D uint8 array created by ``pack_fragments``.
+        fragment_len: Length of each fragment.
+
+    Returns:
+        2-D uint8 array of ASCII codes.
+    """
+    packed = np.asarray(packed)
+    codes = np.stack([(packed >> shift) & 3 for shift in (6, 4, 2, 0)], axis=2).reshape(len(packed), 4 * packed.shape[1])
+    return UNPACK_TABLE[codes[:, :fragment_len]]
+
+
+def save_fragments_binary(
+    true_fragments: np.ndarray,
+    false_fragments: np.ndarray,
+    output: str,
+    a_len: int,
+    b_len: int,
+    fragment_type: int,
+    overlap_fragments: bool,
+    compression: Optional[str] = None,
+    compress_level: Optional[int] = None,
+    weights: Optional[np.ndarray] = None,
+) -> None:
+    """
+    Save donors/acceptors to binary file. File contains header, labels bit array, fragments
+    packed on 2 bits per nucleotide, bit mask of signs which aren't A, C, G, T (like N),
+    original values of those signs and optionally weights of fragments. True fragments are saved first.
+
+    Args:
+        true_fragments: 2-D uint8 array of true donors/acceptors - look ``fragments_list_to_array``.
+        false_fragments: 2-D uint8 array of false donors/acceptors.
+        output: Output file name.
+        a_len: Left length of donor/acceptor.
+        b_len: Right length of donor/acceptor.
+        fragment_type: Value of ``DnaFragmentType``.
+        overlap_fragments: If fragments were generated with overlap.
+        compression: Compression of output file, by default detected from ``output`` extension.
+        compress_level: Level of compression - look ``open_file``.
+        weights: Counts of fragments, true fragments first - look ``dedup.deduplicate_labeled_fragments``,
+        by default weights aren't saved.
+    """
+    fragments = np.concatenate([true_fragments, false_fragments]).astype(np.uint8, copy=False)
+    if fragments.shape[1] != a_len + b_len:
+        raise ValueError(f"Fragments must have length {a_len + b_len}!")
+    if weights is not None and len(weights) != len(fragments):
+        raise ValueError("Weights must be given for all fragments!")
+    flags = (BINARY_OVERLAP_FLAG if overlap_fragments else 0) | (BINARY_WEIGHTS_FLAG if weights is not None else 0)
+    labels = np.concatenate([np.ones(len(true_fragments), dtype=bool), np.zeros(len(false_fragments), dtype=bool)])
+    exceptions_mask = EXCEPTION_TABLE[fragments]
+    exceptions = fragments[exceptions_mask]
+
+    with open_file(output, "wb", compression, compress_level) as seq_f:
+        seq_f.write(
+            BINARY_HEADER.pack(
+                BINARY_MAGIC,
+                BINARY_VERSION,
+                flags,
+                fragment_type,
+                0,
+                a_len,
+                b_len,
+                len(fragments),
+                len(exceptions),
+            )
+        )
+        seq_f.write(np.packbits(labels).tobytes())
+        seq_f.write(pack_fragments(fragments).tobytes())
+        seq_f.write(np.packbits(exceptions_mask, axis=1).tobytes())
+        seq_f.write(exceptions.tobytes())
+        if weights is not None:
+            seq_f.write(np.asarray(weights).astype(BINARY_WEIGHTS_DTYPE).tobytes())
+
+
+def read_fragments_binary_header(input_path: str) -> Dict:
+    """
+    Read header of binary fragments file and compute offsets of its sections.
+
+    Args:
+        input_path: Path to binary fragments file.
+
+    Returns:
+        Dictionary with header values: {"a_len", "b_len", "type", "overlap", "weighted", "count",
+        "exceptions_count"} and offsets of sections.
+    """
+    with open_file(input_path, "rb") as seq_f:
+        header_bytes = seq_f.read(BINARY_HEADER.size)
+    if len(header_bytes) != BINARY_HEADER.size:
+        raise ValueError(f"File {input_path} is not binary fragments file!")
+
+    magic, version, flags, fragment_type, _, a_len, b_len, count, exceptions_count = BINARY_HEADER.unpack(header_bytes)
+    if magic != BINARY_MAGIC or version != BINARY_VERSION:
+        raise ValueError(f"File {input_path} is not binary fragments file in version {BINARY_VERSION}!")
+
+    fragment_len = a_len + b_len
+    header = {
+        "a_len": a_len,
+        "b_len": b_len,
+        "type": fragment_type,
+        "overlap": bool(flags & BINARY_OVERLAP_FLAG),
+        "weighted": bool(flags & BINARY_WEIGHTS_FLAG),
+        "count": count,
+        "exceptions_count": exceptions_count,
+        "packed_row_len": (fragment_len + 3) // 4,
+        "mask_row_len": (fragment_len + 7) // 8,
+    }
+    header["labels_offset"] = BINARY_HEADER.size
+    header["packed_offset"] = header["labels_offset"] + (count + 7) // 8
+    header["mask_offset"] = header["packed_offset"] + count * header["packed_row_len"]
+    header["exceptions_offset"] = header["mask_offset"] + count * header["mask_row_len"]
+    header["weights_offset"] = header["exceptions_offset"] + exceptions_count
+    return header
+
+
+def load_fragments_binary(
+    input_path: str, start: int = 0, stop: Optional[int] = None, use_mmap: bool = True
+) -> Dict:
+    """
+    Load fragments from binary file created by ``save_fragments_binary``. With ``use_mmap``
+    file is mapped to memory and only fragments from ``start`` to ``stop`` are decoded.
+    Compressed files are always read whole.
+
+    Args:
+        input_path: Path to binary fragments file.
+        start: Index of first loaded fragment.
+        stop: Index after last loaded fragment, by default all fragments.
+        use_mmap: If true map file to memory, if false read whole file.
+
+    Returns:
+        Header - look ``read_fragments_binary_header`` with "labels" - uint8 array of 0/1,
+        "fragments" - 2-D uint8 array of ASCII codes and "weights" - int64 array of counts
+        of fragments or None when file doesn't contain weights.
+    """
+    header = read_fragments_binary_header(input_path)
+    count = header["count"]
+    stop = count if stop is None else min(stop, count)
+    start = min(start, stop)
+
+    if detect_compression(input_path) is not None:
+        with open_file(input_path, "rb") as seq_f:
+            data = np.frombuffer(seq_f.read(), dtype=np.uint8)
+    elif use_mmap and count:
+        data = np.memmap(input_path, dtype=np.uint8, mode="r")
+    else:
+        data = np.fromfile(input_path, dtype=np.uint8)
+
+    labels = np.unpackbits(data[header["labels_offset"] : header["packed_offset"]], count=count)[start:stop]
+
+    packed = data[header["packed_offset"] : header["mask_offset"]].reshape(count, header["packed_row_len"])
+    mask = data[header["mask_offset"] : header["exceptions_offset"]].reshape(count, header["mask_row_len"])
+    fragment_len = header["a_len"] + header["b_len"]
+
+    fragments = unpack_fragments(packed[start:stop], fragment_len)
+    exceptions_mask = np.unpackbits(mask[start:stop], axis=1, count=fragment_len).astype(bool)
+
+    # exceptions are saved in order of fragments, skip exceptions of fragments before start
+    exceptions_begin = header["exceptions_offset"] + int(POPCOUNT_TABLE[mask[:start]].sum())
+    exceptions_num = int(exceptions_mask.sum())
+    fragments[exceptions_mask] = data[exceptions_begin : exceptions_begin + exceptions_num]
+
+    header["labels"] = labels
+    header["fragments"] = fragments
+    header["weights"] = None
+    if header["weighted"]:
+        weights_size = np.dtype(BINARY_WEIGHTS_DTYPE).itemsize
+        weights_begin = header["weights_offset"] + start * weights_size
+        weights = data[weights_begin : weights_begin + (stop - start) * weights_size]
+        header["weights"] = np.frombuffer(weights.tobytes(), dtype=BINARY_WEIGHTS_DTYPE).astype(np.int64)
+    return header
@@ -0,0 +1,107 @@
+import bz2
+import gzip
+import lzma
+import os
+from typing import Dict, Optional, Tuple
+
+# compression name -> first bytes of compressed file
+COMPRESSION_MAGIC: Dict[str, bytes] = {
+    "gzip": b"\x1f\x8b",
+    "bz2": b"BZh",
+    "xz": b"\xfd7zXZ\x00",
+}
+
+# compression name -> file extension
+COMPRESSION_EXTENSIONS: Dict[str, str] = {
+    "gzip": ".gz",
+    "bz2": ".bz2",
+    "xz": ".xz",
+}
+
+
+def detect_compression(file_path: str, mode: str = "r") -> Optional[str]:
+    """
+    Detect compression of file - for read mode by first bytes of existing file, for write mode
+    or when file doesn't exist by its extension.
+
+    Args:
+        file_path: Path to file.
+        mode: Mode in which file will be opened.
+
+    Returns:
+        Name of compression - key of ``COMPRESSION_MAGIC``, None for not compressed file.
+    """
+    if "r" in mode:
+        try:
+            with open(file_path, "rb") as f:
+                first_bytes = f.read(max(len(x) for x in COMPRESSION_MAGIC.values()))
+            for compression, magic in COMPRESSION_MAGIC.items():
+                if first_bytes.startswith(magic):
+                    return compression
+            return None
+        except FileNotFoundError:
+            pass
+
+    for compression, extension in COMPRESSION_EXTENSIONS.items():
+        if file_path.endswith(extension):
+            return compression
+    return None
+
+
+def split_extension(file_path: str) -> Tuple[str, str]:
+    """
+    Split file path to root and extension like ``os.path.splitext``, but compression extension is kept
+    together with extension before it, example: ``result.dat.gz`` -> ``result``, ``.dat.gz``.
+
+    Args:
+        file_path: Path to file.
+
+    Returns:
+        Root and extension of file path.
+    """
+    for extension in COMPRESSION_EXTENSIONS.values():
+        if file_path.endswith(extension):
+            root, ext = os.path.splitext(file_path[: -len(extension)])
+            return root, ext + extension
+    return os.path.splitext(file_path)
+
+
+def open_file(
+    file_path: str,
+    mode: str = "r",
+    compression: Optional[str] = None,
+    compress_level: Optional[int] = None,
+    buffering: int = -1,
+):
+    """
+    Open file which can be compressed with gzip, bz2 or xz. When ``compression`` isn't given
+    it is detected by ``detect_compression``.
+
+    Args:
+        file_path: Path to file.
+        mode: Mode like in ``open``, without "t" file is opened in text mode.
+        compression: Name of compression - key of ``COMPRESSION_MAGIC``.
+        compress_level: Level of compression, 1-9 for gzip and bz2, 0-9 for xz, by default
+        default level of compression.
+        buffering: Buffering like in ``open``, used only for not compressed files.
+
+    Returns:
+        Open file like object.
+    """
+    if compression is None:
+        compression = detect_compression(file_path, mode)
+
+    if compression is None:
+        return open(file_path, mode, buffering=buffering)
+
+    if compression not in COMPRESSION_MAGIC:
+        raise ValueError(f"Compression {compression} don't supported! Supported: {list(COMPRESSION_MAGIC)}")
+
+    if "b" not in mode and "t" not in mode:
+        mode += "t"
+
+    if compression == "gzip":
+        return gzip.open(file_path, mode, compresslevel=9 if compress_level is None else compress_level)
+    elif compression == "bz2":
+        return bz2.open(file_path, mode, compresslevel=9 if compress_level is None else compress_level)
+    return lzma.open(file_path, mode, preset=None if "r" in mode else compress_level)
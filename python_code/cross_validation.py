@@ -0,0 +1,161 @@
+import argparse
+import sys
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from python_code.features import load_features, load_weights
+from python_code.naive_bayes import (
+    CLASSES_NUM,
+    DEFAULT_BATCH_SIZE,
+    CategoricalNaiveBayes,
+    count_classes,
+)
+
+# default number of cross validation folds - like ``cross_validation`` in R
+DEFAULT_FOLDS_NUM: int = 10
+
+
+def stratified_folds(labels: np.ndarray, folds_num: int = DEFAULT_FOLDS_NUM, seed: Optional[int] = None) -> np.ndarray:
+    """
+    Assign fragments to folds, so each fold has the same proportion of classes.
+
+    Args:
+        labels: Labels, 1 for true and 0 for false fragments.
+        folds_num: Number of folds.
+        seed: Seed of random generator.
+
+    Returns:
+        Array with number of fold for each fragment.
+    """
+    rng = np.random.RandomState(seed)
+    labels = np.asarray(labels)
+    folds = np.empty(len(labels), dtype=np.intp)
+    # start each class from random fold, so small classes don't fill always first folds
+    for label in np.unique(labels):
+        idx = rng.permutation(np.flatnonzero(labels == label))
+        folds[idx] = (np.arange(len(idx)) + rng.randint(folds_num)) % folds_num
+    return folds
+
+
+def stratified_split(labels: np.ndarray, train_prop: float = 0.5, seed: Optional[int] = None) -> np.ndarray:
+    """
+    Split fragments to train and test sets with the same proportion of classes - like
+    ``rsample::initial_split`` with ``strata``.
+
+    Args:
+        labels: Labels, 1 for true and 0 for false fragments.
+        train_prop: Proportion of fragments of each class in train set.
+        seed: Seed of random generator.
+
+    Returns:
+        Bool mask of train set.
+    """
+    rng = np.random.RandomState(seed)
+    labels = np.asarray(labels)
+    train = np.zeros(len(labels), dtype=bool)
+    for label in np.unique(labels):
+        idx = rng.permutation(np.flatnonzero(labels == label))
+        train[idx[: int(round(train_prop * len(idx)))]] = True
+    return train
+
+
+def cross_validate_naive_bayes(
+    features: np.ndarray,
+    labels: np.ndarray,
+    folds_num: int = DEFAULT_FOLDS_NUM,
+    laplace: float = 0.0,
+    seed: Optional[int] = None,
+    sample_weight: Optional[np.ndarray] = None,
+    folds: Optional[np.ndarray] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    model: Optional[CategoricalNaiveBayes] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Run k-fold cross validation of ``CategoricalNaiveBayes``. Counts of all folds are computed in one
+    pass, model of each fold is created by subtracting counts of fold from counts of all fragments,
+    so k-fold costs one counting pass and k scoring passes.
+
+    Args:
+        features: 2-D array of codes, each row is one fragment.
+        labels: Labels, 1 for true and 0 for false fragments.
+        folds_num: Number of folds.
+        laplace: Laplace smoothing value.
+        seed: Seed of random generator used to create folds.
+        sample_weight: Weights of fragments, by default 1 for each fragment.
+        folds: Number of fold for each fragment, by default created by ``stratified_folds``.
+        batch_size: Number of fragments counted and scored at once.
+        model: Not trained model validated instead of ``CategoricalNaiveBayes`` with ``laplace``, example
+        ``markov_model.MarkovModel``.
+
+    Returns:
+        Out-of-fold probabilities of classes (fragments, classes) and folds.
+    """
+    if folds is None:
+        folds = stratified_folds(labels, folds_num, seed)
+    folds_num = int(folds.max()) + 1 if len(folds) else 0
+    if model is None:
+        model = CategoricalNaiveBayes(laplace=laplace)
+
+    # counts of fold f and class c are at f * CLASSES_NUM + c
+    groups = folds * CLASSES_NUM + np.asarray(labels, dtype=np.intp)
+    fold_counts = model.count(features, groups, sample_weight, batch_size, folds_num * CLASSES_NUM).reshape(
+        folds_num, CLASSES_NUM, features.shape[1], -1
+    )
+    fold_class_counts = count_classes(groups, sample_weight, folds_num * CLASSES_NUM).reshape(folds_num, CLASSES_NUM)
+    all_counts = fold_counts.sum(axis=0)
+    all_class_counts = fold_class_counts.sum(axis=0)
+
+    proba = np.empty((len(labels), CLASSES_NUM))
+    for fold in range(folds_num):
+        model.counts_ = all_counts - fold_counts[fold]
+        model.class_counts_ = all_class_counts - fold_class_counts[fold]
+        model.update()
+
+        idx = np.flatnonzero(folds == fold)
+        proba[idx] = model.predict_proba(features[idx], batch_size)
+
+    return proba, folds
+
+
+def cross_validation_command(command_args: List[str]) -> None:
+    """
+    Create parser, parse args given in ``command_args`` and run cross validation of naive bayes on features
+    saved by ``get_acceptors_and_donors`` with ``--features numbers``. Out-of-fold probability of true class
+    is saved as ``.npy`` file. Features saved with ``--dedup`` are weighted by counts of fragments, all copies
+    of fragment are in the same fold.
+
+    Args:
+        command_args: Arguments for command.
+    """
+    # create parser
+    parser = argparse.ArgumentParser()
+
+    # input
+    parser.add_argument(
+        "-i", "--input", required=True, help="result file of get_acceptors_and_donors saved with --features numbers"
+    )
+
+    # output
+    parser.add_argument("-r", "--result", required=True, help="output .npy file with probabilities", type=str)
+
+    # folds
+    parser.add_argument("-k", "--folds", default=DEFAULT_FOLDS_NUM, help="number of folds", type=int)
+
+    # laplace
+    parser.add_argument("-l", "--laplace", default=0.0, help="laplace smoothing value", type=float)
+
+    # seed
+    parser.add_argument("-s", "--seed", default=None, help="seed of random generator", type=int)
+
+    # parse arguments
+    args = parser.parse_args(command_args)
+
+    features, labels = load_features(args.input)
+    weights = load_weights(args.input)
+    proba, _ = cross_validate_naive_bayes(features, labels, args.folds, args.laplace, args.seed, weights)
+    np.save(args.result, proba[:, 1])
+
+
+if __name__ == "__main__":
+    cross_validation_command(sys.argv[1:])
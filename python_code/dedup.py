@@ -0,0 +1,66 @@
+from typing import Tuple
+
+import numpy as np
+
+from python_code.binary_fragments import EXCEPTION_TABLE, PACK_TABLE
+
+# fragments up to this length with only A, C, G, T are packed to one uint64 key
+MAX_PACKED_KEY_LEN: int = 32
+
+
+def get_fragments_keys(fragments: np.ndarray) -> np.ndarray:
+    """
+    Create key of each fragment, fragments have the same key only when they are identical. Fragments
+    which have only A, C, G, T and are not longer than ``MAX_PACKED_KEY_LEN`` are packed on 2 bits
+    per nucleotide to uint64, other fragments are compared as raw bytes.
+
+    Args:
+        fragments: 2-D uint8 array of ASCII codes.
+
+    Returns:
+        1-D array of keys.
+    """
+    fragments = np.ascontiguousarray(fragments, dtype=np.uint8)
+    if fragments.shape[1] <= MAX_PACKED_KEY_LEN and not EXCEPTION_TABLE[fragments].any():
+        keys = np.zeros(len(fragments), dtype=np.uint64)
+        for column in PACK_TABLE[fragments].T:
+            keys = (keys << np.uint64(2)) | column
+        return keys
+    return fragments.view(np.dtype((np.void, fragments.shape[1]))).ravel()
+
+
+def deduplicate_fragments(fragments: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Collapse identical fragments to one fragment with count of its copies.
+
+    Args:
+        fragments: 2-D uint8 array of ASCII codes.
+
+    Returns:
+        Unique fragments in order of their first copy and number of copies of each of them.
+    """
+    if len(fragments) == 0:
+        return fragments, np.zeros(0, dtype=np.int64)
+
+    _, first, counts = np.unique(get_fragments_keys(fragments), return_index=True, return_counts=True)
+    order = np.argsort(first)
+    return fragments[first[order]], counts[order].astype(np.int64)
+
+
+def deduplicate_labeled_fragments(
+    true_fragments: np.ndarray, false_fragments: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Collapse identical (label, fragment) pairs, fragment found as true and as false is kept in both groups.
+
+    Args:
+        true_fragments: 2-D uint8 array of true donors/acceptors.
+        false_fragments: 2-D uint8 array of false donors/acceptors.
+
+    Returns:
+        Unique true fragments, unique false fragments and their counts, counts of true fragments first -
+        like order of ``save_fragments_binary`` and ``fragments_to_features``.
+    """
+    true_fragments, true_counts = deduplicate_fragments(true_fragments)
+    false_fragments, false_counts = deduplicate_fragments(false_fragments)
+    return true_fragments, false_fragments, np.concatenate([true_counts, false_counts])
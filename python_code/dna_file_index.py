@@ -0,0 +1,243 @@
+import json
+import mmap
+import os
+from typing import Dict, Iterator, List, Optional
+
+# suffix of index file created next to input data file
+DEFAULT_INDEX_SUFFIX: str = ".idx"
+
+# sections of sequence saved in index
+INDEXED_SECTIONS: List[str] = ["Introns", "Exons", "Data"]
+INDEXED_SECTIONS_BYTES: List[bytes] = [x.encode() for x in INDEXED_SECTIONS]
+
+
+def get_index_path(input_path: str) -> str:
+    """
+    Get path of index file for given ``input_path``.
+
+    Args:
+        input_path: Path to file with sequences.
+
+    Returns:
+        Path to index file.
+    """
+    return input_path + DEFAULT_INDEX_SUFFIX
+
+
+def get_sequence_id(header_line: str, sequence_number: int) -> str:
+    """
+    Get ID of sequence from its header line like ``>Seq 21 Len:``, when header
+    don't have ID use number of sequence in file.
+
+    Args:
+        header_line: Header line of sequence.
+        sequence_number: Number of sequence in file.
+
+    Returns:
+        ID of sequence.
+    """
+    header_split = header_line.lstrip(">").split()
+    if len(header_split) > 1:
+        return header_split[1]
+    return str(sequence_number)
+
+
+def create_dna_file_index(input_path: str) -> Dict:
+    """
+    Scan ``input_path`` once and create index with byte offsets of ``Introns``, ``Exons`` and
+    ``Data`` sections for every sequence. Each offset pair points to line which follows
+    section name, without new line sign.
+
+    Args:
+        input_path: Path to file with sequences.
+
+    Returns:
+        Index as dictionary with following structure:
+        {"size", "mtime", "sequences": [{"Id", "Introns", "Exons", "Data"}]}.
+    """
+    stat = os.stat(input_path)
+    index = {"size": stat.st_size, "mtime": stat.st_mtime, "sequences": []}
+
+    if stat.st_size == 0:
+        return index
+
+    with open(input_path, "rb") as dna_file, mmap.mmap(dna_file.fileno(), 0, access=mmap.ACCESS_READ) as dna_map:
+        header_line = ""
+        dna_sequence = {}
+        line_begin = 0
+        while line_begin < stat.st_size:
+            line_end = dna_map.find(b"\n", line_begin)
+            if line_end == -1:
+                line_end = stat.st_size
+            line = dna_map[line_begin:line_end]
+
+            if line.startswith(b">"):
+                header_line = line.decode()
+            elif line in INDEXED_SECTIONS_BYTES:
+                # offsets of next line
+                value_begin = line_end + 1
+                value_end = dna_map.find(b"\n", value_begin)
+                if value_end == -1:
+                    value_end = stat.st_size
+                dna_sequence[line.decode()] = [value_begin, value_end]
+
+                # data section ends sequence
+                if line == b"Data":
+                    dna_sequence["Id"] = get_sequence_id(header_line, len(index["sequences"]))
+                    index["sequences"].append(dna_sequence)
+                    dna_sequence = {}
+                line_end = value_end
+
+            line_begin = line_end + 1
+
+    return index
+
+
+def save_dna_file_index(index: Dict, index_path: str) -> None:
+    """
+    Save ``index`` to ``index_path`` as JSON.
+
+    Args:
+        index: Index created by ``create_dna_file_index``.
+        index_path: Path to index file.
+    """
+    tmp_path = index_path + ".tmp"
+    with open(tmp_path, "w") as index_file:
+        json.dump(index, index_file)
+    os.replace(tmp_path, index_path)
+
+
+def is_dna_file_index_valid(index: Dict, input_path: str) -> bool:
+    """
+    Check if ``index`` was created for current version of ``input_path`` - compare size
+    and modification time of file.
+
+    Args:
+        index: Index created by ``create_dna_file_index``.
+        input_path: Path to file with sequences.
+
+    Returns:
+        True if index is valid, false instead.
+    """
+    stat = os.stat(input_path)
+    return index.get("size") == stat.st_size and index.get("mtime") == stat.st_mtime
+
+
+def get_dna_file_index(input_path: str, index_path: Optional[str] = None) -> Dict:
+    """
+    Load index of ``input_path`` from ``index_path``, when index doesn't exist or is out
+    of date create it and save it.
+
+    Args:
+        input_path: Path to file with sequences.
+        index_path: Path to index file, by default ``input_path`` with ``DEFAULT_INDEX_SUFFIX``.
+
+    Returns:
+        Index as dictionary - look ``create_dna_file_index``.
+    """
+    if index_path is None:
+        index_path = get_index_path(input_path)
+
+    if os.path.isfile(index_path):
+        with open(index_path) as index_file:
+            try:
+                index = json.load(index_file)
+            except ValueError:
+                index = {}
+        if is_dna_file_index_valid(index, input_path):
+            return index
+
+    index = create_dna_file_index(input_path)
+    save_dna_file_index(index, index_path)
+    return index
+
+
+class IndexedDnaFile:
+    """
+    File with sequences mapped to memory, sections of sequences are read using offsets
+    from index - look ``get_dna_file_index``. Use as context manager.
+    """
+
+    def __init__(self, input_path: str, index_path: Optional[str] = None):
+        """
+        Args:
+            input_path: Path to file with sequences.
+            index_path: Path to index file, by default ``input_path`` with ``DEFAULT_INDEX_SUFFIX``.
+        """
+        self.index = get_dna_file_index(input_path, index_path)
+        self.positions = {x["Id"]: id for id, x in enumerate(self.index["sequences"])}
+        self._file = open(input_path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.index["size"] else b""
+
+    def __enter__(self) -> "IndexedDnaFile":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close mapping and file.
+        """
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def ids(self) -> List[str]:
+        """
+        Returns:
+            IDs of sequences in file order.
+        """
+        return [x["Id"] for x in self.index["sequences"]]
+
+    def get_position(self, sequence_id: str) -> int:
+        """
+        Get position of sequence in index, for repeated IDs last sequence is used.
+
+        Args:
+            sequence_id: ID of sequence.
+
+        Returns:
+            Position of sequence in index.
+        """
+        if sequence_id not in self.positions:
+            raise KeyError(f"Sequence {sequence_id} not found in index!")
+        return self.positions[sequence_id]
+
+    def section_view(self, sequence_id: str, section: str) -> memoryview:
+        """
+        Get section of sequence as zero-copy slice of mapped file. View has to be released
+        before file is closed.
+
+        Args:
+            sequence_id: ID of sequence.
+            section: One of ``INDEXED_SECTIONS``.
+
+        Returns:
+            View of section line.
+        """
+        begin, end = self.index["sequences"][self.get_position(sequence_id)][section]
+        return memoryview(self._map)[begin:end]
+
+    def iter_sections(self, ids: Optional[List[str]] = None) -> Iterator[Dict[str, bytes]]:
+        """
+        Get sections of sequences given by ``ids`` without scanning file. Sections are copied from
+        mapping, so file can be closed also when iteration is stopped early.
+
+        Args:
+            ids: IDs of sequences, by default all sequences in file order.
+
+        Returns:
+            Iterator of dictionaries with sections: {"Id", "Introns", "Exons", "Data"}.
+        """
+        if ids is None:
+            sequences = self.index["sequences"]
+        else:
+            sequences = [self.index["sequences"][self.get_position(x)] for x in ids]
+
+        for sequence in sequences:
+            sections = {"Id": sequence["Id"]}
+            for section in INDEXED_SECTIONS:
+                begin, end = sequence[section]
+                sections[section] = self._map[begin:end]
+            yield sections
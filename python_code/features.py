@@ -0,0 +1,155 @@
+import os
+from typing import Optional, Tuple
+
+import numpy as np
+
+from python_code.compression import split_extension
+
+# types of features: nucleotide codes or one-hot-encoding
+NUMBERS_FEATURES: str = "numbers"
+ONE_HOT_FEATURES: str = "one_hot"
+
+# number of codes of nucleotides: N, A, C, G, T
+NUCLEOTIDE_CODES_NUM: int = 5
+
+# ASCII code -> code of nucleotide A=1, C=2, G=3, T=4, N and other signs 0 - like ``nucleotide_to_number``
+NUMBER_TABLE: np.ndarray = np.zeros(256, dtype=np.uint8)
+for code, nucleotide in enumerate(b"ACGT", start=1):
+    NUMBER_TABLE[nucleotide] = code
+
+# code of nucleotide -> one-hot-encoding, N is [1, 1, 1, 1] - like ``nucleotide_to_table``
+ONE_HOT_TABLE: np.ndarray = np.array(
+    [[1, 1, 1, 1], [1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]], dtype=np.uint8
+)
+
+
+def fragments_to_numbers(fragments: np.ndarray) -> np.ndarray:
+    """
+    Convert fragments to codes of nucleotides with one table lookup.
+
+    Args:
+        fragments: 2-D uint8 array of ASCII codes.
+
+    Returns:
+        2-D uint8 array of codes, A=1, C=2, G=3, T=4, N=0.
+    """
+    return NUMBER_TABLE[fragments]
+
+
+def numbers_to_one_hot(numbers: np.ndarray) -> np.ndarray:
+    """
+    Convert codes of nucleotides to one-hot-encoding, each nucleotide gives 4 columns A, C, G, T.
+
+    Args:
+        numbers: 2-D uint8 array of codes - look ``fragments_to_numbers``.
+
+    Returns:
+        2-D uint8 array with 4 columns per nucleotide.
+    """
+    return ONE_HOT_TABLE[numbers].reshape(len(numbers), 4 * numbers.shape[1])
+
+
+def fragments_to_features(
+    true_fragments: np.ndarray, false_fragments: np.ndarray, features_type: str = NUMBERS_FEATURES
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Create features matrix and labels vector from fragments.
+
+    Args:
+        true_fragments: 2-D uint8 array of true donors/acceptors.
+        false_fragments: 2-D uint8 array of false donors/acceptors.
+        features_type: ``NUMBERS_FEATURES`` or ``ONE_HOT_FEATURES``.
+
+    Returns:
+        Features matrix and labels vector, 1 for true and 0 for false fragments.
+    """
+    features = fragments_to_numbers(np.concatenate([true_fragments, false_fragments]))
+    if features_type == ONE_HOT_FEATURES:
+        features = numbers_to_one_hot(features)
+    labels = np.concatenate(
+        [np.ones(len(true_fragments), dtype=np.uint8), np.zeros(len(false_fragments), dtype=np.uint8)]
+    )
+    return features, labels
+
+
+def get_features_paths(output: str) -> Tuple[str, str]:
+    """
+    Get paths of features and labels files for given result file, example:
+    ``result.dat`` -> ``result_features.npy``, ``result_labels.npy``, also for ``result.dat.gz``.
+
+    Args:
+        output: Result file name.
+
+    Returns:
+        Paths of features and labels files.
+    """
+    root = split_extension(output)[0]
+    return f"{root}_features.npy", f"{root}_labels.npy"
+
+
+def get_weights_path(output: str) -> str:
+    """
+    Get path of weights file for given result file, example: ``result.dat`` -> ``result_weights.npy``.
+
+    Args:
+        output: Result file name.
+
+    Returns:
+        Path of weights file.
+    """
+    return f"{split_extension(output)[0]}_weights.npy"
+
+
+def save_features(features: np.ndarray, labels: np.ndarray, output: str, weights: Optional[np.ndarray] = None) -> None:
+    """
+    Save features matrix and labels vector as ``.npy`` files, they can be loaded
+    with ``np.load(path, mmap_mode="r")``. Weights file left by previous run is removed
+    when weights aren't given.
+
+    Args:
+        features: Features matrix.
+        labels: Labels vector.
+        output: Result file name - look ``get_features_paths``.
+        weights: Counts of deduplicated fragments, by default each fragment has weight 1.
+    """
+    features_path, labels_path = get_features_paths(output)
+    np.save(features_path, features)
+    np.save(labels_path, labels)
+
+    weights_path = get_weights_path(output)
+    if weights is not None:
+        np.save(weights_path, weights)
+    elif os.path.isfile(weights_path):
+        os.remove(weights_path)
+
+
+def load_features(output: str, use_mmap: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Load features matrix and labels vector saved by ``save_features``.
+
+    Args:
+        output: Result file name - look ``get_features_paths``.
+        use_mmap: If true map files to memory.
+
+    Returns:
+        Features matrix and labels vector.
+    """
+    features_path, labels_path = get_features_paths(output)
+    mmap_mode = "r" if use_mmap else None
+    return np.load(features_path, mmap_mode=mmap_mode), np.load(labels_path, mmap_mode=mmap_mode)
+
+
+def load_weights(output: str) -> Optional[np.ndarray]:
+    """
+    Load weights saved by ``save_features``.
+
+    Args:
+        output: Result file name - look ``get_weights_path``.
+
+    Returns:
+        Weights vector, None when features were saved without weights.
+    """
+    weights_path = get_weights_path(output)
+    if not os.path.isfile(weights_path):
+        return None
+    return np.load(weights_path)
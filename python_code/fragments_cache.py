@@ -0,0 +1,231 @@
+import hashlib
+import os
+import tempfile
+from functools import lru_cache
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+from python_code.binary_fragments import fragments_list_to_array, load_fragments_binary, save_fragments_binary
+from python_code.get_acceptors_and_donors import DEFAULT_CACHE_SIZE_MB
+
+# extension of cache entries - files created by ``save_fragments_binary``
+CACHE_ENTRY_SUFFIX: str = ".dnaf"
+
+# size of blocks read while hashing files
+HASH_BLOCK_SIZE: int = 1024 * 1024
+
+# modules whose code decides which fragments are generated, change of them invalidates cache
+CODE_VERSION_MODULES: List[str] = [
+    "get_acceptors_and_donors.py",
+    "numpy_fragments.py",
+    "binary_fragments.py",
+    "sampling.py",
+    "motif_index.py",
+]
+
+
+def get_file_digest(file_path: str) -> str:
+    """
+    Compute sha256 of file content.
+
+    Args:
+        file_path: Path to file.
+
+    Returns:
+        Hex digest.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def get_code_version() -> str:
+    """
+    Get version of code which generates fragments - sha256 of ``CODE_VERSION_MODULES`` sources.
+
+    Returns:
+        Hex digest.
+    """
+    digest = hashlib.sha256()
+    for module in CODE_VERSION_MODULES:
+        with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), module), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def get_cache_key(
+    input_digest: str,
+    a_len: int,
+    b_len: int,
+    fragment_type: str,
+    overlap_fragments: bool,
+    engine: str,
+    ids: Optional[List[str]] = None,
+    sampling: Optional[str] = None,
+) -> str:
+    """
+    Create key of cache entry from everything which decides content of result.
+
+    Args:
+        input_digest: Digest of input file content - look ``get_file_digest``.
+        a_len: Left length of donor/acceptor.
+        b_len: Right length of donor/acceptor.
+        fragment_type: Name of ``DnaFragmentType``.
+        overlap_fragments: If fragments are generated with overlap.
+        engine: Engine used to get fragments.
+        ids: IDs of read sequences, by default all sequences.
+        sampling: Parameters of sampler of false fragments - look ``FalseFragmentsSampler.get_key``,
+        by default all false fragments are kept.
+
+    Returns:
+        Hex digest used as name of cache entry.
+    """
+    ids_part = "*" if ids is None else ",".join(ids)
+    key = [input_digest, a_len, b_len, fragment_type, int(overlap_fragments), engine, ids_part, get_code_version()]
+    if sampling is not None:
+        key.append(sampling)
+    return hashlib.sha256("|".join(str(x) for x in key).encode()).hexdigest()
+
+
+class FragmentsCache:
+    """
+    Directory with fragments saved by ``save_fragments_binary``, named by cache keys - look ``get_cache_key``.
+    Entries are written to temporary files and moved with ``os.replace``, so parallel runs see only whole
+    entries. Modification time of entry is its last use, when size of directory is above limit least
+    recently used entries are removed.
+    """
+
+    def __init__(self, cache_dir: str, size_limit: int = DEFAULT_CACHE_SIZE_MB * 1024 * 1024):
+        """
+        Args:
+            cache_dir: Cache directory, created when doesn't exist.
+            size_limit: Maximal size of all entries in bytes.
+        """
+        self.cache_dir = cache_dir
+        self.size_limit = size_limit
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def get_path(self, key: str) -> str:
+        """
+        Args:
+            key: Cache key.
+
+        Returns:
+            Path of cache entry.
+        """
+        return os.path.join(self.cache_dir, key + CACHE_ENTRY_SUFFIX)
+
+    def load(self, key: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Load fragments of entry and mark it as recently used.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            2-D uint8 arrays of true and false fragments, None when entry doesn't exist.
+        """
+        path = self.get_path(key)
+        try:
+            data = load_fragments_binary(path, use_mmap=False)
+            os.utime(path)
+        except (FileNotFoundError, ValueError):
+            # entry removed by other run or not whole
+            return None
+
+        labels = data["labels"].astype(bool)
+        return data["fragments"][labels], data["fragments"][~labels]
+
+    def load_many(self, keys: Dict[Hashable, str]) -> Optional[Dict[Hashable, Tuple[np.ndarray, np.ndarray]]]:
+        """
+        Load fragments of many entries, result is returned only when all entries exist.
+
+        Args:
+            keys: Dictionary name -> cache key.
+
+        Returns:
+            Dictionary name -> (true fragments, false fragments) or None.
+        """
+        result = {}
+        for name, key in keys.items():
+            fragments = self.load(key)
+            if fragments is None:
+                return None
+            result[name] = fragments
+        return result
+
+    def store(
+        self,
+        key: str,
+        true_fragments,
+        false_fragments,
+        a_len: int,
+        b_len: int,
+        fragment_type: int,
+        overlap_fragments: bool,
+    ) -> bool:
+        """
+        Save fragments as entry and remove least recently used entries above size limit. Fragments
+        with other length than A + B can't be saved in binary file, so they aren't cached.
+
+        Args:
+            key: Cache key.
+            true_fragments: List or 2-D array of true donors/acceptors.
+            false_fragments: List or 2-D array of false donors/acceptors.
+            a_len: Left length of donor/acceptor.
+            b_len: Right length of donor/acceptor.
+            fragment_type: Value of ``DnaFragmentType``.
+            overlap_fragments: If fragments were generated with overlap.
+
+        Returns:
+            True if entry was saved.
+        """
+        try:
+            if isinstance(true_fragments, list):
+                true_fragments = fragments_list_to_array(true_fragments, a_len + b_len)
+                false_fragments = fragments_list_to_array(false_fragments, a_len + b_len)
+        except ValueError:
+            return False
+
+        tmp_fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        os.close(tmp_fd)
+        try:
+            save_fragments_binary(
+                true_fragments, false_fragments, tmp_path, a_len, b_len, fragment_type, overlap_fragments
+            )
+            os.replace(tmp_path, self.get_path(key))
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+        self.evict()
+        return True
+
+    def evict(self) -> None:
+        """
+        Remove least recently used entries until size of cache is not greater than size limit.
+        """
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(CACHE_ENTRY_SUFFIX):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        cache_size = sum(x[1] for x in entries)
+        for _, size, path in sorted(entries):
+            if cache_size <= self.size_limit:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            cache_size -= size
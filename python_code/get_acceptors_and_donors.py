@@ -1,14 +1,33 @@
 import argparse
+import bisect
+import itertools
 import os
 import re
+import shutil
 import sys
-from typing import List, Tuple
+import tempfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Tuple
 from enum import Enum
 
+from python_code.compression import COMPRESSION_MAGIC, detect_compression, open_file, split_extension
+from python_code.dna_file_index import IndexedDnaFile
+from python_code.profiler import StageProfiler, profile_stage
+from python_code.sampling import FalseFragmentsSampler
+
 # sequence corresponding to donor
 DONOR_SEQ: str = "GT"
 # sequence corresponding to acceptor
 ACCEPTOR_SEQ: str = "AG"
+# pattern which finds donor and acceptor sequences in one scan, also when they overlap
+DONOR_OR_ACCEPTOR_PATTERN = re.compile(f"(?=({re.escape(DONOR_SEQ)}|{re.escape(ACCEPTOR_SEQ)}))")
+# keys of sequence dictionary with positions of donor and acceptor sequences read from motif index
+MOTIF_POSITIONS_KEYS: Dict[str, str] = {DONOR_SEQ: "Donors", ACCEPTOR_SEQ: "Acceptors"}
+
+# type of command which generate donors and acceptors at once
+BOTH_TYPES: str = "BOTH"
 
 # default donors result file
 DEFAULT_RESULT_OUTPUT_FILENAME: str = "result.dat"
@@ -20,6 +39,23 @@ DEFAULT_A_LEN: int = 10
 # default right value of length
 DEFAULT_B_LEN: int = 10
 
+# default number of sequences send to worker process at once
+DEFAULT_CHUNK_SIZE: int = 64
+
+# engines which can be used to get fragments: reference python functions or numpy arrays
+PYTHON_ENGINE: str = "python"
+NUMPY_ENGINE: str = "numpy"
+
+# default size of buffer used by ``save_fragments_stream``
+DEFAULT_WRITE_BUFFER_SIZE: int = 1024 * 1024
+
+# default size limit of fragments cache directory in megabytes - look ``fragments_cache``
+DEFAULT_CACHE_SIZE_MB: int = 1024
+
+# formats of result file: label and fragment lines or binary file - look ``binary_fragments``
+TEXT_FORMAT: str = "text"
+BINARY_FORMAT: str = "binary"
+
 
 class DnaFragmentType(Enum):
     DONOR = 1
@@ -54,10 +90,64 @@ def parser_check_if_given_type_is_correct(parser: argparse.ArgumentParser, seq_t
     Returns:
         Original ``seq_type`` when file exists.
     """
-    if seq_type in [f'{dft.name}' for dft in DnaFragmentType]:
+    if seq_type in get_supported_types():
         return seq_type
     else:
-        parser.error(f"Value {seq_type} don't supported! Supported types: {[f'{dft.name}' for dft in DnaFragmentType]}")
+        parser.error(f"Value {seq_type} don't supported! Supported types: {get_supported_types()}")
+
+
+def get_supported_types() -> List[str]:
+    """
+    Get types supported by command - names of ``DnaFragmentType`` and ``BOTH_TYPES``.
+
+    Returns:
+        List of supported types.
+    """
+    return [f'{dft.name}' for dft in DnaFragmentType] + [BOTH_TYPES]
+
+
+def parser_check_if_window_is_correct(parser: argparse.ArgumentParser, window: str) -> List[Tuple[int, int]]:
+    """
+    Check if window is given as ``A:B`` - if not call parser.error, else return list of windows.
+    ``A`` and ``B`` can be lists split by comma, then all pairs of them are returned,
+    example: ``5,10:20`` -> ``[(5, 20), (10, 20)]``.
+
+    Args:
+        parser: Command parser.
+        window: Window or grid of windows as ``A:B``.
+
+    Returns:
+        List of windows as (A, B) tuples.
+    """
+    try:
+        a_values, b_values = window.split(":")
+        return [(int(a), int(b)) for a in a_values.split(",") for b in b_values.split(",")]
+    except ValueError:
+        parser.error(f"Value {window} is not correct window! Expected format: A:B, example: 10,20:10,20")
+
+
+def get_result_file_name(
+    result: str, fragment_type: Optional[DnaFragmentType] = None, window: Optional[Tuple[int, int]] = None
+) -> str:
+    """
+    Get name of result file for given ``fragment_type`` and ``window`` when command generate both types
+    or many windows, example: ``result.dat`` -> ``result_10_20_donor.dat``, ``result.dat.gz`` ->
+    ``result_10_20_donor.dat.gz``.
+
+    Args:
+        result: Result file name given to command.
+        fragment_type: Type of fragments saved in file, if given added to file name.
+        window: (A, B) lengths of fragments saved in file, if given added to file name.
+
+    Returns:
+        Result file name.
+    """
+    root, ext = split_extension(result)
+    if window is not None:
+        root = f"{root}_{window[0]}_{window[1]}"
+    if fragment_type is not None:
+        root = f"{root}_{fragment_type.name.lower()}"
+    return f"{root}{ext}"
 
 
 def get_acceptors_and_donors_command(command_args: List[str]) -> None:
@@ -74,10 +164,21 @@ def get_acceptors_and_donors_command(command_args: List[str]) -> None:
     parser = argparse.ArgumentParser()
 
     # A length argument
-    parser.add_argument("-A", "--a_len", help="'left' length of donor/acceptor", required=True, type=int)
+    parser.add_argument("-A", "--a_len", help="'left' length of donor/acceptor", type=int)
 
     # B length argument
-    parser.add_argument("-B", "--b_len", help="'right' length of donor/acceptor", required=True, type=int)
+    parser.add_argument("-B", "--b_len", help="'right' length of donor/acceptor", type=int)
+
+    # windows sweep
+    parser.add_argument(
+        "-s",
+        "--sweep",
+        nargs="+",
+        default=None,
+        help="windows A:B generated in one pass instead of -A, -B, A and B can be lists split by comma, "
+        "example: 10:10 20,30:20,30, result file name gets A_B suffix",
+        type=lambda x: parser_check_if_window_is_correct(parser, x),
+    )
 
     # overlap
     parser.add_argument(
@@ -102,7 +203,8 @@ def get_acceptors_and_donors_command(command_args: List[str]) -> None:
     parser.add_argument(
         "-t",
         "--type",
-        help=f"type of DNA fragment Supported types: {[f'{dft.name}' for dft in DnaFragmentType]}",
+        help=f"type of DNA fragment Supported types: {get_supported_types()}, "
+        f"for {BOTH_TYPES} result file name gets type suffix",
         required = True,
         type= lambda x: parser_check_if_given_type_is_correct(parser, x)
     )
@@ -117,22 +219,389 @@ def get_acceptors_and_donors_command(command_args: List[str]) -> None:
         required=True
     )
 
+    # use index
+    parser.add_argument(
+        "-x",
+        "--index",
+        action="store_true",
+        default=False,
+        help="if flag map input file to memory and read sequences using index file created next to input file",
+    )
+
+    # sequences IDs
+    parser.add_argument(
+        "--ids",
+        nargs="+",
+        default=None,
+        help="IDs of sequences to read, implies --index",
+    )
+
+    # use motif index
+    parser.add_argument(
+        "--motif_index",
+        action="store_true",
+        default=False,
+        help="if flag read positions of donor and acceptor sequences from motif index created next to input "
+        "file instead of scanning sequences",
+    )
+
+    # workers
+    parser.add_argument(
+        "-w",
+        "--workers",
+        help="number of processes used to get fragments, 1 - don't use processes",
+        default=1,
+        type=int,
+    )
+
+    # chunk size
+    parser.add_argument(
+        "--chunk_size",
+        help="number of sequences send to worker process at once",
+        default=DEFAULT_CHUNK_SIZE,
+        type=int,
+    )
+
+    # result format
+    parser.add_argument(
+        "-f",
+        "--format",
+        help=f"format of result file, {BINARY_FORMAT} - fragments packed on 2 bits per nucleotide",
+        choices=[TEXT_FORMAT, BINARY_FORMAT],
+        default=TEXT_FORMAT,
+    )
+
+    # features
+    parser.add_argument(
+        "--features",
+        help="save also features matrix and labels as <result>_features.npy and <result>_labels.npy, "
+        "numbers - codes A=1, C=2, G=3, T=4, N=0, one_hot - 4 columns per nucleotide",
+        choices=["numbers", "one_hot"],
+        default=None,
+    )
+
+    # compression
+    parser.add_argument(
+        "-c",
+        "--compression",
+        help="compression of result file, by default detected from result file extension, "
+        "compression of input file is detected automatically",
+        choices=list(COMPRESSION_MAGIC),
+        default=None,
+    )
+
+    # compression level
+    parser.add_argument(
+        "--compress_level",
+        help="level of result file compression, 1-9 for gzip and bz2, 0-9 for xz",
+        default=None,
+        type=int,
+    )
+
+    # engine
+    parser.add_argument(
+        "-e",
+        "--engine",
+        help=f"engine used to get fragments, {NUMPY_ENGINE} engine skips fragments which don't fit in sequence",
+        choices=[PYTHON_ENGINE, NUMPY_ENGINE],
+        default=PYTHON_ENGINE,
+    )
+
+    # cache directory
+    parser.add_argument(
+        "--cache_dir",
+        help="directory with cached fragments, when fragments for the same input content, A, B, type, overlap "
+        "and engine were generated before they are read from cache",
+        default=None,
+        type=str,
+    )
+
+    # cache size
+    parser.add_argument(
+        "--cache_size",
+        help="size limit of cache directory in MB, least recently used fragments are removed above it",
+        default=DEFAULT_CACHE_SIZE_MB,
+        type=int,
+    )
+
+    # deduplication
+    parser.add_argument(
+        "--dedup",
+        action="store_true",
+        default=False,
+        help=f"if flag save identical fragments with the same label once with count of their copies, needs --format "
+        f"{BINARY_FORMAT}, with --features counts are saved also as <result>_weights.npy",
+    )
+
+    # false fragments count
+    parser.add_argument(
+        "--false_count",
+        help="number of false fragments drawn uniformly from all false fragments of each type by reservoir "
+        "sampling, not drawn false fragments aren't stored",
+        default=None,
+        type=int,
+    )
+
+    # false fragments ratio
+    parser.add_argument(
+        "--false_ratio",
+        help="number of false fragments drawn per true fragment, each sequence gets quota for its true fragments, "
+        "not drawn false fragments aren't stored",
+        default=None,
+        type=float,
+    )
+
+    # sampling seed
+    parser.add_argument(
+        "--sampling_seed",
+        help="seed of random generator used by --false_count and --false_ratio",
+        default=None,
+        type=int,
+    )
+
+    # profile
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="-",
+        default=None,
+        help="save wall time and peak memory of stages and counters as JSON to given file, "
+        "without file print them to stderr",
+    )
+
     # parse arguments
     args = parser.parse_args(command_args)
 
-    # read sequences
-    with open(args.input) as dna_file:
-        dna_sequences = dna_data_read(dna_file)
-
-    # generate output
-    if args.type == DnaFragmentType.ACCEPTOR.name:
-        true_acceptor, false_acceptor = get_acceptors(args.a_len, args.b_len, dna_sequences, args.overlap)
-        save_sequences_to_file(true_acceptor, false_acceptor, args.result)
-    elif args.type == DnaFragmentType.DONOR.name:
-        true_donors, false_donors = get_donors(args.a_len, args.b_len, dna_sequences, args.overlap)
-        save_sequences_to_file(true_donors, false_donors, args.result)
+    if args.workers < 1 or args.chunk_size < 1:
+        parser.error("Arguments --workers and --chunk_size have to be positive!")
+
+    if args.sweep is not None and args.workers > 1:
+        parser.error("Argument --workers is not supported with --sweep!")
+
+    if args.engine == NUMPY_ENGINE and (args.sweep is not None or args.workers > 1 or args.type == BOTH_TYPES):
+        parser.error(f"Engine {NUMPY_ENGINE} is not supported with --sweep, --workers or type {BOTH_TYPES}!")
+
+    if args.sweep is None and (args.a_len is None or args.b_len is None):
+        parser.error("Arguments -A and -B are required when --sweep is not given!")
+
+    if (args.index or args.ids is not None) and detect_compression(args.input) is not None:
+        parser.error("Compressed input file can't be used with --index or --ids!")
+
+    if args.false_count is not None and args.false_ratio is not None:
+        parser.error("Arguments --false_count and --false_ratio can't be used together!")
+
+    if any(x is not None and x < 0 for x in [args.false_count, args.false_ratio]):
+        parser.error("Arguments --false_count and --false_ratio can't be negative!")
+
+    if args.dedup and args.format != BINARY_FORMAT:
+        parser.error(f"Argument --dedup needs --format {BINARY_FORMAT}!")
+
+    sampling = args.false_count is not None or args.false_ratio is not None
+    if sampling and (args.sweep is not None or args.workers > 1):
+        parser.error("Arguments --false_count and --false_ratio are not supported with --sweep or --workers!")
+
+    # types of fragments and windows to generate
+    if args.type == BOTH_TYPES:
+        fragment_types = [DnaFragmentType.DONOR, DnaFragmentType.ACCEPTOR]
+    else:
+        fragment_types = [DnaFragmentType[args.type]]
+    if args.sweep is not None:
+        windows = list(dict.fromkeys(x for windows in args.sweep for x in windows))
     else:
-        raise Exception("Wrong type given!")
+        windows = [(args.a_len, args.b_len)]
+
+    profiler = StageProfiler() if args.profile is not None else None
+
+    # false fragments of each type are drawn by its own sampler
+    samplers = None
+    if sampling:
+        samplers = {
+            x: FalseFragmentsSampler(args.false_count, args.false_ratio, args.sampling_seed) for x in fragment_types
+        }
+
+    # fragments are generated only when some of them aren't in cache
+    fragments = None
+    if args.cache_dir is not None:
+        from python_code.fragments_cache import FragmentsCache, get_cache_key, get_file_digest
+
+        cache = FragmentsCache(args.cache_dir, args.cache_size * 1024 * 1024)
+        input_digest = get_file_digest(args.input)
+        cache_keys = {
+            (x, window): get_cache_key(
+                input_digest,
+                window[0],
+                window[1],
+                x.name,
+                args.overlap,
+                args.engine,
+                args.ids,
+                samplers[x].get_key() if samplers is not None else None,
+            )
+            for x in fragment_types
+            for window in windows
+        }
+        with profile_stage(profiler, "cache"):
+            fragments = cache.load_many(cache_keys)
+
+    if fragments is None:
+        fragments = get_fragments_of_command(args, fragment_types, windows, profiler, samplers)
+        if args.cache_dir is not None:
+            for (fragment_type, window), (true_seq, false_seq) in fragments.items():
+                with profile_stage(profiler, "cache"):
+                    cache.store(
+                        cache_keys[(fragment_type, window)],
+                        true_seq,
+                        false_seq,
+                        window[0],
+                        window[1],
+                        fragment_type.value,
+                        args.overlap,
+                    )
+
+    # save results, type and window are added to file name only when command generate many files
+    for (fragment_type, window), (true_seq, false_seq) in fragments.items():
+        output = get_result_file_name(
+            args.result,
+            fragment_type if args.type == BOTH_TYPES else None,
+            window if args.sweep is not None else None,
+        )
+        weights = None
+        if args.dedup:
+            with profile_stage(profiler, "dedup"):
+                true_seq, false_seq, weights = deduplicate_result(true_seq, false_seq, window)
+        with profile_stage(profiler, "write"):
+            save_result(
+                true_seq,
+                false_seq,
+                output,
+                args.format,
+                window,
+                fragment_type,
+                args.overlap,
+                args.compression,
+                args.compress_level,
+                args.features,
+                weights,
+            )
+        if profiler is not None:
+            profiler.count("fragments_written", sum(1 for x in itertools.chain(true_seq, false_seq) if len(x)))
+
+    if profiler is not None:
+        profiler.save(args.profile)
+
+
+def get_fragments_of_command(
+    args: argparse.Namespace,
+    fragment_types: List[DnaFragmentType],
+    windows: List[Tuple[int, int]],
+    profiler: Optional[StageProfiler] = None,
+    samplers: Optional[Dict[DnaFragmentType, FalseFragmentsSampler]] = None,
+) -> Dict[Tuple[DnaFragmentType, Tuple[int, int]], Tuple]:
+    """
+    Read input file given in parsed arguments of ``get_acceptors_and_donors_command`` and generate
+    fragments with engine chosen by arguments. When fragments can be written as soon as they are
+    found they are saved to result file and empty dictionary is returned.
+
+    Args:
+        args: Parsed arguments of command.
+        fragment_types: Types of generated fragments.
+        windows: Generated windows (A, B).
+        profiler: Profiler of stages, python engine without workers measures motif scan, collision filtering
+        and slicing separately - look ``get_fragments_profiled``, other engines measure only extraction.
+        samplers: Samplers of false fragments of each type, by default all false fragments are kept. They
+        aren't supported with ``--sweep`` and ``--workers``.
+
+    Returns:
+        Dictionary (fragment type, window) -> (true fragments, false fragments).
+    """
+    # read sequences one by one and generate output
+    if args.index or args.ids is not None:
+        dna_file = IndexedDnaFile(args.input)
+        dna_sequences = indexed_dna_data_iter(dna_file, args.ids)
+    else:
+        dna_file = open_file(args.input)
+        dna_sequences = dna_data_iter(dna_file)
+    if args.motif_index:
+        from python_code.motif_index import attach_motif_positions, get_motif_index
+
+        with profile_stage(profiler, "motif_index"):
+            motif_index = get_motif_index(args.input)
+        sequence_numbers = None if args.ids is None else [dna_file.get_position(x) for x in args.ids]
+        dna_sequences = attach_motif_positions(dna_sequences, motif_index, sequence_numbers)
+    if profiler is not None:
+        dna_sequences = profiler.iter_stage("parse", dna_sequences, "sequences_read")
+
+    sampler = samplers[fragment_types[0]] if samplers is not None else None
+
+    with dna_file, profile_stage(profiler, "extraction"):
+        if args.sweep is not None:
+            fragments = get_fragments_sweep(windows, dna_sequences, fragment_types, args.overlap)
+        elif args.engine == NUMPY_ENGINE:
+            from python_code.numpy_fragments import get_fragments_arrays
+
+            fragment = DONOR_SEQ if fragment_types[0] == DnaFragmentType.DONOR else ACCEPTOR_SEQ
+            fragments = {
+                (fragment_types[0], windows[0]): get_fragments_arrays(
+                    args.a_len, args.b_len, dna_sequences, fragment, args.overlap, sampler
+                )
+            }
+        elif (
+            args.format == TEXT_FORMAT
+            and args.workers == 1
+            and args.type != BOTH_TYPES
+            and args.features is None
+            and args.cache_dir is None
+        ):
+            # fragments are written as soon as they are found
+            fragments_iter = iter_fragments(
+                args.a_len, args.b_len, dna_sequences, fragment_types[0], args.overlap, profiler, sampler
+            )
+            if sampler is not None:
+                fragments_iter = itertools.chain(fragments_iter, sampler.iter_finish())
+            with profile_stage(profiler, "write"):
+                saved = save_fragments_stream(
+                    fragments_iter,
+                    args.result,
+                    compression=args.compression,
+                    compress_level=args.compress_level,
+                )
+            if profiler is not None:
+                profiler.count("fragments_written", sum(saved))
+            fragments = {}
+        elif args.workers > 1:
+            parallel_fragments = get_fragments_parallel(
+                args.a_len, args.b_len, dna_sequences, fragment_types, args.overlap, args.workers, args.chunk_size
+            )
+            fragments = {(x, windows[0]): parallel_fragments[x] for x in fragment_types}
+        elif profiler is not None:
+            profiled_fragments = get_fragments_profiled(
+                args.a_len, args.b_len, dna_sequences, fragment_types, args.overlap, profiler, samplers
+            )
+            fragments = {(x, windows[0]): profiled_fragments[x] for x in fragment_types}
+        elif args.type == DnaFragmentType.ACCEPTOR.name:
+            fragments = {
+                (DnaFragmentType.ACCEPTOR, windows[0]): get_acceptors(
+                    args.a_len, args.b_len, dna_sequences, args.overlap, sampler
+                )
+            }
+        elif args.type == DnaFragmentType.DONOR.name:
+            fragments = {
+                (DnaFragmentType.DONOR, windows[0]): get_donors(
+                    args.a_len, args.b_len, dna_sequences, args.overlap, sampler
+                )
+            }
+        elif args.type == BOTH_TYPES:
+            true_donors, false_donors, true_acceptors, false_acceptors = get_acceptors_and_donors(
+                args.a_len, args.b_len, dna_sequences, args.overlap, samplers
+            )
+            fragments = {
+                (DnaFragmentType.DONOR, windows[0]): (true_donors, false_donors),
+                (DnaFragmentType.ACCEPTOR, windows[0]): (true_acceptors, false_acceptors),
+            }
+        else:
+            raise Exception("Wrong type given!")
+
+    return fragments
 
 
 def dna_data_read(file) -> List:
@@ -146,13 +615,24 @@ def dna_data_read(file) -> List:
         List of dictionaries, each have following structure:
         {"Introns", "Exons", "Sequence"}.
     """
-    # read lines
-    dna_file_lines: List[str] = [line.rstrip("\n") for line in file]
+    return list(dna_data_iter(file))
+
+
+def dna_data_iter(file) -> Iterator[Dict]:
+    """
+    Streaming version of ``dna_data_read`` - read ``file`` line by line and yield every
+    sequence as soon as its ``Data`` section is read, so only one sequence is kept in memory.
+
+    Args:
+        file: Open file like object with sequences.
 
-    lines_iter = iter(dna_file_lines)
+    Returns:
+        Iterator of dictionaries, each have following structure:
+        {"Introns", "Exons", "Sequence"}.
+    """
+    lines_iter = (line.rstrip("\n") for line in file)
 
     # read data
-    dna_sequences = []
     dna_sequence = {}
     for line in lines_iter:
         # introns section
@@ -164,15 +644,38 @@ def dna_data_read(file) -> List:
         # data section
         elif line == "Data":
             dna_sequence["Sequence"] = next(lines_iter)
-            # save sequence
-            dna_sequences.append(dna_sequence)
+            # return sequence
+            yield dna_sequence
             dna_sequence = {}
 
-    return dna_sequences
+
+def indexed_dna_data_iter(dna_file: IndexedDnaFile, ids: Optional[List[str]] = None) -> Iterator[Dict]:
+    """
+    Version of ``dna_data_iter`` which read sequences from file mapped to memory, using
+    offsets from index instead of scanning file.
+
+    Args:
+        dna_file: Indexed file with sequences.
+        ids: IDs of sequences to read, by default all sequences.
+
+    Returns:
+        Iterator of dictionaries, each have following structure:
+        {"Introns", "Exons", "Sequence"}.
+    """
+    for sections in dna_file.iter_sections(ids):
+        yield {
+            "Introns": line_of_numbers_to_tuples(str(sections["Introns"], "ascii")),
+            "Exons": line_of_numbers_to_tuples(str(sections["Exons"], "ascii")),
+            "Sequence": str(sections["Data"], "ascii"),
+        }
 
 
 def get_acceptors(
-    a_len: int, b_len: int, dna_sequences: List, overlap_fragments: bool
+    a_len: int,
+    b_len: int,
+    dna_sequences: Iterable[Dict],
+    overlap_fragments: bool,
+    sampler: Optional[FalseFragmentsSampler] = None,
 ) -> Tuple[List, List]:
     """
     Get false and real acceptors from ``dna_sequences``.
@@ -180,9 +683,10 @@ def get_acceptors(
     Args:
         a_len: Left length of acceptor.
         b_len: Right length of acceptor.
-        dna_sequences: Sequences read from data file, each element of list is map which
-        contains "Introns", "Exons", "Data".
+        dna_sequences: Sequences read from data file, each element is map which
+        contains "Introns", "Exons", "Data" - list or iterator from ``dna_data_iter``.
         overlap_fragments: If true generate overlap fragments, if false don't generate overlap fragments.
+        sampler: Sampler of false acceptors, by default all false acceptors are returned.
 
     Returns:
         True acceptors, false acceptors lists.
@@ -198,16 +702,28 @@ def get_acceptors(
             get_true_fragments(introns_end_list, a_len, b_len, dna_sequence["Sequence"])
         )
         false_acceptors.extend(
-            get_false_fragments(
-                introns_end_list, a_len, b_len, dna_sequence["Sequence"], ACCEPTOR_SEQ, overlap_fragments
+            get_false_fragments_from_positions(
+                introns_end_list,
+                a_len,
+                b_len,
+                dna_sequence["Sequence"],
+                get_motif_positions(dna_sequence, ACCEPTOR_SEQ),
+                overlap_fragments,
+                sampler,
             )
         )
+    if sampler is not None:
+        false_acceptors.extend(sampler.finish())
 
     return true_acceptors, false_acceptors
 
 
 def get_donors(
-    a_len: int, b_len: int, dna_sequences: List, overlap_fragments: bool
+    a_len: int,
+    b_len: int,
+    dna_sequences: Iterable[Dict],
+    overlap_fragments: bool,
+    sampler: Optional[FalseFragmentsSampler] = None,
 ) -> Tuple[List, List]:
     """
     Get false and real donors from ``dna_sequences``.
@@ -215,9 +731,10 @@ def get_donors(
     Args:
         a_len: Left length of donor.
         b_len: Right length of donor.
-        dna_sequences: Sequences read from data file, each element of list is map which
-        contains "Introns", "Exons", "Data".
+        dna_sequences: Sequences read from data file, each element is map which
+        contains "Introns", "Exons", "Data" - list or iterator from ``dna_data_iter``.
         overlap_fragments: If true generate overlap fragments, if false don't generate overlap fragments.
+        sampler: Sampler of false donors, by default all false donors are returned.
 
     Returns:
         True donors, false donors lists.
@@ -233,18 +750,548 @@ def get_donors(
             )
         )
         false_donors.extend(
-            get_false_fragments(
-                introns_begin_list, a_len, b_len, dna_sequence["Sequence"], DONOR_SEQ, overlap_fragments
+            get_false_fragments_from_positions(
+                introns_begin_list,
+                a_len,
+                b_len,
+                dna_sequence["Sequence"],
+                get_motif_positions(dna_sequence, DONOR_SEQ),
+                overlap_fragments,
+                sampler,
             )
         )
+    if sampler is not None:
+        false_donors.extend(sampler.finish())
 
     return true_donors, false_donors
 
 
+def get_acceptors_and_donors(
+    a_len: int,
+    b_len: int,
+    dna_sequences: Iterable[Dict],
+    overlap_fragments: bool,
+    samplers: Optional[Dict[DnaFragmentType, FalseFragmentsSampler]] = None,
+) -> Tuple[List, List, List, List]:
+    """
+    Get false and real donors and acceptors from ``dna_sequences`` - each sequence is scanned
+    once for both ``DONOR_SEQ`` and ``ACCEPTOR_SEQ``.
+
+    Args:
+        a_len: Left length of donor/acceptor.
+        b_len: Right length of donor/acceptor.
+        dna_sequences: Sequences read from data file, each element is map which
+        contains "Introns", "Exons", "Data" - list or iterator from ``dna_data_iter``.
+        overlap_fragments: If true generate overlap fragments, if false don't generate overlap fragments.
+        samplers: Samplers of false donors and false acceptors, by default all false fragments are returned.
+
+    Returns:
+        True donors, false donors, true acceptors, false acceptors lists.
+    """
+    samplers = samplers or {}
+    donors_sampler = samplers.get(DnaFragmentType.DONOR)
+    acceptors_sampler = samplers.get(DnaFragmentType.ACCEPTOR)
+
+    true_donors: List = []
+    false_donors: List = []
+    true_acceptors: List = []
+    false_acceptors: List = []
+    for dna_sequence in dna_sequences:
+        introns_begin_list = [x[0] for x in dna_sequence["Introns"]]
+        # IMPORTANT -1!!!
+        introns_end_list = [x[1] - 1 for x in dna_sequence["Introns"]]
+        donors_positions, acceptors_positions = get_donors_and_acceptors_positions(dna_sequence)
+
+        true_donors.extend(
+            get_true_fragments(introns_begin_list, a_len, b_len, dna_sequence["Sequence"])
+        )
+        false_donors.extend(
+            get_false_fragments_from_positions(
+                introns_begin_list,
+                a_len,
+                b_len,
+                dna_sequence["Sequence"],
+                donors_positions,
+                overlap_fragments,
+                donors_sampler,
+            )
+        )
+        true_acceptors.extend(
+            get_true_fragments(introns_end_list, a_len, b_len, dna_sequence["Sequence"])
+        )
+        false_acceptors.extend(
+            get_false_fragments_from_positions(
+                introns_end_list,
+                a_len,
+                b_len,
+                dna_sequence["Sequence"],
+                acceptors_positions,
+                overlap_fragments,
+                acceptors_sampler,
+            )
+        )
+    if donors_sampler is not None:
+        false_donors.extend(donors_sampler.finish())
+    if acceptors_sampler is not None:
+        false_acceptors.extend(acceptors_sampler.finish())
+
+    return true_donors, false_donors, true_acceptors, false_acceptors
+
+
+def get_true_positions(dna_sequence: Dict, fragment_type: DnaFragmentType) -> List[int]:
+    """
+    Get true positions of donors/acceptors in ``dna_sequence`` from its introns.
+
+    Args:
+        dna_sequence: Sequence read from data file - map which contains "Introns", "Exons", "Data".
+        fragment_type: Type of fragments.
+
+    Returns:
+        List of true positions.
+    """
+    if fragment_type == DnaFragmentType.DONOR:
+        return [x[0] for x in dna_sequence["Introns"]]
+    # IMPORTANT -1!!!
+    return [x[1] - 1 for x in dna_sequence["Introns"]]
+
+
+def get_fragments_sweep(
+    windows: List[Tuple[int, int]],
+    dna_sequences: Iterable[Dict],
+    fragment_types: List[DnaFragmentType],
+    overlap_fragments: bool
+) -> Dict[Tuple[DnaFragmentType, Tuple[int, int]], Tuple[List, List]]:
+    """
+    Get false and real fragments from ``dna_sequences`` for many windows at once. Every sequence is read
+    and scanned once, then fragments for each window are cut around found positions. Edge and collision
+    rules are checked for each window, so results are the same as separate runs of ``get_donors``
+    and ``get_acceptors``.
+
+    Args:
+        windows: List of (A, B) - left and right lengths of donor/acceptor.
+        dna_sequences: Sequences read from data file, each element is map which
+        contains "Introns", "Exons", "Data" - list or iterator from ``dna_data_iter``.
+        fragment_types: Types of fragments to get.
+        overlap_fragments: If true generate overlap fragments, if false don't generate overlap fragments.
+
+    Returns:
+        Dictionary (fragment type, window) -> (true fragments list, false fragments list).
+    """
+    # window given many times gets fragments once
+    windows = list(dict.fromkeys(windows))
+    result = {(t, w): ([], []) for t in fragment_types for w in windows}
+
+    for dna_sequence in dna_sequences:
+        sequence_data = dna_sequence["Sequence"]
+
+        # scan sequence once
+        if len(fragment_types) > 1:
+            donors_positions, acceptors_positions = get_donors_and_acceptors_positions(dna_sequence)
+            possible_positions = {DnaFragmentType.DONOR: donors_positions, DnaFragmentType.ACCEPTOR: acceptors_positions}
+        else:
+            fragment = DONOR_SEQ if fragment_types[0] == DnaFragmentType.DONOR else ACCEPTOR_SEQ
+            possible_positions = {fragment_types[0]: get_motif_positions(dna_sequence, fragment)}
+
+        for fragment_type in fragment_types:
+            true_positions = get_true_positions(dna_sequence, fragment_type)
+            true_positions_index = create_true_positions_index(true_positions)
+
+            # collisions depend only on A + B, so they are shared by windows of the same size
+            collisions_cache = {}
+            for a_len, b_len in windows:
+                window_size = 0 if overlap_fragments else a_len + b_len
+                if window_size not in collisions_cache:
+                    collisions_cache[window_size] = have_collisions_with_true_fragments(
+                        true_positions_index, a_len, b_len, possible_positions[fragment_type], overlap_fragments
+                    )
+
+                true_seq, false_seq = result[(fragment_type, (a_len, b_len))]
+                true_seq.extend(get_true_fragments(true_positions, a_len, b_len, sequence_data))
+                for pos, collision in zip(possible_positions[fragment_type], collisions_cache[window_size]):
+                    if not collision and not is_fragment_outside_of_sequence(a_len, b_len, pos, len(sequence_data)):
+                        false_seq.append(sequence_data[pos - a_len : pos + b_len])
+
+    return result
+
+
+def get_fragments_of_sequences(
+    a_len: int,
+    b_len: int,
+    fragment_types: List[DnaFragmentType],
+    overlap_fragments: bool,
+    dna_sequences: List[Dict],
+) -> Dict[DnaFragmentType, Tuple[List, List]]:
+    """
+    Get false and real fragments of given types from ``dna_sequences`` - task run by
+    worker processes in ``get_fragments_parallel``.
+
+    Args:
+        a_len: Left length of donor/acceptor.
+        b_len: Right length of donor/acceptor.
+        fragment_types: Types of fragments to get.
+        overlap_fragments: If true generate overlap fragments, if false don't generate overlap fragments.
+        dna_sequences: List of sequences read from data file.
+
+    Returns:
+        Dictionary fragment type -> (true fragments list, false fragments list).
+    """
+    if len(fragment_types) > 1:
+        true_donors, false_donors, true_acceptors, false_acceptors = get_acceptors_and_donors(
+            a_len, b_len, dna_sequences, overlap_fragments
+        )
+        return {
+            DnaFragmentType.DONOR: (true_donors, false_donors),
+            DnaFragmentType.ACCEPTOR: (true_acceptors, false_acceptors),
+        }
+    elif fragment_types[0] == DnaFragmentType.DONOR:
+        return {DnaFragmentType.DONOR: get_donors(a_len, b_len, dna_sequences, overlap_fragments)}
+    return {DnaFragmentType.ACCEPTOR: get_acceptors(a_len, b_len, dna_sequences, overlap_fragments)}
+
+
+def get_fragments_parallel(
+    a_len: int,
+    b_len: int,
+    dna_sequences: Iterable[Dict],
+    fragment_types: List[DnaFragmentType],
+    overlap_fragments: bool,
+    workers: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Dict[DnaFragmentType, Tuple[List, List]]:
+    """
+    Get false and real fragments from ``dna_sequences`` using pool of ``workers`` processes.
+    Sequences are send to workers in chunks of ``chunk_size`` sequences and results are merged
+    in order of sequences, so they are the same as results of ``get_donors`` and ``get_acceptors``.
+    At most ``2 * workers`` chunks are submitted at once, next chunk is submitted as soon as the
+    oldest one is merged, so one slow chunk doesn't stop other workers.
+
+    Args:
+        a_len: Left length of donor/acceptor.
+        b_len: Right length of donor/acceptor.
+        dna_sequences: Sequences read from data file, each element is map which
+        contains "Introns", "Exons", "Data" - list or iterator from ``dna_data_iter``.
+        fragment_types: Types of fragments to get.
+        overlap_fragments: If true generate overlap fragments, if false don't generate overlap fragments.
+        workers: Number of worker processes.
+        chunk_size: Number of sequences send to worker at once.
+
+    Returns:
+        Dictionary fragment type -> (true fragments list, false fragments list).
+    """
+    result = {x: ([], []) for x in fragment_types}
+    task = partial(get_fragments_of_sequences, a_len, b_len, fragment_types, overlap_fragments)
+
+    sequences_iter = iter(dna_sequences)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # sliding window of submitted chunks in order of sequences
+        pending: Deque[Future] = deque()
+        while True:
+            while len(pending) < 2 * workers:
+                chunk = list(itertools.islice(sequences_iter, chunk_size))
+                if not chunk:
+                    break
+                pending.append(executor.submit(task, chunk))
+            if not pending:
+                break
+
+            for fragment_type, (true_seq, false_seq) in pending.popleft().result().items():
+                result[fragment_type][0].extend(true_seq)
+                result[fragment_type][1].extend(false_seq)
+
+    return result
+
+
+def deduplicate_result(true_seq, false_seq, window: Tuple[int, int]) -> Tuple:
+    """
+    Collapse identical true and identical false fragments - look ``dedup.deduplicate_labeled_fragments``.
+
+    Args:
+        true_seq: List or 2-D array of true donors/acceptors.
+        false_seq: List or 2-D array of false donors/acceptors.
+        window: (A, B) - left and right lengths of donor/acceptor.
+
+    Returns:
+        Unique true fragments, unique false fragments as 2-D arrays and array of their counts, true fragments first.
+    """
+    from python_code.binary_fragments import fragments_list_to_array
+    from python_code.dedup import deduplicate_labeled_fragments
+
+    if isinstance(true_seq, list):
+        true_seq = fragments_list_to_array(true_seq, window[0] + window[1], skip_cut=True)
+        false_seq = fragments_list_to_array(false_seq, window[0] + window[1], skip_cut=True)
+    return deduplicate_labeled_fragments(true_seq, false_seq)
+
+
+def save_result(
+    true_seq,
+    false_seq,
+    output: str,
+    result_format: str,
+    window: Tuple[int, int],
+    fragment_type: DnaFragmentType,
+    overlap_fragments: bool,
+    compression: Optional[str] = None,
+    compress_level: Optional[int] = None,
+    features_type: Optional[str] = None,
+    weights=None,
+) -> None:
+    """
+    Save acceptors/donors to given file in ``result_format``, optionally save also features matrix
+    and labels - look ``features.save_features``.
+
+    Args:
+        true_seq: List or 2-D array of true donors/acceptors.
+        false_seq: List or 2-D array of false donors/acceptors.
+        output: Output file name.
+        result_format: ``TEXT_FORMAT`` or ``BINARY_FORMAT``, binary file has only fragments of length A + B.
+        window: (A, B) - left and right lengths of donor/acceptor.
+        fragment_type: Type of fragments.
+        overlap_fragments: If fragments were generated with overlap.
+        compression: Compression of output file, by default detected from ``output`` extension.
+        compress_level: Level of compression - look ``open_file``.
+        features_type: Type of saved features - ``features.NUMBERS_FEATURES`` or ``features.ONE_HOT_FEATURES``,
+        by default features aren't saved. Features are saved only for fragments of length A + B.
+        weights: Array of counts of fragments, true fragments first - look ``deduplicate_result``, saved only
+        in ``BINARY_FORMAT`` and features, by default each fragment has weight 1.
+    """
+    if weights is not None and result_format != BINARY_FORMAT:
+        raise ValueError(f"Weights of fragments can be saved only in {BINARY_FORMAT} format!")
+
+    if features_type is not None:
+        from python_code.binary_fragments import fragments_list_to_array
+        from python_code.features import fragments_to_features, save_features
+
+        # fragments cut at edges of sequence are skipped like by numpy engine
+        if isinstance(true_seq, list):
+            true_array = fragments_list_to_array(true_seq, window[0] + window[1], skip_cut=True)
+            false_array = fragments_list_to_array(false_seq, window[0] + window[1], skip_cut=True)
+        else:
+            true_array, false_array = true_seq, false_seq
+        save_features(*fragments_to_features(true_array, false_array, features_type), output, weights)
+
+    if result_format == BINARY_FORMAT:
+        from python_code.binary_fragments import fragments_list_to_array, save_fragments_binary
+
+        fragment_len = window[0] + window[1]
+        # fragments cut at edges of sequence are skipped like by numpy engine
+        if isinstance(true_seq, list):
+            true_seq = fragments_list_to_array(true_seq, fragment_len, skip_cut=True)
+            false_seq = fragments_list_to_array(false_seq, fragment_len, skip_cut=True)
+        save_fragments_binary(
+            true_seq,
+            false_seq,
+            output,
+            window[0],
+            window[1],
+            fragment_type.value,
+            overlap_fragments,
+            compression,
+            compress_level,
+            weights,
+        )
+    else:
+        if not isinstance(true_seq, list):
+            from python_code.numpy_fragments import fragments_array_to_list
+
+            true_seq = fragments_array_to_list(true_seq)
+            false_seq = fragments_array_to_list(false_seq)
+        save_sequences_to_file(true_seq, false_seq, output, compression, compress_level)
+
+
+def iter_fragments(
+    a_len: int,
+    b_len: int,
+    dna_sequences: Iterable[Dict],
+    fragment_type: DnaFragmentType,
+    overlap_fragments: bool,
+    profiler: Optional[StageProfiler] = None,
+    sampler: Optional[FalseFragmentsSampler] = None,
+) -> Iterator[Tuple[int, int, int, str]]:
+    """
+    Streaming version of ``get_donors`` and ``get_acceptors`` - yield fragments of each sequence as soon
+    as they are found. For every sequence true fragments are yielded first, then false fragments.
+
+    Args:
+        a_len: Left length of donor/acceptor.
+        b_len: Right length of donor/acceptor.
+        dna_sequences: Sequences read from data file, each element is map which
+        contains "Introns", "Exons", "Data" - list or iterator from ``dna_data_iter``.
+        fragment_type: Type of fragments.
+        overlap_fragments: If true generate overlap fragments, if false don't generate overlap fragments.
+        profiler: Profiler of stages, measures motif scan, collision filtering and slicing and counts
+        candidates, collision checks and fragments rejected at edges of sequences.
+        sampler: Sampler of false fragments, by default all false fragments are yielded. False fragments
+        drawn with ``count`` are kept in sampler - chain iterator with ``sampler.iter_finish``.
+
+    Returns:
+        Iterator of (label, sequence number, position, fragment), label is 1 for true and 0 for false fragments.
+    """
+    fragment = DONOR_SEQ if fragment_type == DnaFragmentType.DONOR else ACCEPTOR_SEQ
+    for seq_id, dna_sequence in enumerate(dna_sequences):
+        sequence_data = dna_sequence["Sequence"]
+        true_positions = get_true_positions(dna_sequence, fragment_type)
+
+        with profile_stage(profiler, "motif_scan"):
+            possible_positions = get_motif_positions(dna_sequence, fragment)
+        with profile_stage(profiler, "collision_filtering"):
+            collisions = have_collisions_with_true_fragments(
+                create_true_positions_index(true_positions), a_len, b_len, possible_positions, overlap_fragments
+            )
+        if profiler is None:
+            true_fragments_num = 0
+            for pos in true_positions:
+                if not is_fragment_outside_of_sequence(a_len, b_len, pos, len(sequence_data)):
+                    true_fragments_num += 1
+                    yield 1, seq_id, pos, sequence_data[pos - a_len : pos + b_len]
+            if sampler is None:
+                for pos, collision in zip(possible_positions, collisions):
+                    if not collision and not is_fragment_outside_of_sequence(a_len, b_len, pos, len(sequence_data)):
+                        yield 0, seq_id, pos, sequence_data[pos - a_len : pos + b_len]
+            else:
+                yield from sampler.sample(
+                    [
+                        pos
+                        for pos, collision in zip(possible_positions, collisions)
+                        if not collision and not is_fragment_outside_of_sequence(a_len, b_len, pos, len(sequence_data))
+                    ],
+                    true_fragments_num,
+                    lambda pos: (0, seq_id, pos, sequence_data[pos - a_len : pos + b_len]),
+                )
+            continue
+
+        # with profiler slices are made before they are yielded, so time of consumer isn't measured as slicing
+        with profiler.stage("slicing"):
+            fragments = [
+                (1, seq_id, pos, sequence_data[pos - a_len : pos + b_len])
+                for pos in true_positions
+                if not is_fragment_outside_of_sequence(a_len, b_len, pos, len(sequence_data))
+            ]
+            true_fragments_num = len(fragments)
+            if sampler is None:
+                fragments.extend(
+                    (0, seq_id, pos, sequence_data[pos - a_len : pos + b_len])
+                    for pos, collision in zip(possible_positions, collisions)
+                    if not collision and not is_fragment_outside_of_sequence(a_len, b_len, pos, len(sequence_data))
+                )
+                false_fragments_num = len(fragments) - true_fragments_num
+            else:
+                false_positions = [
+                    pos
+                    for pos, collision in zip(possible_positions, collisions)
+                    if not collision and not is_fragment_outside_of_sequence(a_len, b_len, pos, len(sequence_data))
+                ]
+                false_fragments_num = len(false_positions)
+                fragments.extend(
+                    sampler.sample(
+                        false_positions,
+                        true_fragments_num,
+                        lambda pos: (0, seq_id, pos, sequence_data[pos - a_len : pos + b_len]),
+                    )
+                )
+
+        collisions_num = sum(collisions)
+        profiler.count("true_positions", len(true_positions))
+        profiler.count("candidate_motif_hits", len(possible_positions))
+        profiler.count("collisions", collisions_num)
+        profiler.count(
+            "rejected_at_edges",
+            len(true_positions) + len(possible_positions) - collisions_num - true_fragments_num - false_fragments_num,
+        )
+        profiler.count("true_fragments", true_fragments_num)
+        # false fragments found before sampling
+        profiler.count("false_fragments", false_fragments_num)
+        yield from fragments
+
+
+def get_fragments_profiled(
+    a_len: int,
+    b_len: int,
+    dna_sequences: Iterable[Dict],
+    fragment_types: List[DnaFragmentType],
+    overlap_fragments: bool,
+    profiler: StageProfiler,
+    samplers: Optional[Dict[DnaFragmentType, FalseFragmentsSampler]] = None,
+) -> Dict[DnaFragmentType, Tuple[List, List]]:
+    """
+    Get fragments like ``get_donors``, ``get_acceptors`` and ``get_acceptors_and_donors`` using
+    ``iter_fragments`` with profiler for each sequence.
+
+    Args:
+        a_len: Left length of donor/acceptor.
+        b_len: Right length of donor/acceptor.
+        dna_sequences: Sequences read from data file, each element is map which
+        contains "Introns", "Exons", "Data" - list or iterator from ``dna_data_iter``.
+        fragment_types: Types of fragments.
+        overlap_fragments: If true generate overlap fragments, if false don't generate overlap fragments.
+        profiler: Profiler of stages.
+        samplers: Samplers of false fragments of each type, by default all false fragments are returned.
+
+    Returns:
+        Dictionary fragment type -> (true fragments, false fragments).
+    """
+    samplers = samplers or {}
+    result = {x: ([], []) for x in fragment_types}
+    for dna_sequence in dna_sequences:
+        for fragment_type in fragment_types:
+            true_fragments, false_fragments = result[fragment_type]
+            for label, _, _, fragment in iter_fragments(
+                a_len, b_len, [dna_sequence], fragment_type, overlap_fragments, profiler, samplers.get(fragment_type)
+            ):
+                (true_fragments if label else false_fragments).append(fragment)
+    for fragment_type, sampler in samplers.items():
+        result[fragment_type][1].extend(fragment for _, _, _, fragment in sampler.finish())
+    return result
+
+
+def save_fragments_stream(
+    fragments: Iterable[Tuple[int, int, int, str]],
+    output: str,
+    true_first: bool = True,
+    buffer_size: int = DEFAULT_WRITE_BUFFER_SIZE,
+    compression: Optional[str] = None,
+    compress_level: Optional[int] = None,
+) -> Tuple[int, int]:
+    """
+    Save fragments from ``iter_fragments`` to file in format of ``save_sequences_to_file`` while they
+    are generated. With ``true_first`` false fragments are spilled to temporary file next to ``output``
+    and appended after all true fragments, so result is the same as of ``save_sequences_to_file``.
+
+    Args:
+        fragments: Iterator of (label, sequence number, position, fragment).
+        output: Output file name.
+        true_first: If true save all true fragments before false fragments, if false save in given order.
+        buffer_size: Size of write buffer in bytes.
+        compression: Compression of output file, by default detected from ``output`` extension.
+        compress_level: Level of compression - look ``open_file``.
+
+    Returns:
+        Number of saved true and false fragments.
+    """
+    saved = [0, 0]
+    with open_file(output, "w", compression, compress_level, buffer_size) as seq_f:
+        if true_first:
+            false_f = tempfile.TemporaryFile("w+", buffering=buffer_size, dir=os.path.dirname(os.path.abspath(output)))
+        else:
+            false_f = seq_f
+
+        with false_f:
+            for label, _, _, x in fragments:
+                if x != "":
+                    (seq_f if label else false_f).write(f"{label}\n{x}\n")
+                    saved[label] += 1
+
+            if true_first:
+                false_f.seek(0)
+                shutil.copyfileobj(false_f, seq_f, buffer_size)
+
+    return saved[1], saved[0]
+
+
 def save_sequences_to_file(
     true_seq: List,
     false_seq: List,
-    output: str
+    output: str,
+    compression: Optional[str] = None,
+    compress_level: Optional[int] = None,
 ) -> None:
     """
     Save acceptors/donors to given files.
@@ -253,8 +1300,10 @@ def save_sequences_to_file(
         true_seq: List of true donors/acceptors.
         false_seq: List of false donors/acceptors.
         output: Output file name.
+        compression: Compression of output file, by default detected from ``output`` extension.
+        compress_level: Level of compression - look ``open_file``.
     """
-    with open(output, "w") as seq_f:
+    with open_file(output, "w", compression, compress_level) as seq_f:
         for x in true_seq:
             if x != "":
                 seq_f.write(f"{1}\n{x}\n")
@@ -290,7 +1339,8 @@ def get_false_fragments(
     b_len: int,
     sequence_data: str,
     fragment: str,
-    overlap_fragments: bool
+    overlap_fragments: bool,
+    sampler: Optional[FalseFragmentsSampler] = None,
 ):
     """
     Get false donors/acceptors from given ``sequence_data`` which have ``fragment at position ``A``. 
@@ -303,21 +1353,68 @@ def get_false_fragments(
         sequence_data: DNA data.
         fragment: Fragment searched in ``sequence_data`` - look ACCEPTOR_SEQ, DONOR_SEQ.
         overlap_fragments: If true generate overlap fragments, if false don't generate overlap fragments.
+        sampler: Sampler of false fragments, by default all false fragments are returned.
+
+    Returns:
+        List of false fragments.
+    """
+    possible_false_fragments = find_fragment_positions(sequence_data, fragment)
+
+    return get_false_fragments_from_positions(
+        true_fragments_positions, a_len, b_len, sequence_data, possible_false_fragments, overlap_fragments, sampler
+    )
+
+
+def get_false_fragments_from_positions(
+    true_fragments_positions: List[int],
+    a_len: int,
+    b_len: int,
+    sequence_data: str,
+    possible_false_fragments: List[int],
+    overlap_fragments: bool,
+    sampler: Optional[FalseFragmentsSampler] = None,
+):
+    """
+    Get false donors/acceptors from given ``sequence_data`` at positions found earlier -
+    look ``find_fragment_positions``. ``true_fragments_positions`` are use to omit real donors/acceptors.
+
+    Args:
+        true_fragments_positions: List of true positions of donors/acceptors.
+        a_len: Left length of donor/acceptor.
+        b_len: Right length of donor/acceptor.
+        sequence_data: DNA data.
+        possible_false_fragments: Sorted positions of donor/acceptor sequence in ``sequence_data``.
+        overlap_fragments: If true generate overlap fragments, if false don't generate overlap fragments.
+        sampler: Sampler of false fragments, by default all false fragments are returned. With sampler
+        only drawn fragments are cut from ``sequence_data``.
 
     Returns:
         List of false fragments.
     """
     false_fragments = []
-    possible_false_fragments = [m.start() for m in re.finditer(fragment, sequence_data)]
-
-    for false_fragment_pos in possible_false_fragments:
-        if is_good_false_fragment(
-            true_fragments_positions,
-            a_len,
-            b_len,
-            false_fragment_pos,
-            len(sequence_data),
-            overlap_fragments
+
+    # check all candidates against sorted true positions at once
+    true_positions_index = create_true_positions_index(true_fragments_positions)
+    collisions = have_collisions_with_true_fragments(
+        true_positions_index, a_len, b_len, possible_false_fragments, overlap_fragments
+    )
+
+    if sampler is not None:
+        true_fragments_num = sum(
+            not is_fragment_outside_of_sequence(a_len, b_len, x, len(sequence_data)) for x in true_fragments_positions
+        )
+        false_positions = [
+            pos
+            for pos, collision in zip(possible_false_fragments, collisions)
+            if not collision and not is_fragment_outside_of_sequence(a_len, b_len, pos, len(sequence_data))
+        ]
+        return sampler.sample(
+            false_positions, true_fragments_num, lambda pos: sequence_data[pos - a_len : pos + b_len]
+        )
+
+    for false_fragment_pos, collision in zip(possible_false_fragments, collisions):
+        if not collision and not is_fragment_outside_of_sequence(
+            a_len, b_len, false_fragment_pos, len(sequence_data)
         ):
             false_fragments.append(
                 sequence_data[false_fragment_pos - a_len : false_fragment_pos + b_len]
@@ -325,6 +1422,74 @@ def get_false_fragments(
     return false_fragments
 
 
+def find_fragment_positions(sequence_data: str, fragment: str) -> List[int]:
+    """
+    Find positions of ``fragment`` in ``sequence_data``.
+
+    Args:
+        sequence_data: DNA data.
+        fragment: Fragment searched in ``sequence_data`` - look ACCEPTOR_SEQ, DONOR_SEQ.
+
+    Returns:
+        Sorted list of positions.
+    """
+    return [m.start() for m in re.finditer(fragment, sequence_data)]
+
+
+def get_motif_positions(dna_sequence: Dict, fragment: str) -> List[int]:
+    """
+    Get positions of ``fragment`` in sequence, positions added from motif index are used without
+    scanning sequence - look ``motif_index.attach_motif_positions``.
+
+    Args:
+        dna_sequence: Sequence read from data file - map which contains "Introns", "Exons", "Sequence".
+        fragment: ``DONOR_SEQ`` or ``ACCEPTOR_SEQ``.
+
+    Returns:
+        Sorted list of positions.
+    """
+    positions = dna_sequence.get(MOTIF_POSITIONS_KEYS[fragment])
+    if positions is None:
+        return find_fragment_positions(dna_sequence["Sequence"], fragment)
+    return positions
+
+
+def get_donors_and_acceptors_positions(dna_sequence: Dict) -> Tuple[List[int], List[int]]:
+    """
+    Get positions of ``DONOR_SEQ`` and ``ACCEPTOR_SEQ`` in sequence from motif index or from one scan
+    of sequence - look ``find_donors_and_acceptors_positions``.
+
+    Args:
+        dna_sequence: Sequence read from data file - map which contains "Introns", "Exons", "Sequence".
+
+    Returns:
+        Sorted lists of donors and acceptors positions.
+    """
+    if all(x in dna_sequence for x in MOTIF_POSITIONS_KEYS.values()):
+        return dna_sequence[MOTIF_POSITIONS_KEYS[DONOR_SEQ]], dna_sequence[MOTIF_POSITIONS_KEYS[ACCEPTOR_SEQ]]
+    return find_donors_and_acceptors_positions(dna_sequence["Sequence"])
+
+
+def find_donors_and_acceptors_positions(sequence_data: str) -> Tuple[List[int], List[int]]:
+    """
+    Find positions of ``DONOR_SEQ`` and ``ACCEPTOR_SEQ`` in ``sequence_data`` in one scan.
+
+    Args:
+        sequence_data: DNA data.
+
+    Returns:
+        Sorted lists of donors and acceptors positions.
+    """
+    donors_positions = []
+    acceptors_positions = []
+    for m in DONOR_OR_ACCEPTOR_PATTERN.finditer(sequence_data):
+        if m.group(1) == DONOR_SEQ:
+            donors_positions.append(m.start())
+        else:
+            acceptors_positions.append(m.start())
+    return donors_positions, acceptors_positions
+
+
 def line_of_numbers_to_tuples(line: str) -> List[Tuple[int, int]]:
     """
     Convert line of number split be white signs to list of tuples.
@@ -427,5 +1592,49 @@ def have_collision_with_true_fragment(
     return False
 
 
+def create_true_positions_index(true_positions_list: List[int]) -> List[int]:
+    """
+    Create index of true positions used by ``have_collisions_with_true_fragments``.
+
+    Args:
+        true_positions_list: List of true positions of donors/acceptors.
+
+    Returns:
+        Sorted list of true positions.
+    """
+    return sorted(true_positions_list)
+
+
+def have_collisions_with_true_fragments(
+    true_positions_index: List[int], a_len: int, b_len: int, positions: List[int], overlap_fragments: bool
+) -> List[bool]:
+    """
+    Batch version of ``have_collision_with_true_fragment`` - check all ``positions`` using
+    binary search in ``true_positions_index``. Fragment at ``pos`` collides with true fragment
+    at ``true_pos`` in no overlap mode when ``|pos - true_pos| <= a_len + b_len``, in overlap
+    mode only when ``pos == true_pos``.
+
+    Args:
+        true_positions_index: Sorted list of true positions - look ``create_true_positions_index``.
+        a_len: Left length of donor/acceptor.
+        b_len: Right length od donor/acceptor.
+        positions: Positions to check.
+        overlap_fragments: If true accept overlap fragments, if false don't accept overlap fragments.
+
+    Returns:
+        List with collision flag for every position in ``positions``.
+    """
+    window = 0 if overlap_fragments else a_len + b_len
+
+    collisions = []
+    for pos in positions:
+        # first true position which is not before window
+        idx = bisect.bisect_left(true_positions_index, pos - window)
+        collisions.append(
+            idx < len(true_positions_index) and true_positions_index[idx] <= pos + window
+        )
+    return collisions
+
+
 if __name__ == "__main__":
     get_acceptors_and_donors_command(sys.argv[1:])
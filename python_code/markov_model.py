@@ -0,0 +1,209 @@
+import argparse
+import os
+import sys
+from typing import List, Optional
+
+import numpy as np
+
+from python_code.features import NUCLEOTIDE_CODES_NUM, load_features, load_weights
+from python_code.naive_bayes import CategoricalNaiveBayes
+
+# default order of markov model - number of previous nucleotides on which nucleotide depends
+DEFAULT_MARKOV_ORDER: int = 1
+
+
+def get_context_codes(
+    x: np.ndarray, order: int = DEFAULT_MARKOV_ORDER, codes_num: int = NUCLEOTIDE_CODES_NUM
+) -> np.ndarray:
+    """
+    Code each nucleotide together with ``order`` previous nucleotides using rolling codes over whole
+    fragments matrix. Previous nucleotides are numbers in base ``codes_num + 1``, positions before
+    fragment start have code ``codes_num``, example for order 1: ``code = x[i] + codes_num * x[i - 1]``.
+
+    Args:
+        x: 2-D array of codes of nucleotides, each row is one fragment - look ``features.fragments_to_numbers``.
+        order: Number of previous nucleotides.
+        codes_num: Number of codes of nucleotides.
+
+    Returns:
+        2-D intp array of codes smaller than ``codes_num * (codes_num + 1) ** order``.
+    """
+    x = np.asarray(x, dtype=np.intp)
+    codes = x.copy()
+    factor = codes_num
+    for shift in range(1, order + 1):
+        codes[:, :shift] += codes_num * factor
+        codes[:, shift:] += x[:, :-shift] * factor
+        factor *= codes_num + 1
+    return codes
+
+
+class MarkovModel(CategoricalNaiveBayes):
+    """
+    Inhomogeneous markov model of fragments: probability of nucleotide at each position depends on class
+    and ``order`` previous nucleotides, probabilities are ``(count + laplace) / (context count + laplace *
+    codes)``. Model is naive bayes over codes from ``get_context_codes``, so it is trained from count tables
+    and scored with one gather and sum per batch like ``CategoricalNaiveBayes``, order 0 gives naive bayes
+    with all codes as levels.
+    """
+
+    def __init__(
+        self,
+        order: int = DEFAULT_MARKOV_ORDER,
+        laplace: float = 0.0,
+        priors: Optional[np.ndarray] = None,
+        threshold: float = 0.001,
+        eps: float = 0.0,
+        nucleotide_codes_num: int = NUCLEOTIDE_CODES_NUM,
+    ):
+        """
+        Args:
+            order: Number of previous nucleotides on which nucleotide depends.
+            laplace: Laplace smoothing value, 0 - no smoothing.
+            priors: Prior probabilities of classes, by default frequencies of classes in training data.
+            threshold: Value used instead of probabilities not greater than ``eps``, also for contexts
+            not seen during training.
+            eps: Probabilities not greater than this value are replaced by ``threshold``.
+            nucleotide_codes_num: Number of codes of nucleotides.
+        """
+        super().__init__(laplace, priors, threshold, eps, nucleotide_codes_num * (nucleotide_codes_num + 1) ** order)
+        self.order = order
+        self.nucleotide_codes_num = nucleotide_codes_num
+
+    def encode(self, x: np.ndarray) -> np.ndarray:
+        """
+        Args:
+            x: 2-D array of codes of nucleotides, each row is one fragment.
+
+        Returns:
+            2-D intp array of codes of nucleotides with contexts - look ``get_context_codes``.
+        """
+        return get_context_codes(x, self.order, self.nucleotide_codes_num)
+
+    def update(self) -> "MarkovModel":
+        """
+        Compute log probabilities tables from ``counts_`` and ``class_counts_``.
+
+        Returns:
+            Model.
+        """
+        classes_num, positions_num, _ = self.counts_.shape
+        counts = self.counts_.reshape(classes_num, positions_num, -1, self.nucleotide_codes_num)
+
+        context_counts = counts.sum(axis=3, keepdims=True)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            prob = (counts + self.laplace) / (context_counts + self.laplace * self.nucleotide_codes_num)
+        prob = np.nan_to_num(prob)
+        prob[prob <= self.eps] = self.threshold
+        self.log_prob_ = np.log(prob).reshape(self.counts_.shape)
+
+        priors = self.class_counts_ / self.class_counts_.sum() if self.priors is None else self.priors
+        with np.errstate(divide="ignore"):
+            self.log_prior_ = np.log(priors)
+        return self
+
+    def save(self, output: str) -> None:
+        """
+        Save counts and parameters of model as ``.npz`` file - look ``load_markov_model``.
+
+        Args:
+            output: Output file name.
+        """
+        with open(output, "wb") as model_f:
+            np.savez(
+                model_f,
+                counts=self.counts_,
+                class_counts=self.class_counts_,
+                order=self.order,
+                laplace=self.laplace,
+                priors=np.empty(0) if self.priors is None else self.priors,
+                threshold=self.threshold,
+                eps=self.eps,
+                nucleotide_codes_num=self.nucleotide_codes_num,
+            )
+
+
+def load_markov_model(input_path: str) -> MarkovModel:
+    """
+    Load model saved by ``MarkovModel.save``.
+
+    Args:
+        input_path: Path to model file.
+
+    Returns:
+        Trained model.
+    """
+    with np.load(input_path) as data:
+        model = MarkovModel(
+            order=int(data["order"]),
+            laplace=float(data["laplace"]),
+            priors=data["priors"] if len(data["priors"]) else None,
+            threshold=float(data["threshold"]),
+            eps=float(data["eps"]),
+            nucleotide_codes_num=int(data["nucleotide_codes_num"]),
+        )
+        model.counts_ = data["counts"]
+        model.class_counts_ = data["class_counts"]
+    return model.update()
+
+
+def markov_model_command(command_args: List[str]) -> None:
+    """
+    Create parser, parse args given in ``command_args`` and train markov model on features saved by
+    ``get_acceptors_and_donors`` with ``--features numbers``. With ``--update`` existing model is
+    trained further only on new fragments.
+
+    Args:
+        command_args: Arguments for command.
+    """
+    # create parser
+    parser = argparse.ArgumentParser()
+
+    # input
+    parser.add_argument(
+        "-i",
+        "--input",
+        nargs="+",
+        required=True,
+        help="result files of get_acceptors_and_donors saved with --features numbers",
+    )
+
+    # model
+    parser.add_argument("-m", "--model", required=True, help="model file", type=str)
+
+    # order
+    parser.add_argument(
+        "-k", "--order", default=DEFAULT_MARKOV_ORDER, help="number of previous nucleotides", choices=[1, 2], type=int
+    )
+
+    # update
+    parser.add_argument(
+        "-u",
+        "--update",
+        action="store_true",
+        default=False,
+        help="if flag add new fragments to existing model instead of training from scratch",
+    )
+
+    # laplace
+    parser.add_argument("-l", "--laplace", default=0.0, help="laplace smoothing value", type=float)
+
+    # parse arguments
+    args = parser.parse_args(command_args)
+
+    if args.update and os.path.isfile(args.model):
+        model = load_markov_model(args.model)
+        if model.order != args.order:
+            parser.error(f"Model {args.model} has order {model.order}, not {args.order}!")
+    else:
+        model = MarkovModel(order=args.order, laplace=args.laplace)
+
+    for input_path in args.input:
+        features, labels = load_features(input_path)
+        model.partial_fit(features, labels, load_weights(input_path))
+
+    model.save(args.model)
+
+
+if __name__ == "__main__":
+    markov_model_command(sys.argv[1:])
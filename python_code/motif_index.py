@@ -0,0 +1,197 @@
+import itertools
+import os
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+from python_code.compression import open_file
+from python_code.get_acceptors_and_donors import MOTIF_POSITIONS_KEYS, dna_data_iter
+from python_code.numpy_fragments import encode_sequence, find_fragment_positions_array
+
+# suffix of motif index file created next to input data file
+MOTIF_INDEX_SUFFIX: str = ".motifs.npz"
+
+# positions are saved as uint32 when they fit, int64 instead
+MAX_COMPACT_POSITION: int = np.iinfo(np.uint32).max
+
+
+def get_motif_index_path(input_path: str) -> str:
+    """
+    Get path of motif index file for given ``input_path``.
+
+    Args:
+        input_path: Path to file with sequences.
+
+    Returns:
+        Path to motif index file.
+    """
+    return input_path + MOTIF_INDEX_SUFFIX
+
+
+def to_compact_array(positions: List[np.ndarray]) -> np.ndarray:
+    """
+    Concatenate positions of all sequences to one array of the smallest integer type which fits them.
+
+    Args:
+        positions: Arrays of positions of each sequence.
+
+    Returns:
+        1-D uint32 or int64 array.
+    """
+    values = np.concatenate(positions) if positions else np.empty(0, dtype=np.int64)
+    if len(values) == 0 or (values.min() >= 0 and values.max() <= MAX_COMPACT_POSITION):
+        return values.astype(np.uint32)
+    return values.astype(np.int64)
+
+
+def get_offsets(positions: List[np.ndarray]) -> np.ndarray:
+    """
+    Get offsets of positions of each sequence in concatenated array - positions of sequence ``i`` are
+    ``values[offsets[i] : offsets[i + 1]]``.
+
+    Args:
+        positions: Arrays of positions of each sequence.
+
+    Returns:
+        1-D int64 array of length number of sequences + 1.
+    """
+    return np.concatenate([[0], np.cumsum([len(x) for x in positions], dtype=np.int64)]).astype(np.int64)
+
+
+def create_motif_index(input_path: str) -> Dict[str, np.ndarray]:
+    """
+    Scan ``input_path`` once and find positions of ``DONOR_SEQ`` and ``ACCEPTOR_SEQ`` and begins and
+    ends of introns of every sequence. Positions of all sequences are concatenated to one array with
+    offsets of sequences.
+
+    Args:
+        input_path: Path to file with sequences, can be compressed.
+
+    Returns:
+        Index as dictionary of arrays: {"size", "mtime", "<key>", "<key>_offsets"}, keys are values of
+        ``MOTIF_POSITIONS_KEYS``, "introns_begin" and "introns_end".
+    """
+    stat = os.stat(input_path)
+    positions: Dict[str, List[np.ndarray]] = {x: [] for x in MOTIF_POSITIONS_KEYS.values()}
+    introns_begin: List[np.ndarray] = []
+    introns_end: List[np.ndarray] = []
+
+    with open_file(input_path) as dna_file:
+        for dna_sequence in dna_data_iter(dna_file):
+            sequence_codes = encode_sequence(dna_sequence["Sequence"])
+            for fragment, key in MOTIF_POSITIONS_KEYS.items():
+                positions[key].append(find_fragment_positions_array(sequence_codes, fragment))
+            introns = np.array(dna_sequence["Introns"], dtype=np.int64).reshape(-1, 2)
+            introns_begin.append(introns[:, 0])
+            introns_end.append(introns[:, 1])
+
+    index = {"size": np.int64(stat.st_size), "mtime": np.float64(stat.st_mtime)}
+    for key, key_positions in [*positions.items(), ("introns_begin", introns_begin), ("introns_end", introns_end)]:
+        index[key] = to_compact_array(key_positions)
+        index[f"{key}_offsets"] = get_offsets(key_positions)
+    return index
+
+
+def save_motif_index(index: Dict[str, np.ndarray], index_path: str) -> None:
+    """
+    Save ``index`` to ``index_path`` as ``.npz`` file, file is replaced atomically.
+
+    Args:
+        index: Index created by ``create_motif_index``.
+        index_path: Path to motif index file.
+    """
+    tmp_path = index_path + ".tmp"
+    with open(tmp_path, "wb") as index_file:
+        np.savez(index_file, **index)
+    os.replace(tmp_path, index_path)
+
+
+def is_motif_index_valid(index: Dict[str, np.ndarray], input_path: str) -> bool:
+    """
+    Check if ``index`` was created for current version of ``input_path`` - compare size and
+    modification time of file like ``dna_file_index.is_dna_file_index_valid``.
+
+    Args:
+        index: Index created by ``create_motif_index``.
+        input_path: Path to file with sequences.
+
+    Returns:
+        True if index is valid, false instead.
+    """
+    stat = os.stat(input_path)
+    return "size" in index and int(index["size"]) == stat.st_size and float(index["mtime"]) == stat.st_mtime
+
+
+def get_motif_index(input_path: str, index_path: Optional[str] = None) -> Dict[str, np.ndarray]:
+    """
+    Load motif index of ``input_path`` from ``index_path``, when index doesn't exist or is out of date
+    create it and save it.
+
+    Args:
+        input_path: Path to file with sequences.
+        index_path: Path to motif index file, by default ``input_path`` with ``MOTIF_INDEX_SUFFIX``.
+
+    Returns:
+        Index as dictionary of arrays - look ``create_motif_index``.
+    """
+    if index_path is None:
+        index_path = get_motif_index_path(input_path)
+
+    if os.path.isfile(index_path):
+        try:
+            with np.load(index_path) as data:
+                index = dict(data)
+        except (OSError, ValueError):
+            index = {}
+        if is_motif_index_valid(index, input_path):
+            return index
+
+    index = create_motif_index(input_path)
+    save_motif_index(index, index_path)
+    return index
+
+
+def get_sequence_positions(index: Dict[str, np.ndarray], sequence_number: int) -> Dict[str, List]:
+    """
+    Get positions of motifs and introns of one sequence from index.
+
+    Args:
+        index: Index created by ``create_motif_index``.
+        sequence_number: Number of sequence in file.
+
+    Returns:
+        Dictionary: {"<key>", "Introns"}, keys are values of ``MOTIF_POSITIONS_KEYS`` with sorted
+        lists of positions, "Introns" is list of (begin, end) like in ``dna_data_iter``.
+    """
+    if sequence_number + 1 >= len(index["introns_begin_offsets"]):
+        raise IndexError(f"Sequence {sequence_number} not found in motif index!")
+
+    result = {}
+    for key in [*MOTIF_POSITIONS_KEYS.values(), "introns_begin", "introns_end"]:
+        begin, end = index[f"{key}_offsets"][sequence_number : sequence_number + 2]
+        result[key] = index[key][begin:end].tolist()
+    result["Introns"] = list(zip(result.pop("introns_begin"), result.pop("introns_end")))
+    return result
+
+
+def attach_motif_positions(
+    dna_sequences: Iterable[Dict], index: Dict[str, np.ndarray], sequence_numbers: Optional[Iterable[int]] = None
+) -> Iterator[Dict]:
+    """
+    Add positions from motif index to sequences, so fragments are cut without scanning sequences -
+    look ``get_acceptors_and_donors.get_motif_positions``.
+
+    Args:
+        dna_sequences: Sequences read from data file - list or iterator from ``dna_data_iter``.
+        index: Index created by ``create_motif_index``.
+        sequence_numbers: Numbers of ``dna_sequences`` in file, by default sequences are all sequences
+        of file in file order.
+
+    Returns:
+        Iterator of dictionaries of sequences with positions of motifs.
+    """
+    if sequence_numbers is None:
+        sequence_numbers = itertools.count()
+    for sequence_number, dna_sequence in zip(sequence_numbers, dna_sequences):
+        dna_sequence.update(get_sequence_positions(index, sequence_number))
+        yield dna_sequence
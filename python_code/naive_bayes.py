@@ -0,0 +1,413 @@
+import argparse
+import os
+import sys
+from typing import List, Optional
+
+import numpy as np
+
+from python_code.features import NUCLEOTIDE_CODES_NUM, load_features, load_weights
+
+# default number of fragments scored at once
+DEFAULT_BATCH_SIZE: int = 65536
+
+# classes of fragments: 0 - false, 1 - true donor/acceptor
+CLASSES_NUM: int = 2
+
+
+class CategoricalNaiveBayes:
+    """
+    Naive bayes classifier for fragments coded as numbers - look ``features.fragments_to_numbers``.
+    Each position of fragment is categorical feature, model is built from position x code count tables
+    and follows ``e1071::naiveBayes``: conditional probabilities are ``(count + laplace) /
+    (class count + laplace * levels)``, where levels is number of codes seen at position during training,
+    and probabilities not greater than ``eps`` are replaced by ``threshold`` while scoring.
+    """
+
+    def __init__(
+        self,
+        laplace: float = 0.0,
+        priors: Optional[np.ndarray] = None,
+        threshold: float = 0.001,
+        eps: float = 0.0,
+        codes_num: int = NUCLEOTIDE_CODES_NUM,
+    ):
+        """
+        Args:
+            laplace: Laplace smoothing value, 0 - no smoothing.
+            priors: Prior probabilities of classes, by default frequencies of classes in training data.
+            threshold: Value used instead of probabilities not greater than ``eps``.
+            eps: Probabilities not greater than this value are replaced by ``threshold``.
+            codes_num: Number of codes of nucleotides.
+        """
+        self.laplace = laplace
+        self.priors = None if priors is None else np.asarray(priors, dtype=np.float64)
+        self.threshold = threshold
+        self.eps = eps
+        self.codes_num = codes_num
+        self.counts_: Optional[np.ndarray] = None
+        self.class_counts_: Optional[np.ndarray] = None
+        self.log_prob_: Optional[np.ndarray] = None
+        self.log_prior_: Optional[np.ndarray] = None
+
+    def fit(self, x: np.ndarray, y: np.ndarray, sample_weight: Optional[np.ndarray] = None) -> "CategoricalNaiveBayes":
+        """
+        Train model from scratch.
+
+        Args:
+            x: 2-D array of codes, each row is one fragment.
+            y: Labels, 1 for true and 0 for false fragments.
+            sample_weight: Weights of fragments, by default 1 for each fragment.
+
+        Returns:
+            Trained model.
+        """
+        self.counts_ = self.count(x, y, sample_weight)
+        self.class_counts_ = count_classes(y, sample_weight)
+        return self.update()
+
+    def partial_fit(
+        self, x: np.ndarray, y: np.ndarray, sample_weight: Optional[np.ndarray] = None
+    ) -> "CategoricalNaiveBayes":
+        """
+        Add counts of new fragments to model, model trained on many batches is the same
+        as trained on all fragments at once.
+
+        Args:
+            x: 2-D array of codes, each row is one fragment.
+            y: Labels, 1 for true and 0 for false fragments.
+            sample_weight: Weights of fragments, by default 1 for each fragment.
+
+        Returns:
+            Trained model.
+        """
+        if self.counts_ is None:
+            return self.fit(x, y, sample_weight)
+
+        if x.shape[1] != self.counts_.shape[1]:
+            raise ValueError(f"Model was trained on fragments of length {self.counts_.shape[1]}, not {x.shape[1]}!")
+        self.counts_ += self.count(x, y, sample_weight)
+        self.class_counts_ += count_classes(y, sample_weight)
+        return self.update()
+
+    def merge(self, other: "CategoricalNaiveBayes") -> "CategoricalNaiveBayes":
+        """
+        Add counts of model trained separately, example on other part of data.
+
+        Args:
+            other: Trained model.
+
+        Returns:
+            Model with merged counts.
+        """
+        if self.counts_ is None:
+            self.counts_ = np.zeros_like(other.counts_)
+            self.class_counts_ = np.zeros_like(other.class_counts_)
+
+        if self.counts_.shape != other.counts_.shape:
+            raise ValueError(f"Can't merge models with counts shapes {self.counts_.shape} and {other.counts_.shape}!")
+        self.counts_ += other.counts_
+        self.class_counts_ += other.class_counts_
+        return self.update()
+
+    def save(self, output: str) -> None:
+        """
+        Save counts and parameters of model as ``.npz`` file - look ``load_naive_bayes``.
+
+        Args:
+            output: Output file name.
+        """
+        with open(output, "wb") as model_f:
+            np.savez(
+                model_f,
+                counts=self.counts_,
+                class_counts=self.class_counts_,
+                laplace=self.laplace,
+                priors=np.empty(0) if self.priors is None else self.priors,
+                threshold=self.threshold,
+                eps=self.eps,
+                codes_num=self.codes_num,
+            )
+
+    def encode(self, x: np.ndarray) -> np.ndarray:
+        """
+        Get codes of fragments used as indexes of count tables, naive bayes uses codes of nucleotides.
+
+        Args:
+            x: 2-D array of codes, each row is one fragment.
+
+        Returns:
+            2-D intp array of codes smaller than ``codes_num``.
+        """
+        return np.asarray(x, dtype=np.intp)
+
+    def count(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        sample_weight: Optional[np.ndarray] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        classes_num: int = CLASSES_NUM,
+    ) -> np.ndarray:
+        """
+        Count codes given by ``encode`` at each position of fragments for each class - look ``count_codes``.
+
+        Args:
+            x: 2-D array of codes, each row is one fragment.
+            y: Labels, 1 for true and 0 for false fragments.
+            sample_weight: Weights of fragments, by default 1 for each fragment.
+            batch_size: Number of fragments counted at once.
+            classes_num: Number of values of ``y`` - look ``count_codes``.
+
+        Returns:
+            3-D array of counts (classes, positions, codes).
+        """
+        counts = np.zeros((classes_num, x.shape[1], self.codes_num))
+        for begin in range(0, len(x), batch_size):
+            counts += count_codes(
+                self.encode(x[begin : begin + batch_size]),
+                y[begin : begin + batch_size],
+                self.codes_num,
+                None if sample_weight is None else sample_weight[begin : begin + batch_size],
+                batch_size,
+                classes_num,
+            )
+        return counts
+
+    def update(self) -> "CategoricalNaiveBayes":
+        """
+        Compute log probabilities tables from ``counts_`` and ``class_counts_``.
+
+        Returns:
+            Model.
+        """
+        counts = self.counts_
+        class_counts = self.class_counts_
+
+        # number of codes seen at each position
+        levels = (counts.sum(axis=0) > 0).sum(axis=1)
+        denominator = class_counts[:, np.newaxis, np.newaxis] + self.laplace * levels[np.newaxis, :, np.newaxis]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            prob = (counts + self.laplace) / denominator
+        prob = np.nan_to_num(prob)
+        prob[prob <= self.eps] = self.threshold
+        self.log_prob_ = np.log(prob)
+
+        priors = class_counts / class_counts.sum() if self.priors is None else self.priors
+        with np.errstate(divide="ignore"):
+            self.log_prior_ = np.log(priors)
+        return self
+
+    def joint_log_likelihood(self, x: np.ndarray, batch_size: int = DEFAULT_BATCH_SIZE) -> np.ndarray:
+        """
+        Compute log of prior times likelihood for each class - one gather and sum per batch.
+
+        Args:
+            x: 2-D array of codes, each row is one fragment.
+            batch_size: Number of fragments scored at once.
+
+        Returns:
+            2-D array (fragments, classes).
+        """
+        positions_num = self.log_prob_.shape[1]
+        flat_log_prob = self.log_prob_.reshape(CLASSES_NUM, positions_num * self.codes_num)
+        offsets = np.arange(positions_num) * self.codes_num
+
+        result = np.empty((len(x), CLASSES_NUM))
+        for begin in range(0, len(x), batch_size):
+            idx = offsets + self.encode(x[begin : begin + batch_size])
+            result[begin : begin + batch_size] = flat_log_prob[:, idx].sum(axis=2).T
+        return result + self.log_prior_
+
+    def predict_log_proba(self, x: np.ndarray, batch_size: int = DEFAULT_BATCH_SIZE) -> np.ndarray:
+        """
+        Compute log of posterior probabilities of classes.
+
+        Args:
+            x: 2-D array of codes, each row is one fragment.
+            batch_size: Number of fragments scored at once.
+
+        Returns:
+            2-D array (fragments, classes).
+        """
+        jll = self.joint_log_likelihood(x, batch_size)
+        return jll - np.logaddexp.reduce(jll, axis=1)[:, np.newaxis]
+
+    def predict_proba(self, x: np.ndarray, batch_size: int = DEFAULT_BATCH_SIZE) -> np.ndarray:
+        """
+        Compute posterior probabilities of classes - like ``predict(type="raw")`` in R.
+
+        Args:
+            x: 2-D array of codes, each row is one fragment.
+            batch_size: Number of fragments scored at once.
+
+        Returns:
+            2-D array (fragments, classes).
+        """
+        return np.exp(self.predict_log_proba(x, batch_size))
+
+    def predict(self, x: np.ndarray, batch_size: int = DEFAULT_BATCH_SIZE) -> np.ndarray:
+        """
+        Predict classes of fragments.
+
+        Args:
+            x: 2-D array of codes, each row is one fragment.
+            batch_size: Number of fragments scored at once.
+
+        Returns:
+            Array of labels.
+        """
+        return self.joint_log_likelihood(x, batch_size).argmax(axis=1)
+
+    def log_odds_table(self) -> np.ndarray:
+        """
+        Get per position log-odds of true class, score of fragment is sum of values gathered
+        for its codes plus ``log_prior_odds``.
+
+        Returns:
+            2-D array (positions, codes).
+        """
+        return self.log_prob_[1] - self.log_prob_[0]
+
+    def log_prior_odds(self) -> float:
+        """
+        Returns:
+            Log of prior odds of true class.
+        """
+        return float(self.log_prior_[1] - self.log_prior_[0])
+
+
+def count_codes(
+    x: np.ndarray,
+    y: np.ndarray,
+    codes_num: int = NUCLEOTIDE_CODES_NUM,
+    sample_weight: Optional[np.ndarray] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    classes_num: int = CLASSES_NUM,
+) -> np.ndarray:
+    """
+    Count codes at each position of fragments for each class with ``np.bincount``.
+
+    Args:
+        x: 2-D array of codes, each row is one fragment.
+        y: Labels, 1 for true and 0 for false fragments.
+        codes_num: Number of codes of nucleotides.
+        sample_weight: Weights of fragments, by default 1 for each fragment.
+        batch_size: Number of fragments counted at once.
+        classes_num: Number of values of ``y``, can be greater than ``CLASSES_NUM`` when ``y``
+        combines label with other group - look ``cross_validation``.
+
+    Returns:
+        3-D array of counts (classes, positions, codes).
+    """
+    positions_num = x.shape[1]
+    table_size = positions_num * codes_num
+    offsets = np.arange(positions_num) * codes_num
+
+    counts = np.zeros(classes_num * table_size)
+    for begin in range(0, len(x), batch_size):
+        x_batch = np.asarray(x[begin : begin + batch_size], dtype=np.intp)
+        y_batch = np.asarray(y[begin : begin + batch_size], dtype=np.intp)
+        idx = (y_batch[:, np.newaxis] * table_size + offsets + x_batch).ravel()
+        if sample_weight is None:
+            weights = None
+        else:
+            weights = np.repeat(np.asarray(sample_weight[begin : begin + batch_size], dtype=np.float64), positions_num)
+        counts += np.bincount(idx, weights=weights, minlength=classes_num * table_size)
+
+    return counts.reshape(classes_num, positions_num, codes_num)
+
+
+def count_classes(
+    y: np.ndarray, sample_weight: Optional[np.ndarray] = None, classes_num: int = CLASSES_NUM
+) -> np.ndarray:
+    """
+    Count fragments of each class.
+
+    Args:
+        y: Labels, 1 for true and 0 for false fragments.
+        sample_weight: Weights of fragments, by default 1 for each fragment.
+        classes_num: Number of values of ``y`` - look ``count_codes``.
+
+    Returns:
+        Array of counts of classes.
+    """
+    return np.bincount(np.asarray(y, dtype=np.intp), weights=sample_weight, minlength=classes_num).astype(np.float64)
+
+
+def load_naive_bayes(input_path: str) -> CategoricalNaiveBayes:
+    """
+    Load model saved by ``CategoricalNaiveBayes.save``.
+
+    Args:
+        input_path: Path to model file.
+
+    Returns:
+        Trained model.
+    """
+    with np.load(input_path) as data:
+        model = CategoricalNaiveBayes(
+            laplace=float(data["laplace"]),
+            priors=data["priors"] if len(data["priors"]) else None,
+            threshold=float(data["threshold"]),
+            eps=float(data["eps"]),
+            codes_num=int(data["codes_num"]),
+        )
+        model.counts_ = data["counts"]
+        model.class_counts_ = data["class_counts"]
+    return model.update()
+
+
+def naive_bayes_command(command_args: List[str]) -> None:
+    """
+    Create parser, parse args given in ``command_args`` and train naive bayes on features saved by
+    ``get_acceptors_and_donors`` with ``--features numbers``. With ``--update`` existing model is
+    trained further only on new fragments. Features saved with ``--dedup`` are weighted by counts of
+    fragments, so model is the same as trained on all copies.
+
+    Args:
+        command_args: Arguments for command.
+    """
+    # create parser
+    parser = argparse.ArgumentParser()
+
+    # input
+    parser.add_argument(
+        "-i",
+        "--input",
+        nargs="+",
+        required=True,
+        help="result files of get_acceptors_and_donors saved with --features numbers",
+    )
+
+    # model
+    parser.add_argument("-m", "--model", required=True, help="model file", type=str)
+
+    # update
+    parser.add_argument(
+        "-u",
+        "--update",
+        action="store_true",
+        default=False,
+        help="if flag add new fragments to existing model instead of training from scratch",
+    )
+
+    # laplace
+    parser.add_argument("-l", "--laplace", default=0.0, help="laplace smoothing value", type=float)
+
+    # parse arguments
+    args = parser.parse_args(command_args)
+
+    if args.update and os.path.isfile(args.model):
+        model = load_naive_bayes(args.model)
+    else:
+        model = CategoricalNaiveBayes(laplace=args.laplace)
+
+    for input_path in args.input:
+        features, labels = load_features(input_path)
+        model.partial_fit(features, labels, load_weights(input_path))
+
+    model.save(args.model)
+
+
+if __name__ == "__main__":
+    naive_bayes_command(sys.argv[1:])
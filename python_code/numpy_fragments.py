@@ -0,0 +1,240 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from python_code.get_acceptors_and_donors import DONOR_SEQ, MOTIF_POSITIONS_KEYS
+from python_code.sampling import FalseFragmentsSampler
+
+
+def encode_sequence(sequence_data: str) -> np.ndarray:
+    """
+    Encode DNA data as array of ASCII codes.
+
+    Args:
+        sequence_data: DNA data.
+
+    Returns:
+        1-D uint8 array.
+    """
+    return np.frombuffer(sequence_data.encode("ascii"), dtype=np.uint8)
+
+
+def find_fragment_positions_array(sequence_codes: np.ndarray, fragment: str) -> np.ndarray:
+    """
+    Find positions of ``fragment`` in encoded DNA data using vectorized comparisons.
+    Gives the same positions as ``find_fragment_positions`` for ``DONOR_SEQ`` and ``ACCEPTOR_SEQ``,
+    which can't overlap with themselves.
+
+    Args:
+        sequence_codes: DNA data encoded by ``encode_sequence``.
+        fragment: Fragment searched in ``sequence_codes`` - look ACCEPTOR_SEQ, DONOR_SEQ.
+
+    Returns:
+        Sorted array of positions.
+    """
+    fragment_codes = encode_sequence(fragment)
+    positions_num = len(sequence_codes) - len(fragment_codes) + 1
+    if positions_num <= 0:
+        return np.empty(0, dtype=np.int64)
+
+    mask = np.ones(positions_num, dtype=bool)
+    for shift, code in enumerate(fragment_codes):
+        mask &= sequence_codes[shift : shift + positions_num] == code
+    return np.flatnonzero(mask)
+
+
+def get_collisions_mask(
+    true_positions: np.ndarray, a_len: int, b_len: int, positions: np.ndarray, overlap_fragments: bool
+) -> np.ndarray:
+    """
+    Vectorized version of ``have_collisions_with_true_fragments`` using ``np.searchsorted``.
+
+    Args:
+        true_positions: Sorted array of true positions of donors/acceptors.
+        a_len: Left length of donor/acceptor.
+        b_len: Right length od donor/acceptor.
+        positions: Positions to check.
+        overlap_fragments: If true accept overlap fragments, if false don't accept overlap fragments.
+
+    Returns:
+        Boolean array, true for positions which have collision with true fragment.
+    """
+    window = 0 if overlap_fragments else a_len + b_len
+    if len(true_positions) == 0:
+        return np.zeros(len(positions), dtype=bool)
+
+    # first true position which is not before window
+    idx = np.searchsorted(true_positions, positions - window, side="left")
+    in_range = idx < len(true_positions)
+    collisions = np.zeros(len(positions), dtype=bool)
+    collisions[in_range] = true_positions[idx[in_range]] <= positions[in_range] + window
+    return collisions
+
+
+def get_edge_mask(a_len: int, b_len: int, positions: np.ndarray, seq_len: int) -> np.ndarray:
+    """
+    Vectorized version of ``is_fragment_outside_of_sequence``. Additionally position is rejected
+    when whole fragment doesn't fit in sequence - for A != B reference functions return
+    truncated or empty fragments in such case.
+
+    Args:
+        a_len: Left length of donor/acceptor.
+        b_len: Right length od donor/acceptor.
+        positions: Positions to check.
+        seq_len: Length of original DNA sequence.
+
+    Returns:
+        Boolean array, true for positions which give correct fragments.
+    """
+    return (
+        (positions + a_len < seq_len)
+        & (positions - b_len >= 0)
+        & (positions - a_len >= 0)
+        & (positions + b_len <= seq_len)
+    )
+
+
+def get_fragments_array(sequence_codes: np.ndarray, positions: np.ndarray, a_len: int, b_len: int) -> np.ndarray:
+    """
+    Cut fragments around ``positions`` with one indexing operation.
+
+    Args:
+        sequence_codes: DNA data encoded by ``encode_sequence``.
+        positions: Correct positions of fragments - look ``get_edge_mask``.
+        a_len: Left length of donor/acceptor.
+        b_len: Right length od donor/acceptor.
+
+    Returns:
+        2-D uint8 array, each row is one fragment.
+    """
+    return sequence_codes[positions[:, np.newaxis] + np.arange(-a_len, b_len)]
+
+
+def get_true_fragments_array(
+    true_positions: np.ndarray, a_len: int, b_len: int, sequence_codes: np.ndarray
+) -> np.ndarray:
+    """
+    Array version of ``get_true_fragments``.
+
+    Args:
+        true_positions: Array of true positions of donors/acceptors.
+        a_len: Left length of donor/acceptor.
+        b_len: Right length of donor/acceptor.
+        sequence_codes: DNA data encoded by ``encode_sequence``.
+
+    Returns:
+        2-D uint8 array of true fragments.
+    """
+    positions = true_positions[get_edge_mask(a_len, b_len, true_positions, len(sequence_codes))]
+    return get_fragments_array(sequence_codes, positions, a_len, b_len)
+
+
+def get_false_fragments_array(
+    true_positions: np.ndarray,
+    a_len: int,
+    b_len: int,
+    sequence_codes: np.ndarray,
+    fragment: str,
+    overlap_fragments: bool,
+    sampler: Optional[FalseFragmentsSampler] = None,
+    positions: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Array version of ``get_false_fragments``.
+
+    Args:
+        true_positions: Array of true positions of donors/acceptors.
+        a_len: Left length of donor/acceptor.
+        b_len: Right length of donor/acceptor.
+        sequence_codes: DNA data encoded by ``encode_sequence``.
+        fragment: Fragment searched in ``sequence_codes`` - look ACCEPTOR_SEQ, DONOR_SEQ.
+        overlap_fragments: If true generate overlap fragments, if false don't generate overlap fragments.
+        sampler: Sampler of false fragments, by default all false fragments are returned.
+        positions: Sorted positions of ``fragment`` found earlier, by default ``sequence_codes`` is scanned.
+
+    Returns:
+        2-D uint8 array of false fragments.
+    """
+    if positions is None:
+        positions = find_fragment_positions_array(sequence_codes, fragment)
+    mask = get_edge_mask(a_len, b_len, positions, len(sequence_codes))
+    mask &= ~get_collisions_mask(np.sort(true_positions), a_len, b_len, positions, overlap_fragments)
+    if sampler is None:
+        return get_fragments_array(sequence_codes, positions[mask], a_len, b_len)
+
+    true_fragments_num = int(get_edge_mask(a_len, b_len, true_positions, len(sequence_codes)).sum())
+    # drawn fragments are copied, so reservoir doesn't keep whole sequences
+    fragments = sampler.sample(
+        positions[mask].tolist(), true_fragments_num, lambda pos: sequence_codes[pos - a_len : pos + b_len].copy()
+    )
+    return np.array(fragments, dtype=np.uint8).reshape(-1, a_len + b_len)
+
+
+def get_fragments_arrays(
+    a_len: int,
+    b_len: int,
+    dna_sequences: Iterable[Dict],
+    fragment: str,
+    overlap_fragments: bool,
+    sampler: Optional[FalseFragmentsSampler] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Array version of ``get_donors`` and ``get_acceptors``.
+
+    Args:
+        a_len: Left length of donor/acceptor.
+        b_len: Right length of donor/acceptor.
+        dna_sequences: Sequences read from data file, each element is map which
+        contains "Introns", "Exons", "Data" - list or iterator from ``dna_data_iter``.
+        fragment: ``DONOR_SEQ`` for donors or ``ACCEPTOR_SEQ`` for acceptors.
+        overlap_fragments: If true generate overlap fragments, if false don't generate overlap fragments.
+        sampler: Sampler of false fragments, by default all false fragments are returned.
+
+    Returns:
+        True fragments, false fragments as 2-D uint8 arrays.
+    """
+    true_fragments: List[np.ndarray] = [np.empty((0, a_len + b_len), dtype=np.uint8)]
+    false_fragments: List[np.ndarray] = [np.empty((0, a_len + b_len), dtype=np.uint8)]
+    for dna_sequence in dna_sequences:
+        sequence_codes = encode_sequence(dna_sequence["Sequence"])
+        if fragment == DONOR_SEQ:
+            true_positions = np.array([x[0] for x in dna_sequence["Introns"]], dtype=np.int64)
+        else:
+            # IMPORTANT -1!!!
+            true_positions = np.array([x[1] - 1 for x in dna_sequence["Introns"]], dtype=np.int64)
+
+        # positions added from motif index - look ``motif_index.attach_motif_positions``
+        positions = dna_sequence.get(MOTIF_POSITIONS_KEYS[fragment])
+
+        true_fragments.append(get_true_fragments_array(true_positions, a_len, b_len, sequence_codes))
+        false_fragments.append(
+            get_false_fragments_array(
+                true_positions,
+                a_len,
+                b_len,
+                sequence_codes,
+                fragment,
+                overlap_fragments,
+                sampler,
+                None if positions is None else np.array(positions, dtype=np.int64),
+            )
+        )
+    if sampler is not None:
+        false_fragments.append(np.array(sampler.finish(), dtype=np.uint8).reshape(-1, a_len + b_len))
+
+    return np.concatenate(true_fragments), np.concatenate(false_fragments)
+
+
+def fragments_array_to_list(fragments: np.ndarray) -> List[str]:
+    """
+    Convert 2-D array of fragments to list of strings.
+
+    Args:
+        fragments: 2-D uint8 array of fragments.
+
+    Returns:
+        List of fragments.
+    """
+    if fragments.shape[1] == 0:
+        return ["" for _ in range(len(fragments))]
+    return [x.decode("ascii") for x in np.ascontiguousarray(fragments).view(f"S{fragments.shape[1]}").ravel()]
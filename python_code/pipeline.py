@@ -0,0 +1,406 @@
+import argparse
+import os
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from python_code.binary_fragments import fragments_list_to_array, save_fragments_binary
+from python_code.compression import open_file
+from python_code.cross_validation import DEFAULT_FOLDS_NUM, cross_validate_naive_bayes, stratified_split
+from python_code.features import NUMBERS_FEATURES, fragments_to_features
+from python_code.get_acceptors_and_donors import (
+    ACCEPTOR_SEQ,
+    DEFAULT_CACHE_SIZE_MB,
+    DONOR_SEQ,
+    NUMPY_ENGINE,
+    PYTHON_ENGINE,
+    DnaFragmentType,
+    dna_data_iter,
+    get_acceptors,
+    get_donors,
+    parser_check_if_file_exists,
+)
+from python_code.markov_model import DEFAULT_MARKOV_ORDER, MarkovModel
+from python_code.naive_bayes import CategoricalNaiveBayes
+from python_code.profiler import StageProfiler, profile_stage
+from python_code.report import create_report_file
+
+# validation methods - like ``main.R``: simple validation on train/test split and cross validation
+SIMPLE_VALIDATION: str = "sv"
+CROSS_VALIDATION: str = "cv"
+
+# models: naive bayes and inhomogeneous markov model, names are also prefixes of report files
+NAIVE_BAYES_MODEL: str = "nb"
+MARKOV_MODEL: str = "markov"
+
+# prefix of report directory, it gets time suffix - like ``run.sh``
+REPORT_DIR_PREFIX: str = "report_"
+# additional report file - like ``run.sh``
+REPORT_FILE: str = "report.txt"
+# prefix of files created by ``report.create_report_file`` for naive bayes
+REPORT_PREFIX: str = NAIVE_BAYES_MODEL
+
+
+def get_report_dir_name(report_root: str = ".") -> str:
+    """
+    Get name of report directory with current time like ``report_2020_01_31_12_00_00``.
+
+    Args:
+        report_root: Directory in which report directory is created.
+
+    Returns:
+        Path of report directory.
+    """
+    return os.path.join(report_root, REPORT_DIR_PREFIX + time.strftime("%Y_%m_%d_%H_%M_%S"))
+
+
+def extract_fragments(
+    input_path: str,
+    a_len: int,
+    b_len: int,
+    fragment_type: str,
+    overlap_fragments: bool,
+    engine: str = PYTHON_ENGINE,
+    cache_dir: Optional[str] = None,
+    cache_size: int = DEFAULT_CACHE_SIZE_MB,
+    motif_index: bool = False,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Read input file and get true and false fragments as arrays, when ``cache_dir`` is given fragments
+    are read from cache or saved to it - look ``fragments_cache``.
+
+    Args:
+        input_path: Path to file with sequences, can be compressed.
+        a_len: Left length of donor/acceptor.
+        b_len: Right length of donor/acceptor.
+        fragment_type: Name of ``DnaFragmentType``.
+        overlap_fragments: If true generate overlap fragments, if false don't generate overlap fragments.
+        engine: ``PYTHON_ENGINE`` or ``NUMPY_ENGINE``.
+        cache_dir: Cache directory, by default cache isn't used.
+        cache_size: Size limit of cache directory in MB.
+        motif_index: If true read positions of donor and acceptor sequences from motif index created
+        next to input file - look ``motif_index.get_motif_index``.
+
+    Returns:
+        True fragments, false fragments as 2-D uint8 arrays.
+    """
+    if cache_dir is not None:
+        from python_code.fragments_cache import FragmentsCache, get_cache_key, get_file_digest
+
+        cache = FragmentsCache(cache_dir, cache_size * 1024 * 1024)
+        cache_key = get_cache_key(
+            get_file_digest(input_path), a_len, b_len, fragment_type, overlap_fragments, engine
+        )
+        fragments = cache.load(cache_key)
+        if fragments is not None:
+            return fragments
+
+    with open_file(input_path) as dna_file:
+        dna_sequences = dna_data_iter(dna_file)
+        if motif_index:
+            from python_code.motif_index import attach_motif_positions, get_motif_index
+
+            dna_sequences = attach_motif_positions(dna_sequences, get_motif_index(input_path))
+        if engine == NUMPY_ENGINE:
+            from python_code.numpy_fragments import get_fragments_arrays
+
+            fragment = DONOR_SEQ if fragment_type == DnaFragmentType.DONOR.name else ACCEPTOR_SEQ
+            true_fragments, false_fragments = get_fragments_arrays(
+                a_len, b_len, dna_sequences, fragment, overlap_fragments
+            )
+        else:
+            get_fragments = get_donors if fragment_type == DnaFragmentType.DONOR.name else get_acceptors
+            true_list, false_list = get_fragments(a_len, b_len, dna_sequences, overlap_fragments)
+            true_fragments = fragments_list_to_array(true_list, a_len + b_len, skip_cut=True)
+            false_fragments = fragments_list_to_array(false_list, a_len + b_len, skip_cut=True)
+
+    if cache_dir is not None:
+        cache.store(
+            cache_key,
+            true_fragments,
+            false_fragments,
+            a_len,
+            b_len,
+            DnaFragmentType[fragment_type].value,
+            overlap_fragments,
+        )
+    return true_fragments, false_fragments
+
+
+def create_model(
+    model_name: str = NAIVE_BAYES_MODEL, laplace: float = 0.0, order: int = DEFAULT_MARKOV_ORDER
+) -> CategoricalNaiveBayes:
+    """
+    Create not trained model.
+
+    Args:
+        model_name: ``NAIVE_BAYES_MODEL`` or ``MARKOV_MODEL``.
+        laplace: Laplace smoothing value.
+        order: Order of markov model.
+
+    Returns:
+        Model.
+    """
+    if model_name == MARKOV_MODEL:
+        return MarkovModel(order=order, laplace=laplace)
+    return CategoricalNaiveBayes(laplace=laplace)
+
+
+def validate_naive_bayes(
+    features: np.ndarray,
+    labels: np.ndarray,
+    validation: str,
+    laplace: float = 0.0,
+    folds_num: int = DEFAULT_FOLDS_NUM,
+    train_prop: float = 0.5,
+    seed: Optional[int] = None,
+    model: Optional[CategoricalNaiveBayes] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Validate naive bayes like ``train_test_validation_nb`` or ``cross_validation`` in R.
+
+    Args:
+        features: 2-D array of codes, each row is one fragment.
+        labels: Labels, 1 for true and 0 for false fragments.
+        validation: ``SIMPLE_VALIDATION`` or ``CROSS_VALIDATION``.
+        laplace: Laplace smoothing value.
+        folds_num: Number of folds of cross validation.
+        train_prop: Proportion of train set of simple validation.
+        seed: Seed of random generator.
+        model: Not trained model validated instead of naive bayes with ``laplace`` - look ``create_model``.
+
+    Returns:
+        Predicted labels, probabilities of true class and true labels of validated fragments.
+    """
+    if model is None:
+        model = CategoricalNaiveBayes(laplace=laplace)
+
+    if validation == CROSS_VALIDATION:
+        proba, _ = cross_validate_naive_bayes(features, labels, folds_num, laplace, seed, model=model)
+        test_labels = labels
+    else:
+        train = stratified_split(labels, train_prop, seed)
+        model.fit(features[train], labels[train])
+        proba = model.predict_proba(features[~train])
+        test_labels = labels[~train]
+
+    # like ``predict`` in R, first class wins ties
+    predicted = (proba[:, 1] > proba[:, 0]).astype(np.uint8)
+    return predicted, proba[:, 1], test_labels
+
+
+def save_run_description(report_dir: str, description: Dict[str, str]) -> None:
+    """
+    Append description of run to ``REPORT_FILE`` - like ``run.sh``.
+
+    Args:
+        report_dir: Report directory.
+        description: Dictionary: {"A", "B", "Type", "Overlap", "Validation"}.
+    """
+    with open(os.path.join(report_dir, REPORT_FILE), "a") as report_f:
+        report_f.write(f"A length: {description['A']}, B length: {description['B']}\n")
+        report_f.write(f"Type: {description['Type']}\n")
+        report_f.write(f"Overlap: {description['Overlap']}\n")
+        report_f.write(f"Validation: {description['Validation']}\n")
+
+
+def pipeline_command(command_args: List[str]) -> None:
+    """
+    Create parser, parse args given in ``command_args`` and run whole experiment in one process: get fragments,
+    encode them as numbers, train and validate naive bayes or markov model and create report in
+    ``report_<time>`` directory.
+    Fragments are passed between stages as arrays and saved in report directory in binary format.
+
+    Args:
+        command_args: Arguments for command.
+    """
+    # create parser
+    parser = argparse.ArgumentParser()
+
+    # input file argument
+    parser.add_argument(
+        "-i",
+        "--input",
+        required=True,
+        help="input file with sequences",
+        type=lambda x: parser_check_if_file_exists(parser, x),
+    )
+
+    # A length argument
+    parser.add_argument("-A", "--a_len", default=190, help="'left' length of donor/acceptor", type=int)
+
+    # B length argument
+    parser.add_argument("-B", "--b_len", default=190, help="'right' length of donor/acceptor", type=int)
+
+    # type
+    parser.add_argument(
+        "-t",
+        "--type",
+        default=DnaFragmentType.ACCEPTOR.name,
+        help="type of DNA fragment",
+        choices=[dft.name for dft in DnaFragmentType],
+    )
+
+    # overlap
+    parser.add_argument(
+        "-o",
+        "--overlap",
+        action="store_true",
+        default=False,
+        help="if flag use generate addition false donors/acceptors with overlap fragments with true donors/acceptors",
+    )
+
+    # validation
+    parser.add_argument(
+        "-v",
+        "--validation",
+        default=CROSS_VALIDATION,
+        help=f"validation method, {SIMPLE_VALIDATION} - simple validation, {CROSS_VALIDATION} - cross validation",
+        choices=[SIMPLE_VALIDATION, CROSS_VALIDATION],
+    )
+
+    # folds
+    parser.add_argument("-k", "--folds", default=DEFAULT_FOLDS_NUM, help="number of folds", type=int)
+
+    # train proportion
+    parser.add_argument("--split", default=0.5, help="proportion of train set of simple validation", type=float)
+
+    # laplace
+    parser.add_argument("-l", "--laplace", default=0.0, help="laplace smoothing value", type=float)
+
+    # model
+    parser.add_argument(
+        "-m",
+        "--model",
+        default=NAIVE_BAYES_MODEL,
+        help=f"validated model, {NAIVE_BAYES_MODEL} - naive bayes, {MARKOV_MODEL} - inhomogeneous markov model, "
+        "name of model is prefix of report file",
+        choices=[NAIVE_BAYES_MODEL, MARKOV_MODEL],
+    )
+
+    # markov order
+    parser.add_argument(
+        "--order", default=DEFAULT_MARKOV_ORDER, help="order of markov model", choices=[1, 2], type=int
+    )
+
+    # seed
+    parser.add_argument("-s", "--seed", default=None, help="seed of random generator", type=int)
+
+    # report root
+    parser.add_argument(
+        "-r", "--report_root", default=".", help="directory in which report directory is created", type=str
+    )
+
+    # engine
+    parser.add_argument(
+        "-e",
+        "--engine",
+        help=f"engine used to get fragments, {NUMPY_ENGINE} engine skips fragments which don't fit in sequence",
+        choices=[PYTHON_ENGINE, NUMPY_ENGINE],
+        default=PYTHON_ENGINE,
+    )
+
+    # cache directory
+    parser.add_argument("--cache_dir", default=None, help="directory with cached fragments", type=str)
+
+    # cache size
+    parser.add_argument(
+        "--cache_size",
+        help="size limit of cache directory in MB, least recently used fragments are removed above it",
+        default=DEFAULT_CACHE_SIZE_MB,
+        type=int,
+    )
+
+    # use motif index
+    parser.add_argument(
+        "--motif_index",
+        action="store_true",
+        default=False,
+        help="if flag read positions of donor and acceptor sequences from motif index created next to input file",
+    )
+
+    # plot
+    parser.add_argument(
+        "--plot", action="store_true", default=False, help="if flag save ROC and PR curves, needs matplotlib"
+    )
+
+    # profile
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        default=False,
+        help="if flag save wall time and peak memory of stages as profile.json in report directory",
+    )
+
+    # parse arguments
+    args = parser.parse_args(command_args)
+
+    profiler = StageProfiler() if args.profile else None
+
+    print("Running data generation ...")
+    with profile_stage(profiler, "extract"):
+        true_fragments, false_fragments = extract_fragments(
+            args.input,
+            args.a_len,
+            args.b_len,
+            args.type,
+            args.overlap,
+            args.engine,
+            args.cache_dir,
+            args.cache_size,
+            args.motif_index,
+        )
+
+    # report directory is created only when fragments were generated
+    report_dir = get_report_dir_name(args.report_root)
+    print(f"Creating report folder: {report_dir} ...")
+    os.makedirs(report_dir)
+
+    with profile_stage(profiler, "write"):
+        save_fragments_binary(
+            true_fragments,
+            false_fragments,
+            os.path.join(report_dir, f"{args.type.lower()}.dat"),
+            args.a_len,
+            args.b_len,
+            DnaFragmentType[args.type].value,
+            args.overlap,
+        )
+
+    print("Running classification ...")
+    with profile_stage(profiler, "encode"):
+        features, labels = fragments_to_features(true_fragments, false_fragments, NUMBERS_FEATURES)
+    with profile_stage(profiler, "validate"):
+        predicted, scores, test_labels = validate_naive_bayes(
+            features,
+            labels,
+            args.validation,
+            args.laplace,
+            args.folds,
+            args.split,
+            args.seed,
+            create_model(args.model, args.laplace, args.order),
+        )
+
+    with profile_stage(profiler, "report"):
+        create_report_file(predicted, scores, test_labels, report_dir, args.model, args.plot)
+        save_run_description(
+            report_dir,
+            {
+                "A": str(args.a_len),
+                "B": str(args.b_len),
+                "Type": args.type,
+                "Overlap": "-o" if args.overlap else "",
+                "Validation": args.validation,
+            },
+        )
+
+    if profiler is not None:
+        profiler.save(os.path.join(report_dir, "profile.json"))
+    print("Done!")
+
+
+if __name__ == "__main__":
+    pipeline_command(sys.argv[1:])
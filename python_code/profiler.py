@@ -0,0 +1,204 @@
+import json
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional
+
+
+class NullStage:
+    """
+    Context which does nothing, like ``contextlib.nullcontext`` which is missing in python 3.6.
+    """
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *args) -> None:
+        return None
+
+
+# context used instead of stage when profiler is off
+NULL_STAGE = NullStage()
+
+
+class StageProfiler:
+    """
+    Measure wall time, peak memory and number of calls of named stages and count events. Time of stage
+    doesn't contain time of stages started inside it, peak memory of stage contains memory of stages started
+    inside it. Memory is measured with ``tracemalloc``, which slows down allocations, so profiler should be
+    created only on demand - functions take optional profiler and use ``profile_stage``.
+    """
+
+    def __init__(self, trace_memory: bool = True):
+        """
+        Args:
+            trace_memory: If true measure peak memory with ``tracemalloc``.
+        """
+        self.stages: Dict[str, Dict] = {}
+        self.counters: Dict[str, int] = {}
+        self.trace_memory = trace_memory
+        self.peak_memory = 0
+        # started stages: [name, start time of not counted part, peak memory]
+        self._stack: List[List] = []
+        self._start_time = time.perf_counter()
+        self._own_tracing = trace_memory and not tracemalloc.is_tracing()
+        if self._own_tracing:
+            tracemalloc.start()
+
+    def _get_peak_memory(self) -> int:
+        """
+        Get peak of traced memory since last reset and reset it.
+
+        Returns:
+            Peak memory in bytes.
+        """
+        if not self.trace_memory:
+            return 0
+        peak = tracemalloc.get_traced_memory()[1]
+        # reset_peak is available since python 3.9, without it peak is global
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        self.peak_memory = max(self.peak_memory, peak)
+        return peak
+
+    def _get_stage(self, name: str) -> Dict:
+        """
+        Args:
+            name: Name of stage.
+
+        Returns:
+            Measurements of stage, created when stage wasn't started before.
+        """
+        if name not in self.stages:
+            self.stages[name] = {"time": 0.0, "calls": 0, "peak_memory": 0}
+        return self.stages[name]
+
+    def enter(self, name: str) -> None:
+        """
+        Start stage, time of current stage is paused until ``exit``.
+
+        Args:
+            name: Name of stage.
+        """
+        now = time.perf_counter()
+        peak = self._get_peak_memory()
+        if self._stack:
+            parent = self._stack[-1]
+            self._get_stage(parent[0])["time"] += now - parent[1]
+            parent[2] = max(parent[2], peak)
+        self._stack.append([name, now, 0])
+
+    def exit(self) -> None:
+        """
+        Finish last started stage.
+        """
+        now = time.perf_counter()
+        name, start, peak = self._stack.pop()
+        peak = max(peak, self._get_peak_memory())
+
+        stage = self._get_stage(name)
+        stage["time"] += now - start
+        stage["calls"] += 1
+        stage["peak_memory"] = max(stage["peak_memory"], peak)
+        if self._stack:
+            parent = self._stack[-1]
+            parent[1] = now
+            parent[2] = max(parent[2], peak)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Context manager which measures stage.
+
+        Args:
+            name: Name of stage.
+        """
+        self.enter(name)
+        try:
+            yield
+        finally:
+            self.exit()
+
+    def iter_stage(self, name: str, iterable: Iterable, counter: Optional[str] = None) -> Iterator:
+        """
+        Measure getting of each element from ``iterable`` as stage, useful for generators which read data.
+
+        Args:
+            name: Name of stage.
+            iterable: Measured iterable.
+            counter: Name of counter increased for each element, by default elements aren't counted.
+
+        Returns:
+            Iterator of elements of ``iterable``.
+        """
+        iterator = iter(iterable)
+        while True:
+            self.enter(name)
+            try:
+                element = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.exit()
+            if counter is not None:
+                self.count(counter)
+            yield element
+
+    def count(self, name: str, value: int = 1) -> None:
+        """
+        Increase counter.
+
+        Args:
+            name: Name of counter.
+            value: Value added to counter.
+        """
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def report(self) -> Dict:
+        """
+        Returns:
+            Dictionary: {"total_time", "peak_memory", "stages": {name: {"time", "calls", "peak_memory"}},
+            "counters": {name: value}}, times are in seconds and memory in bytes.
+        """
+        if self.trace_memory and tracemalloc.is_tracing():
+            self._get_peak_memory()
+        return {
+            "total_time": time.perf_counter() - self._start_time,
+            "peak_memory": self.peak_memory,
+            "stages": self.stages,
+            "counters": self.counters,
+        }
+
+    def save(self, output: str) -> None:
+        """
+        Save report as JSON and stop memory tracing started by profiler.
+
+        Args:
+            output: Output file name, "-" - standard error.
+        """
+        report = self.report()
+        if self._own_tracing:
+            tracemalloc.stop()
+            self._own_tracing = False
+
+        if output == "-":
+            json.dump(report, sys.stderr, indent=2)
+            sys.stderr.write("\n")
+        else:
+            with open(output, "w") as report_f:
+                json.dump(report, report_f, indent=2)
+
+
+def profile_stage(profiler: Optional[StageProfiler], name: str):
+    """
+    Get context which measures stage, when profiler is off context does nothing.
+
+    Args:
+        profiler: Profiler or None.
+        name: Name of stage.
+
+    Returns:
+        Context manager.
+    """
+    return NULL_STAGE if profiler is None else profiler.stage(name)
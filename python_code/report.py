@@ -0,0 +1,498 @@
+import argparse
+import math
+import os
+import sys
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from python_code.features import load_features
+from python_code.get_acceptors_and_donors import parser_check_if_file_exists
+
+# default probability of true class above which fragment is predicted as true
+DEFAULT_CLASS_THRESHOLD: float = 0.5
+
+# confidence level of accuracy interval - like ``caret::confusionMatrix``
+CONFIDENCE_LEVEL: float = 0.95
+
+# number of significant digits of confusion matrix statistics - like ``caret::confusionMatrix``
+STATISTICS_DIGITS: int = 4
+
+# number of significant digits of auc values - like ``print`` of data frame in R
+AUC_DIGITS: int = 7
+
+# smallest printed p-value - like ``format.pval`` in R
+MIN_PVALUE: float = 2.2e-16
+
+# size of plot in inches and its resolution - like ``png(width=3000, height=1500, res=300)``
+PLOT_SIZE: Tuple[int, int] = (10, 5)
+PLOT_DPI: int = 300
+
+
+def threshold_sweep(scores: np.ndarray, labels: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Compute precision, recall and F1 for every cutoff of scores from one sort of scores. Fragment is
+    predicted as true when its score is not lower than cutoff, fragments with equal scores are
+    always on the same side of cutoff.
+
+    Args:
+        scores: Scores of fragments, higher score - more likely true fragment.
+        labels: Labels, 1 for true and 0 for false fragments.
+
+    Returns:
+        Dictionary of arrays with one value per distinct score, from highest to lowest:
+        {"thresholds", "tp", "fp", "tpr", "fpr", "precision", "recall", "f1"}.
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    labels = np.asarray(labels, dtype=np.int64)
+    order = np.argsort(-scores, kind="mergesort")
+    sorted_scores = scores[order]
+
+    tp = np.cumsum(labels[order])
+    fp = np.arange(1, len(labels) + 1) - tp
+    # last fragment of each group of equal scores
+    last = np.append(np.flatnonzero(np.diff(sorted_scores)), len(sorted_scores) - 1) if len(scores) else []
+    tp, fp = tp[last], fp[last]
+
+    positives_num = tp[-1] if len(tp) else 0
+    negatives_num = fp[-1] if len(fp) else 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        precision = tp / (tp + fp)
+        recall = tp / positives_num if positives_num else np.zeros(len(tp))
+        fpr = fp / negatives_num if negatives_num else np.zeros(len(fp))
+        f1 = np.nan_to_num(2 * precision * recall / (precision + recall))
+
+    return {
+        "thresholds": sorted_scores[last],
+        "tp": tp,
+        "fp": fp,
+        "tpr": recall,
+        "fpr": fpr,
+        "precision": precision,
+        "recall": recall,
+        "f1": f1,
+    }
+
+
+def trapezoid_area(x: np.ndarray, y: np.ndarray) -> float:
+    """
+    Compute area under curve given by points with trapezoidal rule.
+
+    Args:
+        x: X coordinates of points, sorted.
+        y: Y coordinates of points.
+
+    Returns:
+        Area under curve.
+    """
+    return float(np.sum(np.diff(x) * (y[1:] + y[:-1]) / 2))
+
+
+def roc_auc(sweep: Dict[str, np.ndarray]) -> float:
+    """
+    Compute area under ROC curve.
+
+    Args:
+        sweep: Result of ``threshold_sweep``.
+
+    Returns:
+        ROC AUC.
+    """
+    return trapezoid_area(np.append(0.0, sweep["fpr"]), np.append(0.0, sweep["tpr"]))
+
+
+def pr_auc(sweep: Dict[str, np.ndarray]) -> float:
+    """
+    Compute area under precision-recall curve, curve starts at recall 0 with precision of first
+    cutoff - like ``precrec``.
+
+    Args:
+        sweep: Result of ``threshold_sweep``.
+
+    Returns:
+        PR AUC.
+    """
+    if not len(sweep["precision"]):
+        return 0.0
+    return trapezoid_area(np.append(0.0, sweep["recall"]), np.append(sweep["precision"][0], sweep["precision"]))
+
+
+def confusion_matrix(predicted: np.ndarray, labels: np.ndarray) -> np.ndarray:
+    """
+    Create confusion matrix like ``table(pred_class, true_class)`` in R.
+
+    Args:
+        predicted: Predicted labels.
+        labels: True labels, 1 for true and 0 for false fragments.
+
+    Returns:
+        2x2 array, rows - predicted class, columns - true class.
+    """
+    idx = 2 * np.asarray(predicted, dtype=np.intp) + np.asarray(labels, dtype=np.intp)
+    return np.bincount(idx, minlength=4).reshape(2, 2)
+
+
+def binomial_log_coefficients(n: int) -> np.ndarray:
+    """
+    Compute logs of binomial coefficients with cumulative sum.
+
+    Args:
+        n: Number of trials.
+
+    Returns:
+        Array of ``log(n choose k)`` for k from 0 to n.
+    """
+    k = np.arange(1, n + 1)
+    return np.append(0.0, np.cumsum(np.log(n - k + 1) - np.log(k)))
+
+
+def binomial_upper_tail(x: int, n: int, p: float, log_coefficients: Optional[np.ndarray] = None) -> float:
+    """
+    Compute probability of at least ``x`` successes in ``n`` trials.
+
+    Args:
+        x: Number of successes.
+        n: Number of trials.
+        p: Probability of success.
+        log_coefficients: Result of ``binomial_log_coefficients``, computed when not given.
+
+    Returns:
+        P(X >= x).
+    """
+    if x <= 0:
+        return 1.0
+    if x > n or p <= 0:
+        return 0.0
+    if p >= 1:
+        return 1.0
+    if log_coefficients is None:
+        log_coefficients = binomial_log_coefficients(n)
+    k = np.arange(x, n + 1)
+    log_pmf = log_coefficients[x:] + k * math.log(p) + (n - k) * math.log1p(-p)
+    return float(min(1.0, np.exp(np.logaddexp.reduce(log_pmf))))
+
+
+def binomial_confidence_interval(x: int, n: int, level: float = CONFIDENCE_LEVEL) -> Tuple[float, float]:
+    """
+    Compute exact (Clopper-Pearson) confidence interval of probability of success by bisection
+    - like ``binom.test``.
+
+    Args:
+        x: Number of successes.
+        n: Number of trials.
+        level: Confidence level.
+
+    Returns:
+        Lower and upper bound of interval.
+    """
+    alpha = (1 - level) / 2
+    log_coefficients = binomial_log_coefficients(n)
+
+    def bisect(tail, increasing: bool) -> float:
+        low, high = 0.0, 1.0
+        for _ in range(100):
+            middle = (low + high) / 2
+            if (tail(middle) < alpha) == increasing:
+                low = middle
+            else:
+                high = middle
+        return (low + high) / 2
+
+    lower = 0.0 if x == 0 else bisect(lambda p: binomial_upper_tail(x, n, p, log_coefficients), True)
+    upper = 1.0 if x == n else bisect(lambda p: 1 - binomial_upper_tail(x + 1, n, p, log_coefficients), False)
+    return lower, upper
+
+
+def confusion_matrix_statistics(matrix: np.ndarray, positive: int = 0) -> Dict[str, float]:
+    """
+    Compute statistics of confusion matrix like ``caret::confusionMatrix``.
+
+    Args:
+        matrix: Result of ``confusion_matrix``.
+        positive: Positive class, caret uses first level - 0.
+
+    Returns:
+        Dictionary with statistics, keys are names used by caret.
+    """
+    matrix = np.asarray(matrix, dtype=np.int64)
+    negative = 1 - positive
+    total = int(matrix.sum())
+    correct = int(np.trace(matrix))
+    tp, fn = matrix[positive, positive], matrix[negative, positive]
+    fp, tn = matrix[positive, negative], matrix[negative, negative]
+
+    def ratio(numerator: float, denominator: float) -> float:
+        return numerator / denominator if denominator else math.nan
+
+    accuracy = ratio(correct, total)
+    no_information_rate = ratio(matrix.sum(axis=0).max(), total)
+    expected_accuracy = ratio(float((matrix.sum(axis=0) * matrix.sum(axis=1)).sum()), total * total)
+    mcnemar_denominator = matrix[0, 1] + matrix[1, 0]
+    mcnemar = ratio((abs(int(matrix[0, 1]) - int(matrix[1, 0])) - 1) ** 2, mcnemar_denominator)
+    prevalence = ratio(tp + fn, total)
+    sensitivity = ratio(tp, tp + fn)
+    specificity = ratio(tn, tn + fp)
+    lower, upper = binomial_confidence_interval(correct, total) if total else (math.nan, math.nan)
+
+    return {
+        "Accuracy": accuracy,
+        "AccuracyLower": lower,
+        "AccuracyUpper": upper,
+        "AccuracyNull": no_information_rate,
+        "AccuracyPValue": binomial_upper_tail(correct, total, no_information_rate) if total else math.nan,
+        "Kappa": ratio(accuracy - expected_accuracy, 1 - expected_accuracy),
+        # chi-squared with 1 degree of freedom and continuity correction
+        "McnemarPValue": math.erfc(math.sqrt(mcnemar / 2)) if not math.isnan(mcnemar) else math.nan,
+        "Sensitivity": sensitivity,
+        "Specificity": specificity,
+        "Pos Pred Value": ratio(tp, tp + fp),
+        "Neg Pred Value": ratio(tn, tn + fn),
+        "Prevalence": prevalence,
+        "Detection Rate": ratio(tp, total),
+        "Detection Prevalence": ratio(tp + fp, total),
+        "Balanced Accuracy": (sensitivity + specificity) / 2,
+    }
+
+
+def format_r_number(value: float, digits: int = STATISTICS_DIGITS) -> str:
+    """
+    Format number with given number of significant digits like ``format`` in R.
+
+    Args:
+        value: Number to format.
+        digits: Number of significant digits.
+
+    Returns:
+        Formatted number.
+    """
+    if math.isnan(value):
+        return "NA"
+    return f"{value:.{digits}g}"
+
+
+def format_r_pvalue(value: float, digits: int = STATISTICS_DIGITS) -> str:
+    """
+    Format p-value like ``format.pval`` in R.
+
+    Args:
+        value: P-value to format.
+        digits: Number of significant digits.
+
+    Returns:
+        Formatted p-value.
+    """
+    if not math.isnan(value) and value < MIN_PVALUE:
+        return f"< {MIN_PVALUE}"
+    return format_r_number(value, digits)
+
+
+def format_auc_report(roc: float, pr: float) -> str:
+    """
+    Create text of aucs like ``print(auc(precrec_obj))`` in R.
+
+    Args:
+        roc: ROC AUC.
+        pr: PR AUC.
+
+    Returns:
+        Text of report.
+    """
+    rows = [["", "modnames", "dsids", "curvetypes", "aucs"]]
+    for number, (curve_type, auc) in enumerate([("ROC", roc), ("PRC", pr)], start=1):
+        rows.append([str(number), "m1", "1", curve_type, format_r_number(auc, AUC_DIGITS)])
+    widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+    return "".join(
+        " ".join([row[0].ljust(widths[0])] + [x.rjust(width) for x, width in zip(row[1:], widths[1:])]) + "\n"
+        for row in rows
+    )
+
+
+def format_confusion_matrix_report(matrix: np.ndarray, positive: int = 0) -> str:
+    """
+    Create text of confusion matrix and its statistics like ``print(caret::confusionMatrix(tab))`` in R.
+
+    Args:
+        matrix: Result of ``confusion_matrix``.
+        positive: Positive class - look ``confusion_matrix_statistics``.
+
+    Returns:
+        Text of report.
+    """
+    statistics = confusion_matrix_statistics(matrix, positive)
+    cells_width = max(len(str(x)) for x in [*matrix.ravel(), 0, 1])
+    rows_label = "pred_class"
+
+    lines = ["Confusion Matrix and Statistics", ""]
+    lines.append(" " * len(rows_label) + "true_class")
+    lines.append(rows_label + " " + " ".join(str(x).rjust(cells_width) for x in range(2)))
+    for row in range(2):
+        lines.append(str(row).rjust(len(rows_label)) + " " + " ".join(str(x).rjust(cells_width) for x in matrix[row]))
+
+    interval = (
+        f"({format_r_number(statistics['AccuracyLower'])}, {format_r_number(statistics['AccuracyUpper'])})"
+    )
+    values = [
+        ("", None),
+        ("Accuracy", format_r_number(statistics["Accuracy"])),
+        ("95% CI", interval),
+        ("No Information Rate", format_r_number(statistics["AccuracyNull"])),
+        ("P-Value [Acc > NIR]", format_r_pvalue(statistics["AccuracyPValue"])),
+        ("", None),
+        ("Kappa", format_r_number(statistics["Kappa"])),
+        ("", None),
+        ("Mcnemar's Test P-Value", format_r_pvalue(statistics["McnemarPValue"])),
+        ("", None),
+    ]
+    for name in [
+        "Sensitivity",
+        "Specificity",
+        "Pos Pred Value",
+        "Neg Pred Value",
+        "Prevalence",
+        "Detection Rate",
+        "Detection Prevalence",
+        "Balanced Accuracy",
+    ]:
+        values.append((name, format_r_number(statistics[name])))
+    values += [("", None), ("'Positive' Class", str(positive)), ("", None)]
+
+    names_width = max(len(name) for name, _ in values)
+    for name, value in values:
+        lines.append("" if value is None else f" {name.rjust(names_width)} : {value}")
+    return "\n".join(lines) + "\n"
+
+
+def save_plot(sweep: Dict[str, np.ndarray], plot_path: str) -> None:
+    """
+    Save ROC and precision-recall curves as png file, needs ``matplotlib``.
+
+    Args:
+        sweep: Result of ``threshold_sweep``.
+        plot_path: Path to png file.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    figure, (roc_axes, pr_axes) = plt.subplots(1, 2, figsize=PLOT_SIZE)
+    roc_axes.plot(np.append(0.0, sweep["fpr"]), np.append(0.0, sweep["tpr"]))
+    roc_axes.plot([0, 1], [0, 1], linestyle="dotted", color="grey")
+    roc_axes.set(title="ROC", xlabel="1 - Specificity", ylabel="Sensitivity", xlim=(0, 1), ylim=(0, 1))
+    pr_axes.plot(sweep["recall"], sweep["precision"])
+    pr_axes.set(title="Precision-Recall", xlabel="Recall", ylabel="Precision", xlim=(0, 1), ylim=(0, 1))
+    figure.tight_layout()
+    figure.savefig(plot_path, dpi=PLOT_DPI)
+    plt.close(figure)
+
+
+def create_report_file(
+    predicted: np.ndarray,
+    scores: np.ndarray,
+    labels: np.ndarray,
+    report_path: str,
+    prefix: str = "",
+    plot: bool = False,
+) -> Dict[str, np.ndarray]:
+    """
+    Create report files from classification results like ``create_report_file`` in R: ``<prefix>_report.txt``
+    with aucs and confusion matrix and optional ``<prefix>_plot.png`` with ROC and PR curves.
+
+    Args:
+        predicted: Predicted labels.
+        scores: Probabilities of true class.
+        labels: True labels, 1 for true and 0 for false fragments.
+        report_path: Path to report directory.
+        prefix: Prefix of report files.
+        plot: If true save plot, needs ``matplotlib``.
+
+    Returns:
+        Threshold sweep - look ``threshold_sweep``.
+    """
+    sweep = threshold_sweep(scores, labels)
+    if plot:
+        save_plot(sweep, os.path.join(report_path, f"{prefix}_plot.png"))
+
+    with open(os.path.join(report_path, f"{prefix}_report.txt"), "w") as report_f:
+        report_f.write(format_auc_report(roc_auc(sweep), pr_auc(sweep)))
+        report_f.write(format_confusion_matrix_report(confusion_matrix(predicted, labels)))
+    return sweep
+
+
+def save_threshold_sweep(sweep: Dict[str, np.ndarray], output: str) -> None:
+    """
+    Save threshold sweep as tab separated file with header.
+
+    Args:
+        sweep: Result of ``threshold_sweep``.
+        output: Output file name.
+    """
+    columns = ["thresholds", "tp", "fp", "precision", "recall", "f1"]
+    with open(output, "w") as sweep_f:
+        sweep_f.write("\t".join(columns) + "\n")
+        np.savetxt(sweep_f, np.column_stack([sweep[x] for x in columns]), fmt="%.6g", delimiter="\t")
+
+
+def report_command(command_args: List[str]) -> None:
+    """
+    Create parser, parse args given in ``command_args`` and create report from probabilities of true
+    class saved by ``cross_validation`` and labels saved by ``get_acceptors_and_donors``.
+
+    Args:
+        command_args: Arguments for command.
+    """
+    # create parser
+    parser = argparse.ArgumentParser()
+
+    # probabilities
+    parser.add_argument(
+        "-p",
+        "--proba",
+        required=True,
+        help=".npy file with probabilities of true class",
+        type=lambda x: parser_check_if_file_exists(parser, x),
+    )
+
+    # input
+    parser.add_argument(
+        "-i", "--input", required=True, help="result file of get_acceptors_and_donors saved with --features"
+    )
+
+    # report directory
+    parser.add_argument("-r", "--report", default=".", help="report directory", type=str)
+
+    # prefix
+    parser.add_argument("--prefix", default="nb", help="prefix of report files", type=str)
+
+    # threshold
+    parser.add_argument(
+        "--threshold",
+        default=DEFAULT_CLASS_THRESHOLD,
+        help="probability of true class above which fragment is predicted as true",
+        type=float,
+    )
+
+    # sweep
+    parser.add_argument("--sweep", default=None, help="output file with precision, recall and F1 of all cutoffs")
+
+    # plot
+    parser.add_argument(
+        "--plot", action="store_true", default=False, help="if flag save ROC and PR curves, needs matplotlib"
+    )
+
+    # parse arguments
+    args = parser.parse_args(command_args)
+
+    _, labels = load_features(args.input)
+    scores = np.load(args.proba)
+    if len(scores) != len(labels):
+        parser.error(f"Number of probabilities {len(scores)} is different than number of labels {len(labels)}!")
+
+    os.makedirs(args.report, exist_ok=True)
+    sweep = create_report_file(scores > args.threshold, scores, labels, args.report, args.prefix, args.plot)
+    if args.sweep is not None:
+        save_threshold_sweep(sweep, args.sweep)
+
+
+if __name__ == "__main__":
+    report_command(sys.argv[1:])
@@ -0,0 +1,97 @@
+import random
+from typing import Callable, Iterator, List, Optional, Sequence
+
+
+class FalseFragmentsSampler:
+    """
+    Downsample false fragments while they are generated, so not used false fragments are never cut
+    from sequence and stored. With ``count`` fixed number of false fragments is drawn uniformly from
+    all sequences by reservoir sampling, they are kept in sampler until ``finish``. With ``ratio``
+    each sequence gets quota of ``ratio`` false fragments per its true fragment, part of quota which
+    sequence can't use, because it has too few false fragments, is moved to next sequences.
+    """
+
+    def __init__(self, count: Optional[int] = None, ratio: Optional[float] = None, seed: Optional[int] = None):
+        """
+        Args:
+            count: Number of drawn false fragments.
+            ratio: Number of drawn false fragments per true fragment, used when ``count`` is None.
+            seed: Seed of random generator.
+        """
+        if (count is None) == (ratio is None):
+            raise ValueError("Exactly one of count and ratio has to be given!")
+        if (count is not None and count < 0) or (ratio is not None and ratio < 0):
+            raise ValueError("Count and ratio of false fragments can't be negative!")
+
+        self.count = count
+        self.ratio = ratio
+        self.seed = seed
+        self._rng = random.Random(seed)
+        # part of quota not used by previous sequences
+        self._quota = 0.0
+        # number of false fragments offered to reservoir
+        self._seen = 0
+        # reservoir: [number of fragment in stream, fragment]
+        self._reservoir: List[List] = []
+
+    def get_key(self) -> str:
+        """
+        Returns:
+            Parameters of sampler as text, used in keys of fragments cache.
+        """
+        return f"count={self.count},ratio={self.ratio},seed={self.seed}"
+
+    def sample(self, positions: Sequence[int], true_num: int, cut: Callable[[int], object]) -> List:
+        """
+        Sample false fragments of one sequence.
+
+        Args:
+            positions: Positions of all false fragments of sequence, in order of sequence.
+            true_num: Number of true fragments of sequence.
+            cut: Function which creates false fragment from its position, it is called only for
+            drawn positions.
+
+        Returns:
+            False fragments kept now in order of sequence, with ``count`` always empty list - drawn fragments
+            are returned by ``finish``.
+        """
+        if self.count is None:
+            self._quota += self.ratio * true_num
+            drawn_num = min(len(positions), int(self._quota))
+            self._quota -= drawn_num
+            if drawn_num == len(positions):
+                return [cut(pos) for pos in positions]
+            return [cut(positions[i]) for i in sorted(self._rng.sample(range(len(positions)), drawn_num))]
+
+        for pos in positions:
+            if len(self._reservoir) < self.count:
+                self._reservoir.append([self._seen, cut(pos)])
+            else:
+                i = self._rng.randrange(self._seen + 1)
+                if i < self.count:
+                    self._reservoir[i] = [self._seen, cut(pos)]
+            self._seen += 1
+        return []
+
+    def finish(self) -> List:
+        """
+        Get false fragments drawn with ``count`` and clear reservoir, so sampler can be used for next stream.
+
+        Returns:
+            Drawn false fragments in order in which they were generated, with ``ratio`` empty list.
+        """
+        fragments = [fragment for _, fragment in sorted(self._reservoir, key=lambda x: x[0])]
+        self._reservoir = []
+        self._seen = 0
+        self._quota = 0.0
+        return fragments
+
+    def iter_finish(self) -> Iterator:
+        """
+        Lazy version of ``finish`` - reservoir is read when iterator is started, so it can be chained after
+        iterator of fragments which are sampled.
+
+        Returns:
+            Iterator of drawn false fragments.
+        """
+        yield from self.finish()
@@ -0,0 +1,221 @@
+import argparse
+import itertools
+import sys
+import time
+from typing import Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+from python_code.compression import open_file
+from python_code.features import NUMBER_TABLE
+from python_code.get_acceptors_and_donors import (
+    ACCEPTOR_SEQ,
+    DONOR_SEQ,
+    DnaFragmentType,
+    parser_check_if_file_exists,
+)
+from python_code.naive_bayes import load_naive_bayes
+from python_code.numpy_fragments import encode_sequence, find_fragment_positions_array
+
+# default number of bases read at once
+DEFAULT_SCAN_CHUNK_SIZE: int = 1024 * 1024
+
+# default minimal log-odds of reported hits
+DEFAULT_SCAN_THRESHOLD: float = 0.0
+
+
+def iter_sequence_chunks(file, chunk_size: int = DEFAULT_SCAN_CHUNK_SIZE) -> Iterator[Tuple[int, str, str]]:
+    """
+    Read raw sequences from FASTA like ``file`` in chunks of about ``chunk_size`` bases. Lines starting
+    with ``>`` begin new sequence, file without header lines is one sequence.
+
+    Args:
+        file: Open file like object with sequences.
+        chunk_size: Number of bases in chunk.
+
+    Returns:
+        Iterator of (number of sequence, name of sequence, chunk of bases).
+    """
+    number = 0
+    name = ""
+    chunk_lines: List[str] = []
+    chunk_len = 0
+    for line in file:
+        line = line.strip()
+        if line.startswith(">"):
+            if chunk_lines:
+                yield number, name, "".join(chunk_lines)
+            number += 1
+            name = line[1:].strip()
+            chunk_lines = []
+            chunk_len = 0
+        elif line:
+            chunk_lines.append(line.upper())
+            chunk_len += len(line)
+            if chunk_len >= chunk_size:
+                yield number, name, "".join(chunk_lines)
+                chunk_lines = []
+                chunk_len = 0
+
+    if chunk_lines:
+        yield number, name, "".join(chunk_lines)
+
+
+def scan_sequence(
+    chunks: Iterable[str],
+    log_odds_table: np.ndarray,
+    log_prior_odds: float,
+    a_len: int,
+    fragment: str,
+    threshold: float = DEFAULT_SCAN_THRESHOLD,
+) -> Iterator[Tuple[int, float]]:
+    """
+    Find all ``fragment`` positions in sequence given in chunks and score fragments around them with
+    per position log-odds table. Last bases of each chunk are kept, so fragments crossing chunk
+    boundaries are scored once and memory doesn't depend on length of sequence.
+
+    Args:
+        chunks: Consecutive chunks of one sequence.
+        log_odds_table: Log-odds of true class for each position and code - look
+        ``CategoricalNaiveBayes.log_odds_table``, it has A + B rows.
+        log_prior_odds: Log of prior odds of true class.
+        a_len: Left length of donor/acceptor, right length is rows of ``log_odds_table`` minus ``a_len``.
+        fragment: Fragment searched in sequence - look ACCEPTOR_SEQ, DONOR_SEQ.
+        threshold: Minimal log-odds of reported positions.
+
+    Returns:
+        Iterator of (position of fragment in sequence, log-odds), in order of positions.
+    """
+    b_len = log_odds_table.shape[0] - a_len
+    right_len = max(b_len, len(fragment))
+    window = np.arange(-a_len, b_len)
+    flat_table = log_odds_table.ravel()
+    table_offsets = np.arange(log_odds_table.shape[0]) * log_odds_table.shape[1]
+
+    carry = ""
+    # position of first base of ``carry`` in sequence
+    offset = 0
+    # positions before it were already checked
+    next_position = 0
+    for chunk in chunks:
+        buffer = carry + chunk
+        sequence_codes = encode_sequence(buffer)
+
+        positions = find_fragment_positions_array(sequence_codes, fragment)
+        positions = positions[
+            (positions + offset >= next_position) & (positions >= a_len) & (positions + right_len <= len(buffer))
+        ]
+        if len(positions):
+            codes = NUMBER_TABLE[sequence_codes[positions[:, np.newaxis] + window]]
+            scores = flat_table[table_offsets + codes].sum(axis=1) + log_prior_odds
+            hits = scores >= threshold
+            yield from zip((positions[hits] + offset).tolist(), scores[hits].tolist())
+
+        # positions which need bases from next chunk
+        next_position = max(next_position, offset + len(buffer) - right_len + 1)
+        keep = a_len + right_len - 1
+        carry = buffer[-keep:] if keep > 0 else ""
+        offset += len(buffer) - len(carry)
+
+
+def scan_command(command_args: List[str]) -> None:
+    """
+    Create parser, parse args given in ``command_args`` and scan raw sequences with trained naive
+    bayes model. Hits are saved as lines ``<sequence name>\\t<position>\\t<log-odds>``, throughput
+    is printed to stderr.
+
+    Args:
+        command_args: Arguments for command.
+    """
+    # create parser
+    parser = argparse.ArgumentParser()
+
+    # model
+    parser.add_argument(
+        "-m",
+        "--model",
+        required=True,
+        help="naive bayes model trained on numbers features",
+        type=lambda x: parser_check_if_file_exists(parser, x),
+    )
+
+    # A length argument
+    parser.add_argument(
+        "-A", "--a_len", help="'left' length of donor/acceptor used to train model", required=True, type=int
+    )
+
+    # input
+    parser.add_argument(
+        "-i",
+        "--input",
+        required=True,
+        help="FASTA file with raw sequences, can be compressed",
+        type=lambda x: parser_check_if_file_exists(parser, x),
+    )
+
+    # type
+    parser.add_argument(
+        "-t",
+        "--type",
+        required=True,
+        help="type of DNA fragment",
+        choices=[dft.name for dft in DnaFragmentType],
+    )
+
+    # result
+    parser.add_argument("-r", "--result", required=True, help="result file with hits", type=str)
+
+    # threshold
+    parser.add_argument(
+        "--threshold", default=DEFAULT_SCAN_THRESHOLD, help="minimal log-odds of reported hits", type=float
+    )
+
+    # chunk size
+    parser.add_argument(
+        "--chunk_size", default=DEFAULT_SCAN_CHUNK_SIZE, help="number of bases read at once", type=int
+    )
+
+    # parse arguments
+    args = parser.parse_args(command_args)
+
+    model = load_naive_bayes(args.model)
+    log_odds_table = model.log_odds_table()
+    if not 0 <= args.a_len <= log_odds_table.shape[0]:
+        parser.error(f"Argument -A has to be between 0 and length of fragments of model {log_odds_table.shape[0]}!")
+    fragment = DONOR_SEQ if args.type == DnaFragmentType.DONOR.name else ACCEPTOR_SEQ
+
+    bases_num = 0
+    hits_num = 0
+
+    # bases of chunks of one sequence, counts scanned bases
+    def chunks_bases(sequence_chunks):
+        nonlocal bases_num
+        for _, _, chunk in sequence_chunks:
+            bases_num += len(chunk)
+            yield chunk
+
+    start = time.perf_counter()
+    with open_file(args.input) as dna_file, open(args.result, "w") as result_f:
+        chunks = iter_sequence_chunks(dna_file, args.chunk_size)
+        for (_, name), sequence_chunks in itertools.groupby(chunks, key=lambda x: (x[0], x[1])):
+            for position, score in scan_sequence(
+                chunks_bases(sequence_chunks),
+                log_odds_table,
+                model.log_prior_odds(),
+                args.a_len,
+                fragment,
+                args.threshold,
+            ):
+                result_f.write(f"{name}\t{position}\t{score:.6f}\n")
+                hits_num += 1
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"Scanned {bases_num} bases in {elapsed:.3f}s ({bases_num / elapsed if elapsed else 0:.0f} bases/s), "
+        f"hits: {hits_num}",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    scan_command(sys.argv[1:])
@@ -0,0 +1,458 @@
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+
+from python_code.binary_fragments import fragments_list_to_array
+from python_code.compression import open_file
+from python_code.cross_validation import DEFAULT_FOLDS_NUM
+from python_code.features import NUMBERS_FEATURES, fragments_to_features
+from python_code.fragments_cache import get_file_digest
+from python_code.get_acceptors_and_donors import (
+    ACCEPTOR_SEQ,
+    DONOR_SEQ,
+    NUMPY_ENGINE,
+    PYTHON_ENGINE,
+    DnaFragmentType,
+    dna_data_read,
+    get_acceptors,
+    get_donors,
+    parser_check_if_file_exists,
+    parser_check_if_window_is_correct,
+)
+from python_code.markov_model import DEFAULT_MARKOV_ORDER
+from python_code.pipeline import (
+    CROSS_VALIDATION,
+    MARKOV_MODEL,
+    NAIVE_BAYES_MODEL,
+    SIMPLE_VALIDATION,
+    create_model,
+    validate_naive_bayes,
+)
+from python_code.report import confusion_matrix, confusion_matrix_statistics, pr_auc, roc_auc, threshold_sweep
+
+# overlap values of grid
+OVERLAP_VALUES: Dict[str, bool] = {"no": False, "yes": True}
+
+# columns of results table
+SWEEP_COLUMNS: List[str] = [
+    "type",
+    "a_len",
+    "b_len",
+    "overlap",
+    "true_num",
+    "false_num",
+    "roc_auc",
+    "pr_auc",
+    "accuracy",
+    "kappa",
+    "sensitivity",
+    "specificity",
+    "balanced_accuracy",
+    "time",
+]
+
+# sequences used by ``evaluate_sweep_point`` - look ``init_sweep_worker`` and ``load_sweep_sequences``
+_sweep_sequences: List[Dict] = []
+# (input file, motif index) of sequences read by ``load_sweep_sequences``
+_sweep_input: Optional[Tuple[str, bool]] = None
+
+
+def read_sweep_sequences(input_path: str, motif_index: bool = False) -> List[Dict]:
+    """
+    Read all sequences of input file.
+
+    Args:
+        input_path: Path to file with sequences, can be compressed.
+        motif_index: If true add positions of donor and acceptor sequences from motif index created next to
+        input file - look ``motif_index.get_motif_index``.
+
+    Returns:
+        Sequences read from data file.
+    """
+    with open_file(input_path) as dna_file:
+        dna_sequences = dna_data_read(dna_file)
+    if motif_index:
+        from python_code.motif_index import attach_motif_positions, get_motif_index
+
+        dna_sequences = list(attach_motif_positions(dna_sequences, get_motif_index(input_path)))
+    return dna_sequences
+
+
+def init_sweep_worker(dna_sequences: List[Dict]) -> None:
+    """
+    Set sequences used by ``evaluate_sweep_point`` in current process.
+
+    Args:
+        dna_sequences: Sequences read from data file.
+    """
+    global _sweep_sequences, _sweep_input
+    _sweep_sequences = dna_sequences
+    _sweep_input = None
+
+
+def load_sweep_sequences(input_path: str, motif_index: bool = False) -> None:
+    """
+    Read sequences used by ``evaluate_sweep_point`` in worker process, file is read once per process.
+    It is used instead of ``initializer`` of ``ProcessPoolExecutor``, which is missing in python 3.6.
+
+    Args:
+        input_path: Path to file with sequences, can be compressed.
+        motif_index: If true add positions of donor and acceptor sequences from motif index.
+    """
+    global _sweep_sequences, _sweep_input
+    if _sweep_input != (input_path, motif_index):
+        _sweep_sequences = read_sweep_sequences(input_path, motif_index)
+        _sweep_input = (input_path, motif_index)
+
+
+def get_point_name(point: Tuple[str, int, int, bool]) -> str:
+    """
+    Get name of file with results of grid point.
+
+    Args:
+        point: (fragment type, A, B, overlap).
+
+    Returns:
+        File name, example: ``donor_10_20_overlap.json``.
+    """
+    fragment_type, a_len, b_len, overlap_fragments = point
+    return f"{fragment_type.lower()}_{a_len}_{b_len}_{'overlap' if overlap_fragments else 'no_overlap'}.json"
+
+
+def evaluate_sweep_point(point: Tuple[str, int, int, bool], config: Dict) -> Dict:
+    """
+    Get fragments of grid point from shared sequences, validate model on them and compute metrics.
+
+    Args:
+        point: (fragment type, A, B, overlap).
+        config: Dictionary: {"engine", "model", "order", "validation", "laplace", "folds", "split", "seed"}.
+
+    Returns:
+        Row of results table - look ``SWEEP_COLUMNS``.
+    """
+    fragment_type, a_len, b_len, overlap_fragments = point
+    start = time.perf_counter()
+
+    if config["engine"] == NUMPY_ENGINE:
+        from python_code.numpy_fragments import get_fragments_arrays
+
+        fragment = DONOR_SEQ if fragment_type == DnaFragmentType.DONOR.name else ACCEPTOR_SEQ
+        true_fragments, false_fragments = get_fragments_arrays(
+            a_len, b_len, _sweep_sequences, fragment, overlap_fragments
+        )
+    else:
+        get_fragments = get_donors if fragment_type == DnaFragmentType.DONOR.name else get_acceptors
+        true_list, false_list = get_fragments(a_len, b_len, _sweep_sequences, overlap_fragments)
+        # for A != B fragments cut at edges of sequence are skipped like by numpy engine
+        true_fragments = fragments_list_to_array(true_list, a_len + b_len, skip_cut=True)
+        false_fragments = fragments_list_to_array(false_list, a_len + b_len, skip_cut=True)
+
+    features, labels = fragments_to_features(true_fragments, false_fragments, NUMBERS_FEATURES)
+    predicted, scores, test_labels = validate_naive_bayes(
+        features,
+        labels,
+        config["validation"],
+        config["laplace"],
+        config["folds"],
+        config["split"],
+        config["seed"],
+        create_model(config["model"], config["laplace"], config["order"]),
+    )
+    sweep = threshold_sweep(scores, test_labels)
+    statistics = confusion_matrix_statistics(confusion_matrix(predicted, test_labels))
+
+    return {
+        "type": fragment_type,
+        "a_len": a_len,
+        "b_len": b_len,
+        "overlap": overlap_fragments,
+        "true_num": len(true_fragments),
+        "false_num": len(false_fragments),
+        "roc_auc": roc_auc(sweep),
+        "pr_auc": pr_auc(sweep),
+        "accuracy": statistics["Accuracy"],
+        "kappa": statistics["Kappa"],
+        "sensitivity": statistics["Sensitivity"],
+        "specificity": statistics["Specificity"],
+        "balanced_accuracy": statistics["Balanced Accuracy"],
+        "time": time.perf_counter() - start,
+    }
+
+
+def evaluate_sweep_point_of_file(
+    point: Tuple[str, int, int, bool], config: Dict, input_path: str, motif_index: bool = False
+) -> Dict:
+    """
+    Task of worker process: read ``input_path`` when process didn't read it yet and evaluate grid point -
+    look ``evaluate_sweep_point``.
+
+    Args:
+        point: (fragment type, A, B, overlap).
+        config: Dictionary: {"engine", "model", "order", "validation", "laplace", "folds", "split", "seed"}.
+        input_path: Path to file with sequences, can be compressed.
+        motif_index: If true use positions of donor and acceptor sequences from motif index.
+
+    Returns:
+        Row of results table - look ``SWEEP_COLUMNS``.
+    """
+    load_sweep_sequences(input_path, motif_index)
+    return evaluate_sweep_point(point, config)
+
+
+def load_point_result(path: str, config: Dict) -> Optional[Dict]:
+    """
+    Load results of grid point saved by earlier run of sweep.
+
+    Args:
+        path: Path to file with results of point.
+        config: Configuration of current sweep, results computed with other configuration or other content
+        of input file are ignored.
+
+    Returns:
+        Row of results table, None when point has to be computed.
+    """
+    try:
+        with open(path) as point_f:
+            saved = json.load(point_f)
+    except (FileNotFoundError, ValueError):
+        return None
+    return saved["result"] if saved.get("config") == config else None
+
+
+def save_point_result(path: str, config: Dict, result: Dict) -> None:
+    """
+    Save results of grid point, file is replaced atomically so interrupted sweep doesn't leave broken files.
+
+    Args:
+        path: Path to file with results of point.
+        config: Configuration of sweep.
+        result: Row of results table.
+    """
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as point_f:
+        json.dump({"config": config, "result": result}, point_f)
+    os.replace(tmp_path, path)
+
+
+def save_results_table(results: List[Dict], output: str) -> None:
+    """
+    Save rows of results as tab separated table with header.
+
+    Args:
+        results: Rows of results table.
+        output: Output file name.
+    """
+    with open(output, "w") as table_f:
+        table_f.write("\t".join(SWEEP_COLUMNS) + "\n")
+        for result in results:
+            table_f.write("\t".join(str(result[x]) for x in SWEEP_COLUMNS) + "\n")
+
+
+def run_sweep(
+    input_path: str,
+    points: List[Tuple[str, int, int, bool]],
+    config: Dict,
+    result_dir: str,
+    workers: int = 1,
+    motif_index: bool = False,
+) -> List[Dict]:
+    """
+    Evaluate all grid points on pool of ``workers`` processes, points with saved results are skipped.
+    Input file is read only when some point has to be evaluated, each worker process reads it once.
+
+    Args:
+        input_path: Path to file with sequences, can be compressed.
+        points: Grid points (fragment type, A, B, overlap).
+        config: Dictionary: {"input_digest", "engine", "model", "order", "validation", "laplace", "folds",
+        "split", "seed"}, it is also saved with results of each point.
+        result_dir: Directory with results of points.
+        workers: Number of processes, 1 - don't use processes.
+        motif_index: If true use positions of donor and acceptor sequences from motif index created next
+        to input file - look ``motif_index.get_motif_index``.
+
+    Returns:
+        Rows of results table in order of ``points``.
+    """
+    os.makedirs(result_dir, exist_ok=True)
+    paths = [os.path.join(result_dir, get_point_name(x)) for x in points]
+    results = [load_point_result(x, config) for x in paths]
+    todo = [i for i, result in enumerate(results) if result is None]
+
+    if not todo:
+        return results
+
+    if workers == 1:
+        init_sweep_worker(read_sweep_sequences(input_path, motif_index))
+        for i in todo:
+            results[i] = evaluate_sweep_point(points[i], config)
+            save_point_result(paths[i], config, results[i])
+    else:
+        # motif index is created before worker processes start, so they don't create it at once
+        if motif_index:
+            from python_code.motif_index import get_motif_index
+
+            get_motif_index(input_path)
+        with ProcessPoolExecutor(max_workers=min(workers, len(todo))) as executor:
+            futures = {
+                executor.submit(evaluate_sweep_point_of_file, points[i], config, input_path, motif_index): i
+                for i in todo
+            }
+            # results are saved as soon as point is done, so interrupted sweep can be resumed
+            for future in as_completed(futures):
+                i = futures[future]
+                results[i] = future.result()
+                save_point_result(paths[i], config, results[i])
+
+    return results
+
+
+def sweep_command(command_args: List[str]) -> None:
+    """
+    Create parser, parse args given in ``command_args`` and run extraction and validation of naive bayes
+    or markov model for every point of grid of windows, types and overlap. Input is read once, points are evaluated on
+    pool of processes, results of each point are saved in result directory and skipped by next run,
+    all metrics are saved in one table.
+
+    Args:
+        command_args: Arguments for command.
+    """
+    # create parser
+    parser = argparse.ArgumentParser()
+
+    # input file argument
+    parser.add_argument(
+        "-i",
+        "--input",
+        required=True,
+        help="input file with sequences",
+        type=lambda x: parser_check_if_file_exists(parser, x),
+    )
+
+    # windows
+    parser.add_argument(
+        "-w",
+        "--windows",
+        nargs="+",
+        required=True,
+        help="windows A:B, A and B can be lists split by comma, example: 10:10 20,30:20,30",
+        type=lambda x: parser_check_if_window_is_correct(parser, x),
+    )
+
+    # types
+    parser.add_argument(
+        "-t",
+        "--types",
+        nargs="+",
+        default=[dft.name for dft in DnaFragmentType],
+        help="types of DNA fragment",
+        choices=[dft.name for dft in DnaFragmentType],
+    )
+
+    # overlap
+    parser.add_argument(
+        "-o",
+        "--overlap",
+        nargs="+",
+        default=list(OVERLAP_VALUES),
+        help="overlap values, yes - generate addition false donors/acceptors with overlap fragments",
+        choices=list(OVERLAP_VALUES),
+    )
+
+    # result directory
+    parser.add_argument(
+        "-r", "--result_dir", required=True, help="directory with results of points and results table", type=str
+    )
+
+    # workers
+    parser.add_argument("-j", "--workers", default=1, help="number of processes, 1 - don't use processes", type=int)
+
+    # validation
+    parser.add_argument(
+        "-v",
+        "--validation",
+        default=CROSS_VALIDATION,
+        help=f"validation method, {SIMPLE_VALIDATION} - simple validation, {CROSS_VALIDATION} - cross validation",
+        choices=[SIMPLE_VALIDATION, CROSS_VALIDATION],
+    )
+
+    # folds
+    parser.add_argument("-k", "--folds", default=DEFAULT_FOLDS_NUM, help="number of folds", type=int)
+
+    # train proportion
+    parser.add_argument("--split", default=0.5, help="proportion of train set of simple validation", type=float)
+
+    # laplace
+    parser.add_argument("-l", "--laplace", default=0.0, help="laplace smoothing value", type=float)
+
+    # model
+    parser.add_argument(
+        "-m",
+        "--model",
+        default=NAIVE_BAYES_MODEL,
+        help=f"validated model, {NAIVE_BAYES_MODEL} - naive bayes, {MARKOV_MODEL} - inhomogeneous markov model",
+        choices=[NAIVE_BAYES_MODEL, MARKOV_MODEL],
+    )
+
+    # markov order
+    parser.add_argument(
+        "--order", default=DEFAULT_MARKOV_ORDER, help="order of markov model", choices=[1, 2], type=int
+    )
+
+    # seed
+    parser.add_argument("-s", "--seed", default=0, help="seed of random generator", type=int)
+
+    # use motif index
+    parser.add_argument(
+        "--motif_index",
+        action="store_true",
+        default=False,
+        help="if flag read positions of donor and acceptor sequences from motif index created next to input file",
+    )
+
+    # engine
+    parser.add_argument(
+        "-e",
+        "--engine",
+        help=f"engine used to get fragments, {NUMPY_ENGINE} engine skips fragments which don't fit in sequence",
+        choices=[PYTHON_ENGINE, NUMPY_ENGINE],
+        default=NUMPY_ENGINE,
+    )
+
+    # parse arguments
+    args = parser.parse_args(command_args)
+
+    if args.workers < 1:
+        parser.error("Argument --workers has to be positive!")
+
+    windows = list(dict.fromkeys(x for windows in args.windows for x in windows))
+    points = [
+        (fragment_type, a_len, b_len, OVERLAP_VALUES[overlap])
+        for fragment_type, (a_len, b_len), overlap in itertools.product(
+            dict.fromkeys(args.types), windows, dict.fromkeys(args.overlap)
+        )
+    ]
+    # digest of input instead of its path, so points computed for older version of input file aren't used
+    # and points computed for moved file are used
+    config = {
+        "input_digest": get_file_digest(args.input),
+        "engine": args.engine,
+        "model": args.model,
+        "order": args.order,
+        "validation": args.validation,
+        "laplace": args.laplace,
+        "folds": args.folds,
+        "split": args.split,
+        "seed": args.seed,
+    }
+
+    results = run_sweep(args.input, points, config, args.result_dir, args.workers, args.motif_index)
+    save_results_table(results, os.path.join(args.result_dir, "results.tsv"))
+
+
+if __name__ == "__main__":
+    sweep_command(sys.argv[1:])
@@ -0,0 +1,224 @@
+import argparse
+import random
+import sys
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from python_code.compression import COMPRESSION_MAGIC, open_file
+from python_code.get_acceptors_and_donors import ACCEPTOR_SEQ, DONOR_SEQ
+
+# nucleotides of generated sequences, N is added with ``n_rate``
+SYNTHETIC_NUCLEOTIDES: str = "ACGT"
+
+# default number of introns per 1000 bases
+DEFAULT_INTRON_DENSITY: float = 2.0
+
+# minimal number of bases of intron and exon
+MIN_INTRON_LEN: int = 2 * len(DONOR_SEQ + ACCEPTOR_SEQ)
+MIN_EXON_LEN: int = 1
+
+
+def get_synthetic_introns(
+    rng: random.Random, sequence_len: int, introns_num: int
+) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+    """
+    Draw positions of introns which don't overlap and are split by exons. Intron ``(begin, end)`` contains
+    bases from ``begin`` to ``end``, donor is at ``begin`` and acceptor ends at ``end`` - like in araclean.
+
+    Args:
+        rng: Random generator.
+        sequence_len: Length of sequence.
+        introns_num: Number of introns, less introns are drawn when sequence is too short.
+
+    Returns:
+        Lists of introns and exons.
+    """
+    # each intron takes at least MIN_INTRON_LEN bases and is followed by exon
+    introns_num = max(0, min(introns_num, (sequence_len - MIN_EXON_LEN) // (MIN_INTRON_LEN + MIN_EXON_LEN)))
+    free_len = sequence_len - MIN_EXON_LEN - introns_num * (MIN_INTRON_LEN + MIN_EXON_LEN)
+
+    # split free bases to introns and exons, bounds are sorted so parts don't overlap
+    bounds = sorted(rng.randint(0, free_len) for _ in range(2 * introns_num))
+    introns = []
+    for i in range(introns_num):
+        begin = MIN_EXON_LEN + i * (MIN_INTRON_LEN + MIN_EXON_LEN) + bounds[2 * i]
+        end = begin + MIN_INTRON_LEN - 1 + bounds[2 * i + 1] - bounds[2 * i]
+        introns.append((begin, end))
+
+    exon_bounds = [-1] + [x for intron in introns for x in intron] + [sequence_len]
+    exons = [(exon_bounds[i] + 1, exon_bounds[i + 1] - 1) for i in range(0, len(exon_bounds), 2)]
+    return introns, exons
+
+
+def create_synthetic_sequence(
+    rng: random.Random, sequence_len: int, intron_density: float = DEFAULT_INTRON_DENSITY, n_rate: float = 0.0
+) -> Dict:
+    """
+    Create random sequence with introns which begin with ``DONOR_SEQ`` and end with ``ACCEPTOR_SEQ``.
+
+    Args:
+        rng: Random generator.
+        sequence_len: Length of sequence.
+        intron_density: Number of introns per 1000 bases.
+        n_rate: Probability that base is N, signs of donors and acceptors are never N.
+
+    Returns:
+        Dictionary like returned by ``dna_data_read``: {"Introns", "Exons", "Sequence"}.
+    """
+    bases = rng.choices(SYNTHETIC_NUCLEOTIDES, k=sequence_len)
+    if n_rate > 0:
+        for i in range(sequence_len):
+            if rng.random() < n_rate:
+                bases[i] = "N"
+
+    introns, exons = get_synthetic_introns(rng, sequence_len, round(sequence_len * intron_density / 1000))
+    for begin, end in introns:
+        bases[begin : begin + len(DONOR_SEQ)] = DONOR_SEQ
+        bases[end + 1 - len(ACCEPTOR_SEQ) : end + 1] = ACCEPTOR_SEQ
+
+    return {"Introns": introns, "Exons": exons, "Sequence": "".join(bases)}
+
+
+def create_synthetic_sequences(
+    sequences_num: int,
+    min_len: int,
+    max_len: int,
+    intron_density: float = DEFAULT_INTRON_DENSITY,
+    n_rate: float = 0.0,
+    seed: int = 42,
+) -> Iterator[Dict]:
+    """
+    Create random sequences one by one - look ``create_synthetic_sequence``.
+
+    Args:
+        sequences_num: Number of sequences.
+        min_len: Minimal length of sequence.
+        max_len: Maximal length of sequence.
+        intron_density: Number of introns per 1000 bases.
+        n_rate: Probability that base is N.
+        seed: Seed of random generator.
+
+    Returns:
+        Iterator of dictionaries: {"Introns", "Exons", "Sequence"}.
+    """
+    rng = random.Random(seed)
+    for _ in range(sequences_num):
+        yield create_synthetic_sequence(rng, rng.randint(min_len, max_len), intron_density, n_rate)
+
+
+def format_dna_sequence(dna_sequence: Dict, sequence_id: int) -> str:
+    """
+    Format sequence as araclean record - reverse of ``dna_data_iter``.
+
+    Args:
+        dna_sequence: Dictionary: {"Introns", "Exons", "Sequence"}.
+        sequence_id: ID of sequence written in header line.
+
+    Returns:
+        Record of sequence.
+    """
+    introns = " ".join(f"{x} {y}" for x, y in dna_sequence["Introns"])
+    exons = " ".join(f"{x} {y}" for x, y in dna_sequence["Exons"])
+    return (
+        f">Seq {sequence_id} Len:\n{len(dna_sequence['Sequence'])}\n"
+        f"Introns\n {introns}\nExons\n {exons}\nData\n{dna_sequence['Sequence']}\n"
+    )
+
+
+def save_synthetic_data(
+    output: str,
+    sequences_num: int,
+    min_len: int,
+    max_len: int,
+    intron_density: float = DEFAULT_INTRON_DENSITY,
+    n_rate: float = 0.0,
+    seed: int = 42,
+    compression: Optional[str] = None,
+) -> int:
+    """
+    Write random sequences to araclean format file.
+
+    Args:
+        output: Output file name.
+        sequences_num: Number of sequences.
+        min_len: Minimal length of sequence.
+        max_len: Maximal length of sequence.
+        intron_density: Number of introns per 1000 bases.
+        n_rate: Probability that base is N.
+        seed: Seed of random generator.
+        compression: Compression of output file, by default detected from ``output`` extension.
+
+    Returns:
+        Number of written bases.
+    """
+    bases_num = 0
+    with open_file(output, "w", compression) as dna_file:
+        for sequence_id, dna_sequence in enumerate(
+            create_synthetic_sequences(sequences_num, min_len, max_len, intron_density, n_rate, seed), start=1
+        ):
+            dna_file.write(format_dna_sequence(dna_sequence, sequence_id))
+            bases_num += len(dna_sequence["Sequence"])
+    return bases_num
+
+
+def synthetic_data_command(command_args: List[str]) -> None:
+    """
+    Create parser, parse args given in ``command_args`` and write random sequences in araclean format.
+
+    Args:
+        command_args: Arguments for command.
+    """
+    # create parser
+    parser = argparse.ArgumentParser()
+
+    # result
+    parser.add_argument("-r", "--result", required=True, help="result file", type=str)
+
+    # number of sequences
+    parser.add_argument("-n", "--sequences_num", default=1000, help="number of sequences", type=int)
+
+    # lengths of sequences
+    parser.add_argument("--min_len", default=1000, help="minimal length of sequence", type=int)
+    parser.add_argument("--max_len", default=5000, help="maximal length of sequence", type=int)
+
+    # introns
+    parser.add_argument(
+        "--intron_density", default=DEFAULT_INTRON_DENSITY, help="number of introns per 1000 bases", type=float
+    )
+
+    # N rate
+    parser.add_argument("--n_rate", default=0.0, help="probability that base is N", type=float)
+
+    # seed
+    parser.add_argument("-s", "--seed", default=42, help="seed of random generator", type=int)
+
+    # compression
+    parser.add_argument(
+        "-c",
+        "--compression",
+        help="compression of result file, by default detected from result file extension",
+        choices=list(COMPRESSION_MAGIC),
+        default=None,
+    )
+
+    # parse arguments
+    args = parser.parse_args(command_args)
+
+    if not 0 < args.min_len <= args.max_len:
+        parser.error("Arguments have to satisfy 0 < --min_len <= --max_len!")
+    if not 0 <= args.n_rate <= 1 or args.intron_density < 0:
+        parser.error("Argument --n_rate has to be between 0 and 1 and --intron_density not negative!")
+
+    save_synthetic_data(
+        args.result,
+        args.sequences_num,
+        args.min_len,
+        args.max_len,
+        args.intron_density,
+        args.n_rate,
+        args.seed,
+        args.compression,
+    )
+
+
+if __name__ == "__main__":
+    synthetic_data_command(sys.argv[1:])
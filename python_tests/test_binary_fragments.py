@@ -0,0 +1,121 @@
+from python_code.binary_fragments import (
+    fragments_list_to_array,
+    load_fragments_binary,
+    save_fragments_binary,
+)
+from python_code.get_acceptors_and_donors import (
+    DnaFragmentType,
+    dna_data_read,
+    get_acceptors_and_donors_command,
+    get_donors,
+)
+from python_code.numpy_fragments import fragments_array_to_list
+from python_code.synthetic_data import save_synthetic_data
+import io
+import random
+import pytest
+from python_tests.tests_utils import (
+    TEST_DATA,
+    TEST_A,
+    TEST_B,
+)
+
+
+def test_save_and_load_fragments_binary(tmp_path):
+    """
+    Check if fragments with N and other signs are the same after saving and loading, also partially.
+    """
+    rng = random.Random(42)
+    a, b = 3, 4
+    true_seq = ["".join(rng.choice("ACGT") for _ in range(a + b)) for _ in range(5)]
+    false_seq = ["".join(rng.choice("ACGTNNR") for _ in range(a + b)) for _ in range(20)]
+    output = str(tmp_path / "result.bin")
+
+    save_fragments_binary(
+        fragments_list_to_array(true_seq, a + b),
+        fragments_list_to_array(false_seq, a + b),
+        output, a, b, DnaFragmentType.ACCEPTOR.value, True,
+    )
+
+    for use_mmap in [False, True]:
+        result = load_fragments_binary(output, use_mmap=use_mmap)
+        assert (result["a_len"], result["b_len"], result["type"], result["overlap"]) == (a, b, 2, True)
+        assert result["labels"].tolist() == [1] * 5 + [0] * 20
+        assert fragments_array_to_list(result["fragments"]) == true_seq + false_seq
+
+        result = load_fragments_binary(output, 7, 13, use_mmap=use_mmap)
+        assert fragments_array_to_list(result["fragments"]) == (true_seq + false_seq)[7:13]
+
+
+def test_fragments_list_to_array_wrong_length():
+    """
+    Check if fragments of wrong length can't be saved in binary file, empty fragments are skipped.
+    """
+    assert fragments_list_to_array(["ACG", "", "TTA"], 3).shape == (2, 3)
+
+    with pytest.raises(ValueError):
+        fragments_list_to_array(["ACG", "TT"], 3)
+
+    fragments = fragments_list_to_array(["ACG", "TT", "", "TTA"], 3, skip_cut=True)
+    assert fragments_array_to_list(fragments) == ["ACG", "TTA"]
+
+
+def test_command_binary_format(tmp_path):
+    """
+    Check if command writes binary file with the same fragments as text file.
+    """
+    input_path = tmp_path / "data.dat"
+    input_path.write_text(TEST_DATA)
+    output = str(tmp_path / "donor.bin")
+
+    get_acceptors_and_donors_command(
+        ["-A", str(TEST_A), "-B", str(TEST_B), "-i", str(input_path), "-t", "DONOR", "-f", "binary", "-r", output]
+    )
+
+    with io.StringIO(TEST_DATA) as f:
+        true_seq, false_seq = get_donors(TEST_A, TEST_B, dna_data_read(f), False)
+
+    result = load_fragments_binary(output)
+    assert fragments_array_to_list(result["fragments"]) == true_seq + false_seq
+    assert result["labels"].tolist() == [1] * len(true_seq) + [0] * len(false_seq)
+
+
+def test_save_and_load_compressed_fragments_binary(tmp_path):
+    """
+    Check if compressed binary file is loaded the same as not compressed.
+    """
+    fragments = fragments_list_to_array(["ACGTNAC", "TTTNGGA"], 7)
+    output = str(tmp_path / "result.bin.gz")
+
+    save_fragments_binary(fragments[:1], fragments[1:], output, 3, 4, DnaFragmentType.DONOR.value, False, None, 1)
+
+    result = load_fragments_binary(output, 1)
+    assert fragments_array_to_list(result["fragments"]) == ["TTTNGGA"]
+    assert result["labels"].tolist() == [0]
+
+
+def test_command_binary_format_different_a_and_b(tmp_path):
+    """
+    Check if binary file of python engine with A != B has only full fragments like file of numpy engine,
+    fragments cut at edges of sequence are skipped.
+    """
+    input_path = str(tmp_path / "data.dat")
+    save_synthetic_data(input_path, 30, 40, 120, intron_density=20, seed=2)
+
+    # text file keeps fragments cut at edges like reference functions
+    get_acceptors_and_donors_command(
+        ["-A", "5", "-B", "10", "-i", input_path, "-t", "DONOR", "-r", str(tmp_path / "donor.txt")]
+    )
+    assert any(len(x) < 15 for x in (tmp_path / "donor.txt").read_text().splitlines()[1::2])
+
+    for dedup in [[], ["--dedup"]]:
+        for engine in ["python", "numpy"]:
+            get_acceptors_and_donors_command(
+                ["-A", "5", "-B", "10", "-i", input_path, "-t", "DONOR", "-f", "binary", "-e", engine,
+                 "-r", str(tmp_path / f"{engine}.bin")] + dedup
+            )
+        python_result = load_fragments_binary(str(tmp_path / "python.bin"))
+        numpy_result = load_fragments_binary(str(tmp_path / "numpy.bin"))
+        assert python_result["fragments"].shape[1] == 15 and len(python_result["fragments"]) > 0
+        assert (python_result["fragments"] == numpy_result["fragments"]).all()
+        assert python_result["labels"].tolist() == numpy_result["labels"].tolist()
@@ -0,0 +1,98 @@
+from python_code.compression import (
+    COMPRESSION_MAGIC,
+    detect_compression,
+    open_file,
+    split_extension,
+)
+from python_code.features import get_features_paths, get_weights_path
+from python_code.get_acceptors_and_donors import get_acceptors_and_donors_command
+import os
+from python_tests.tests_utils import (
+    TEST_DATA,
+    TEST_A,
+    TEST_B,
+)
+
+
+def test_open_file_compressed(tmp_path):
+    """
+    Check if compressed files are written and read, compression is detected by first bytes.
+    """
+    for compression in COMPRESSION_MAGIC:
+        # extension doesn't match compression
+        file_path = str(tmp_path / f"data_{compression}.dat")
+        with open_file(file_path, "w", compression, 1) as f:
+            f.write(TEST_DATA)
+
+        assert detect_compression(file_path) == compression
+        with open_file(file_path) as f:
+            assert f.read() == TEST_DATA
+
+
+def test_detect_compression_from_extension(tmp_path):
+    """
+    Check if compression of new file is detected from extension.
+    """
+    assert detect_compression(str(tmp_path / "result.dat.gz"), "w") == "gzip"
+    assert detect_compression(str(tmp_path / "result.dat.xz"), "w") == "xz"
+    assert detect_compression(str(tmp_path / "result.dat"), "w") is None
+
+
+def test_command_compressed_input_and_output(tmp_path):
+    """
+    Check if command reads compressed input and writes compressed result with the same content.
+    """
+    input_path = tmp_path / "data.dat"
+    input_path.write_text(TEST_DATA)
+    with open_file(str(tmp_path / "data.dat.bz2"), "w") as f:
+        f.write(TEST_DATA)
+
+    common_args = ["-A", str(TEST_A), "-B", str(TEST_B), "-t", "ACCEPTOR"]
+    get_acceptors_and_donors_command(common_args + ["-i", str(input_path), "-r", str(tmp_path / "result.dat")])
+    get_acceptors_and_donors_command(
+        common_args + ["-i", str(tmp_path / "data.dat.bz2"), "-r", str(tmp_path / "result.dat.gz")]
+    )
+    get_acceptors_and_donors_command(
+        common_args + ["-i", str(tmp_path / "data.dat.bz2"), "-r", str(tmp_path / "result_both.dat"), "-c", "xz"]
+    )
+
+    expected = (tmp_path / "result.dat").read_text()
+    for result in ["result.dat.gz", "result_both.dat"]:
+        assert detect_compression(str(tmp_path / result)) is not None
+        with open_file(str(tmp_path / result)) as f:
+            assert f.read() == expected
+
+
+def test_split_extension():
+    """
+    Check if compression extension is kept together with extension before it.
+    """
+    assert split_extension("dir/result.dat") == ("dir/result", ".dat")
+    assert split_extension("dir/result.dat.gz") == ("dir/result", ".dat.gz")
+    assert split_extension("result.xz") == ("result", ".xz")
+    assert split_extension("result") == ("result", "")
+
+    assert get_features_paths("result.dat.bz2") == ("result_features.npy", "result_labels.npy")
+    assert get_weights_path("result.dat.gz") == "result_weights.npy"
+
+
+def test_command_compressed_result_names(tmp_path):
+    """
+    Check if suffixes of types, windows and features are added before compression extension.
+    """
+    input_path = tmp_path / "data.dat"
+    input_path.write_text(TEST_DATA)
+
+    get_acceptors_and_donors_command(
+        ["-A", str(TEST_A), "-B", str(TEST_B), "-t", "BOTH", "-i", str(input_path), "-r", str(tmp_path / "both.dat.gz")]
+    )
+    get_acceptors_and_donors_command(
+        ["-s", "2,3:4", "-t", "DONOR", "-i", str(input_path), "-r", str(tmp_path / "sweep.dat.xz"),
+         "--features", "numbers"]
+    )
+
+    assert sorted(os.listdir(tmp_path)) == sorted(
+        ["data.dat", "both_donor.dat.gz", "both_acceptor.dat.gz", "sweep_2_4.dat.xz", "sweep_3_4.dat.xz",
+         "sweep_2_4_features.npy", "sweep_2_4_labels.npy", "sweep_3_4_features.npy", "sweep_3_4_labels.npy"]
+    )
+    assert detect_compression(str(tmp_path / "both_donor.dat.gz")) == "gzip"
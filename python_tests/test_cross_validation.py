@@ -0,0 +1,34 @@
+from python_code.cross_validation import (
+    cross_validate_naive_bayes,
+    stratified_folds,
+)
+from python_code.naive_bayes import CategoricalNaiveBayes
+import numpy as np
+from python_tests.test_naive_bayes import create_random_data
+
+
+def test_stratified_folds():
+    """
+    Check if every fold has similar number of fragments of each class.
+    """
+    labels = np.array([1] * 23 + [0] * 101)
+    folds = stratified_folds(labels, 5, seed=1)
+
+    for label in [0, 1]:
+        fold_sizes = np.bincount(folds[labels == label], minlength=5)
+        assert fold_sizes.max() - fold_sizes.min() <= 1
+
+
+def test_cross_validate_naive_bayes():
+    """
+    Check if out-of-fold probabilities are the same as of models trained from scratch on other folds.
+    """
+    x, y = create_random_data(300)
+    weights = np.arange(len(x)) % 2 + 1
+
+    proba, folds = cross_validate_naive_bayes(x, y, 4, laplace=1, seed=3, sample_weight=weights)
+
+    for fold in range(4):
+        train = folds != fold
+        model = CategoricalNaiveBayes(laplace=1).fit(x[train], y[train], weights[train])
+        assert np.allclose(proba[folds == fold], model.predict_proba(x[folds == fold]))
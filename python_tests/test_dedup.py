@@ -0,0 +1,124 @@
+from python_code.binary_fragments import fragments_list_to_array, load_fragments_binary, save_fragments_binary
+from python_code.dedup import deduplicate_fragments, deduplicate_labeled_fragments, get_fragments_keys
+from python_code.features import load_features, load_weights, save_features
+from python_code.get_acceptors_and_donors import get_acceptors_and_donors_command
+from python_code.naive_bayes import load_naive_bayes, naive_bayes_command
+from python_code.numpy_fragments import fragments_array_to_list
+from python_code.synthetic_data import save_synthetic_data
+import os
+import random
+import numpy as np
+
+
+def test_get_fragments_keys():
+    """
+    Check if fragments have the same key only when they are identical, for packed and raw keys.
+    """
+    rng = random.Random(1)
+    for letters, length in [("ACGT", 6), ("ACGT", 40), ("ACGTN", 6)]:
+        fragments = ["".join(rng.choice(letters) for _ in range(length)) for _ in range(300)]
+        fragments += fragments[:50]
+        keys = get_fragments_keys(fragments_list_to_array(fragments, length))
+
+        assert len(set(keys.tolist())) == len(set(fragments))
+        key_of = {}
+        for key, fragment in zip(keys.tolist(), fragments):
+            assert key_of.setdefault(fragment, key) == key
+
+
+def test_deduplicate_fragments():
+    """
+    Check if unique fragments are in order of first copy with number of copies.
+    """
+    fragments = fragments_list_to_array(["ACGT", "TTTT", "ACGT", "NNAC", "TTTT", "ACGT"], 4)
+    unique, counts = deduplicate_fragments(fragments)
+
+    assert fragments_array_to_list(unique) == ["ACGT", "TTTT", "NNAC"]
+    assert counts.tolist() == [3, 2, 1]
+
+    unique, counts = deduplicate_fragments(fragments[:0])
+    assert unique.shape == (0, 4) and len(counts) == 0
+
+
+def test_deduplicate_labeled_fragments():
+    """
+    Check if the same fragment with other labels is kept in both groups.
+    """
+    true_fragments = fragments_list_to_array(["ACGT", "ACGT"], 4)
+    false_fragments = fragments_list_to_array(["ACGT", "CCCC", "CCCC", "CCCC"], 4)
+    unique_true, unique_false, weights = deduplicate_labeled_fragments(true_fragments, false_fragments)
+
+    assert fragments_array_to_list(unique_true) == ["ACGT"]
+    assert fragments_array_to_list(unique_false) == ["ACGT", "CCCC"]
+    assert weights.tolist() == [2, 1, 3]
+
+
+def test_save_and_load_weights_binary(tmp_path):
+    """
+    Check if weights are saved in binary file and loaded also partially.
+    """
+    true_fragments = fragments_list_to_array(["ACGTAAA", "NCGTAAA"], 7)
+    false_fragments = fragments_list_to_array(["TTTTRAA", "GGGGCCC", "AAAAAAA"], 7)
+    weights = np.array([5, 1, 70000, 2, 1])
+
+    for output in [tmp_path / "weights.dat", tmp_path / "weights.dat.gz"]:
+        save_fragments_binary(true_fragments, false_fragments, str(output), 3, 4, 1, False, weights=weights)
+
+        loaded = load_fragments_binary(str(output))
+        assert loaded["weighted"] and loaded["weights"].tolist() == weights.tolist()
+        assert fragments_array_to_list(loaded["fragments"]) == ["ACGTAAA", "NCGTAAA", "TTTTRAA", "GGGGCCC", "AAAAAAA"]
+        assert load_fragments_binary(str(output), 1, 3)["weights"].tolist() == [1, 70000]
+
+    save_fragments_binary(true_fragments, false_fragments, str(tmp_path / "plain.dat"), 3, 4, 1, False)
+    loaded = load_fragments_binary(str(tmp_path / "plain.dat"))
+    assert not loaded["weighted"] and loaded["weights"] is None
+
+
+def test_save_features_removes_old_weights(tmp_path):
+    """
+    Check if features saved without weights don't use weights left by previous run.
+    """
+    output = str(tmp_path / "result.dat")
+    save_features(np.zeros((2, 3)), np.array([1, 0]), output, np.array([2, 3]))
+    assert load_weights(output).tolist() == [2, 3]
+
+    save_features(np.zeros((2, 3)), np.array([1, 0]), output)
+    assert load_weights(output) is None
+
+
+def test_command_dedup(tmp_path):
+    """
+    Check if deduplicated result has the same fragments with counts and model trained on it is the same.
+    """
+    input_path = str(tmp_path / "data.dat")
+    save_synthetic_data(input_path, 30, 200, 400, intron_density=20, seed=7)
+
+    for name, dedup in [("all", []), ("dedup", ["--dedup"])]:
+        get_acceptors_and_donors_command(
+            ["-A", "2", "-B", "2", "-i", input_path, "-t", "DONOR", "-r", str(tmp_path / f"{name}.dat"),
+             "-f", "binary", "--features", "numbers"] + dedup
+        )
+        naive_bayes_command(["-i", str(tmp_path / f"{name}.dat"), "-m", str(tmp_path / f"{name}.npz")])
+
+    all_fragments = load_fragments_binary(str(tmp_path / "all.dat"))
+    dedup_fragments = load_fragments_binary(str(tmp_path / "dedup.dat"))
+    assert len(dedup_fragments["fragments"]) < len(all_fragments["fragments"])
+    assert dedup_fragments["weights"].sum() == len(all_fragments["fragments"])
+
+    counts = {}
+    for label, fragment in zip(all_fragments["labels"], fragments_array_to_list(all_fragments["fragments"])):
+        counts[(label, fragment)] = counts.get((label, fragment), 0) + 1
+    assert counts == {
+        (label, fragment): weight
+        for label, fragment, weight in zip(
+            dedup_fragments["labels"], fragments_array_to_list(dedup_fragments["fragments"]), dedup_fragments["weights"]
+        )
+    }
+
+    assert len(load_weights(str(tmp_path / "dedup.dat"))) == len(load_features(str(tmp_path / "dedup.dat"))[0])
+    assert not os.path.isfile(tmp_path / "all_weights.npy")
+
+    all_model = load_naive_bayes(str(tmp_path / "all.npz"))
+    dedup_model = load_naive_bayes(str(tmp_path / "dedup.npz"))
+    assert np.array_equal(all_model.counts_, dedup_model.counts_)
+    assert np.array_equal(all_model.class_counts_, dedup_model.class_counts_)
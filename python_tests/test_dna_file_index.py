@@ -0,0 +1,68 @@
+from python_code.dna_file_index import (
+    IndexedDnaFile,
+    get_dna_file_index,
+    get_index_path,
+)
+from python_code.get_acceptors_and_donors import (
+    dna_data_read,
+    indexed_dna_data_iter,
+)
+import io
+import os
+from python_tests.tests_utils import (
+    TEST_DATA,
+    SEQ_FROM_TEST_DATA,
+)
+
+SECOND_TEST_DATA: str = TEST_DATA.replace("Seq 21", "Seq 22").replace("TTTTGTCAG", "AAAAGTCAG")
+
+
+def test_indexed_dna_data_iter(tmp_path):
+    """
+    Test if sequences read using index are the same as read from file.
+    """
+    input_path = str(tmp_path / "data.dat")
+    with open(input_path, "w") as f:
+        f.write(TEST_DATA + SECOND_TEST_DATA)
+
+    with IndexedDnaFile(input_path) as dna_file:
+        assert dna_file.ids() == ["21", "22"]
+        with io.StringIO(TEST_DATA + SECOND_TEST_DATA) as f:
+            assert list(indexed_dna_data_iter(dna_file)) == dna_data_read(f)
+
+        assert list(indexed_dna_data_iter(dna_file, ["21"])) == [SEQ_FROM_TEST_DATA]
+        assert bytes(dna_file.section_view("22", "Data")).startswith(b"AAAAGTCAG")
+
+    assert os.path.isfile(get_index_path(input_path))
+
+
+def test_file_is_closed_after_iteration_stopped_early(tmp_path):
+    """
+    Test if file can be closed when iteration over sequences is stopped before the last sequence.
+    """
+    input_path = str(tmp_path / "data.dat")
+    with open(input_path, "w") as f:
+        f.write(TEST_DATA + SECOND_TEST_DATA)
+
+    with IndexedDnaFile(input_path) as dna_file:
+        sections = next(dna_file.iter_sections())
+        assert sections["Id"] == "21" and sections["Data"].startswith(b"TTTTGTCAG")
+
+    with IndexedDnaFile(input_path) as dna_file:
+        for dna_sequence in indexed_dna_data_iter(dna_file):
+            assert dna_sequence == SEQ_FROM_TEST_DATA
+            break
+
+
+def test_index_is_rebuilt_when_file_changes(tmp_path):
+    """
+    Test if index is created again when input file is changed.
+    """
+    input_path = str(tmp_path / "data.dat")
+    with open(input_path, "w") as f:
+        f.write(TEST_DATA)
+    assert len(get_dna_file_index(input_path)["sequences"]) == 1
+
+    with open(input_path, "a") as f:
+        f.write(SECOND_TEST_DATA)
+    assert len(get_dna_file_index(input_path)["sequences"]) == 2
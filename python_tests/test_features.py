@@ -0,0 +1,90 @@
+from python_code.binary_fragments import fragments_list_to_array
+from python_code.features import (
+    fragments_to_features,
+    fragments_to_numbers,
+    load_features,
+    numbers_to_one_hot,
+    ONE_HOT_FEATURES,
+)
+from python_code.get_acceptors_and_donors import (
+    dna_data_read,
+    get_acceptors_and_donors_command,
+    get_donors,
+)
+from python_code.synthetic_data import save_synthetic_data
+import io
+import numpy as np
+from python_tests.tests_utils import (
+    TEST_DATA,
+    TEST_A,
+    TEST_B,
+)
+
+# codes of nucleotides like ``nucleotide_to_number`` in utils.R
+NUCLEOTIDE_TO_NUMBER = {"A": 1, "C": 2, "G": 3, "T": 4, "N": 0}
+
+# one-hot-encoding like ``nucleotide_to_table`` in classification_NBC.py
+NUCLEOTIDE_TO_TABLE = {"A": [1, 0, 0, 0], "C": [0, 1, 0, 0], "G": [0, 0, 1, 0], "T": [0, 0, 0, 1], "N": [1, 1, 1, 1]}
+
+
+def test_fragments_to_numbers_and_one_hot():
+    """
+    Check if codes and one-hot-encoding are the same as converted nucleotide by nucleotide.
+    """
+    fragments = ["ACGTN", "NNTGA", "GGGCA"]
+    numbers = fragments_to_numbers(fragments_list_to_array(fragments, 5))
+
+    assert numbers.tolist() == [[NUCLEOTIDE_TO_NUMBER[x] for x in f] for f in fragments]
+    assert numbers_to_one_hot(numbers).tolist() == [sum((NUCLEOTIDE_TO_TABLE[x] for x in f), []) for f in fragments]
+
+
+def test_fragments_to_features():
+    """
+    Check if labels are 1 for true and 0 for false fragments.
+    """
+    features, labels = fragments_to_features(
+        fragments_list_to_array(["ACG"], 3), fragments_list_to_array(["TTT", "NNN"], 3), ONE_HOT_FEATURES
+    )
+
+    assert features.shape == (3, 12)
+    assert labels.tolist() == [1, 0, 0]
+
+
+def test_command_features(tmp_path):
+    """
+    Check if command saves features matrix and labels next to result file.
+    """
+    input_path = tmp_path / "data.dat"
+    input_path.write_text(TEST_DATA)
+    output = str(tmp_path / "donor.dat")
+
+    get_acceptors_and_donors_command(
+        ["-A", str(TEST_A), "-B", str(TEST_B), "-i", str(input_path), "-t", "DONOR", "-r", output, "--features", "numbers"]
+    )
+
+    with io.StringIO(TEST_DATA) as f:
+        true_seq, false_seq = get_donors(TEST_A, TEST_B, dna_data_read(f), False)
+
+    features, labels = load_features(output)
+    assert features.tolist() == [[NUCLEOTIDE_TO_NUMBER[x] for x in f] for f in true_seq + false_seq]
+    assert labels.tolist() == [1] * len(true_seq) + [0] * len(false_seq)
+
+
+def test_command_features_different_a_and_b(tmp_path):
+    """
+    Check if features of python engine with A != B are saved only for full fragments like by numpy engine.
+    """
+    input_path = str(tmp_path / "data.dat")
+    save_synthetic_data(input_path, 30, 40, 120, intron_density=20, seed=2)
+
+    for engine in ["python", "numpy"]:
+        get_acceptors_and_donors_command(
+            ["-A", "4", "-B", "10", "-i", input_path, "-t", "ACCEPTOR", "-e", engine,
+             "-r", str(tmp_path / f"{engine}.dat"), "--features", "numbers"]
+        )
+
+    python_features, python_labels = load_features(str(tmp_path / "python.dat"))
+    numpy_features, numpy_labels = load_features(str(tmp_path / "numpy.dat"))
+    assert python_features.shape[1] == 14 and len(python_features) > 0
+    assert np.array_equal(python_features, numpy_features)
+    assert np.array_equal(python_labels, numpy_labels)
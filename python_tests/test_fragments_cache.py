@@ -0,0 +1,83 @@
+from python_code import get_acceptors_and_donors
+from python_code.binary_fragments import fragments_list_to_array
+from python_code.fragments_cache import (
+    FragmentsCache,
+    get_cache_key,
+)
+from python_code.get_acceptors_and_donors import get_acceptors_and_donors_command
+import os
+import numpy as np
+from python_tests.tests_utils import (
+    TEST_DATA,
+    TEST_A,
+    TEST_B,
+    EXPECTED_TRUE_DONORS,
+    NO_OVERLAP_EXPECTED_FALSE_DONORS,
+)
+
+
+def test_fragments_cache_store_and_load(tmp_path):
+    """
+    Check if cached fragments are the same as stored and fragments which can't be saved aren't cached.
+    """
+    cache = FragmentsCache(str(tmp_path))
+    key = get_cache_key("digest", TEST_A, TEST_B, "DONOR", False, "python")
+
+    assert cache.load(key) is None
+    assert cache.store(key, EXPECTED_TRUE_DONORS, NO_OVERLAP_EXPECTED_FALSE_DONORS, TEST_A, TEST_B, 1, False)
+
+    true_fragments, false_fragments = cache.load(key)
+    assert np.array_equal(true_fragments, fragments_list_to_array(EXPECTED_TRUE_DONORS, TEST_A + TEST_B))
+    assert np.array_equal(false_fragments, fragments_list_to_array(NO_OVERLAP_EXPECTED_FALSE_DONORS, TEST_A + TEST_B))
+
+    other_key = get_cache_key("digest", TEST_A, TEST_B, "DONOR", True, "python")
+    assert other_key != key
+    assert not cache.store(other_key, ["ACG"], [], TEST_A, TEST_B, 1, True)
+    assert cache.load(other_key) is None
+
+
+def test_fragments_cache_evict(tmp_path):
+    """
+    Check if least recently used entries are removed when cache is above size limit.
+    """
+    fragments = fragments_list_to_array(["ACGTACG"] * 100, 7)
+    cache = FragmentsCache(str(tmp_path), size_limit=2**30)
+    for i, key in enumerate(["a", "b", "c"]):
+        cache.store(key, fragments, fragments, 3, 4, 1, False)
+        os.utime(cache.get_path(key), (i, i))
+    entry_size = os.path.getsize(cache.get_path("a"))
+
+    # "a" is used, so "b" is least recently used
+    assert cache.load("a") is not None
+    cache.size_limit = 2 * entry_size
+    cache.evict()
+
+    assert sorted(os.listdir(tmp_path)) == sorted([os.path.basename(cache.get_path(x)) for x in ["a", "c"]])
+
+
+def test_command_cache(tmp_path, monkeypatch):
+    """
+    Check if command run again with the same config reads fragments from cache and writes the same result.
+    """
+    input_path = tmp_path / "data.dat"
+    input_path.write_text(TEST_DATA)
+    cache_dir = tmp_path / "cache"
+
+    def run(result):
+        get_acceptors_and_donors_command(
+            ["-A", str(TEST_A), "-B", str(TEST_B), "-i", str(input_path), "-t", "BOTH",
+             "-r", str(tmp_path / result), "--cache_dir", str(cache_dir)]
+        )
+
+    run("first.dat")
+    assert len(os.listdir(cache_dir)) == 2
+
+    def fail(*args):
+        raise AssertionError("Fragments should be read from cache!")
+
+    monkeypatch.setattr(get_acceptors_and_donors, "get_fragments_of_command", fail)
+    run("second.dat")
+
+    for fragment_type in ["donor", "acceptor"]:
+        first = (tmp_path / f"first_{fragment_type}.dat").read_text()
+        assert first == (tmp_path / f"second_{fragment_type}.dat").read_text()
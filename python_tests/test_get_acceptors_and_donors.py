@@ -1,11 +1,26 @@
 from python_code.get_acceptors_and_donors import (
     dna_data_read,
+    dna_data_iter,
     get_acceptors,
     get_donors,
     DONOR_SEQ,
     ACCEPTOR_SEQ,
+    create_true_positions_index,
+    have_collision_with_true_fragment,
+    have_collisions_with_true_fragments,
+    get_acceptors_and_donors,
+    get_acceptors_and_donors_command,
+    find_fragment_positions,
+    find_donors_and_acceptors_positions,
+    get_fragments_sweep,
+    get_fragments_parallel,
+    iter_fragments,
+    save_fragments_stream,
+    save_sequences_to_file,
+    DnaFragmentType,
 )
 import io
+import random
 from python_tests.tests_utils import (
     TEST_DATA,
     SEQ_FROM_TEST_DATA,
@@ -30,6 +45,28 @@ def test_dna_data_split():
     assert sequences == [SEQ_FROM_TEST_DATA]
 
 
+def test_dna_data_iter():
+    """
+    Test if streaming reader yields the same sequences as ``dna_data_read``.
+    """
+    with io.StringIO(TEST_DATA * 3) as f:
+        sequences_iter = dna_data_iter(f)
+
+        assert next(sequences_iter) == SEQ_FROM_TEST_DATA
+        assert list(sequences_iter) == [SEQ_FROM_TEST_DATA, SEQ_FROM_TEST_DATA]
+
+
+def test_get_donors_from_iter():
+    """
+    Test if donors got from streaming reader are the same as from list of sequences.
+    """
+    with io.StringIO(TEST_DATA) as f:
+        sequences = dna_data_read(f)
+
+    with io.StringIO(TEST_DATA) as f:
+        assert get_donors(TEST_A, TEST_B, dna_data_iter(f), False) == get_donors(TEST_A, TEST_B, sequences, False)
+
+
 def test_get_acceptors_dummy():
     """
     Dummy test which check if read sequences of length 2 ar only acceptor sequence.
@@ -149,3 +186,182 @@ def test_get_donors_overlap():
 
     for x in f_d:
         assert x in OVERLAP_EXPECTED_FALSE_DONORS
+
+
+def test_have_collisions_with_true_fragments():
+    """
+    Check if batch collision check gives the same results as ``have_collision_with_true_fragment``.
+    """
+    rng = random.Random(42)
+
+    for overlap in [False, True]:
+        for _ in range(50):
+            a = rng.randint(0, 15)
+            b = rng.randint(0, 15)
+            true_positions = [rng.randint(0, 500) for _ in range(rng.randint(0, 20))]
+            positions = sorted(rng.randint(0, 500) for _ in range(100))
+
+            collisions = have_collisions_with_true_fragments(
+                create_true_positions_index(true_positions), a, b, positions, overlap
+            )
+
+            assert collisions == [
+                have_collision_with_true_fragment(true_positions, a, b, pos, overlap) for pos in positions
+            ]
+
+
+def test_find_donors_and_acceptors_positions():
+    """
+    Check if one scan finds the same positions as separate scans, also for overlapping "AGT".
+    """
+    rng = random.Random(42)
+    for sequence in ["AGTAGT", "".join(rng.choice("ACGTN") for _ in range(1000))]:
+        assert find_donors_and_acceptors_positions(sequence) == (
+            find_fragment_positions(sequence, DONOR_SEQ),
+            find_fragment_positions(sequence, ACCEPTOR_SEQ),
+        )
+
+
+def test_get_acceptors_and_donors():
+    """
+    Check if donors and acceptors got at once are the same as got separately.
+    """
+    with io.StringIO(TEST_DATA) as f:
+        sequences = dna_data_read(f)
+
+    for overlap in [False, True]:
+        t_d, f_d, t_a, f_a = get_acceptors_and_donors(TEST_A, TEST_B, sequences, overlap)
+
+        assert (t_d, f_d) == get_donors(TEST_A, TEST_B, sequences, overlap)
+        assert (t_a, f_a) == get_acceptors(TEST_A, TEST_B, sequences, overlap)
+
+
+def test_command_both_types(tmp_path):
+    """
+    Check if command with BOTH type writes the same files as separate runs.
+    """
+    input_path = tmp_path / "data.dat"
+    input_path.write_text(TEST_DATA)
+
+    for seq_type in ["DONOR", "ACCEPTOR", "BOTH"]:
+        get_acceptors_and_donors_command(
+            ["-A", str(TEST_A), "-B", str(TEST_B), "-i", str(input_path), "-t", seq_type,
+             "-r", str(tmp_path / f"{seq_type.lower()}.dat")]
+        )
+
+    assert (tmp_path / "both_donor.dat").read_text() == (tmp_path / "donor.dat").read_text()
+    assert (tmp_path / "both_acceptor.dat").read_text() == (tmp_path / "acceptor.dat").read_text()
+
+
+def test_get_fragments_sweep():
+    """
+    Check if fragments got from sweep are the same as got separately for each window.
+    """
+    with io.StringIO(TEST_DATA) as f:
+        sequences = dna_data_read(f)
+
+    windows = [(a, b) for a in range(0, 6) for b in range(0, 6)]
+    for overlap in [False, True]:
+        for fragment_types in [[DnaFragmentType.DONOR], [DnaFragmentType.DONOR, DnaFragmentType.ACCEPTOR]]:
+            result = get_fragments_sweep(windows, sequences, fragment_types, overlap)
+
+            for a, b in windows:
+                assert result[(DnaFragmentType.DONOR, (a, b))] == get_donors(a, b, sequences, overlap)
+                if DnaFragmentType.ACCEPTOR in fragment_types:
+                    assert result[(DnaFragmentType.ACCEPTOR, (a, b))] == get_acceptors(a, b, sequences, overlap)
+
+
+def test_get_fragments_sweep_duplicated_window():
+    """
+    Check if fragments of window given twice are got once.
+    """
+    with io.StringIO(TEST_DATA) as f:
+        sequences = dna_data_read(f)
+
+    result = get_fragments_sweep([(3, 4), (2, 2), (3, 4)], sequences, [DnaFragmentType.DONOR], False)
+    assert len(result) == 2
+    assert result[(DnaFragmentType.DONOR, (3, 4))] == get_donors(3, 4, sequences, False)
+
+
+def test_command_sweep(tmp_path):
+    """
+    Check if command with sweep writes the same files as separate runs.
+    """
+    input_path = tmp_path / "data.dat"
+    input_path.write_text(TEST_DATA)
+
+    get_acceptors_and_donors_command(
+        ["-s", "2,3:4", "-i", str(input_path), "-t", "DONOR", "-r", str(tmp_path / "sweep.dat")]
+    )
+
+    for a in [2, 3]:
+        get_acceptors_and_donors_command(
+            ["-A", str(a), "-B", "4", "-i", str(input_path), "-t", "DONOR", "-r", str(tmp_path / "donor.dat")]
+        )
+        assert (tmp_path / f"sweep_{a}_4.dat").read_text() == (tmp_path / "donor.dat").read_text()
+
+
+def test_get_fragments_parallel():
+    """
+    Check if fragments got using worker processes are the same and in the same order as got serially.
+    """
+    with io.StringIO(TEST_DATA * 5) as f:
+        sequences = dna_data_read(f)
+
+    fragment_types = [DnaFragmentType.DONOR, DnaFragmentType.ACCEPTOR]
+    for overlap in [False, True]:
+        result = get_fragments_parallel(TEST_A, TEST_B, iter(sequences), fragment_types, overlap, 2, 2)
+
+        assert result[DnaFragmentType.DONOR] == get_donors(TEST_A, TEST_B, sequences, overlap)
+        assert result[DnaFragmentType.ACCEPTOR] == get_acceptors(TEST_A, TEST_B, sequences, overlap)
+
+
+def test_get_fragments_parallel_sliding_window():
+    """
+    Check if chunks of different sizes merged as soon as they are done keep order of sequences.
+    """
+    sequences = [
+        {"Introns": [(4, 28)], "Exons": [], "Sequence": "".join(random.Random(i).choice("ACGT") for _ in range(n))}
+        for i, n in enumerate([2000, 40, 40, 3000, 40, 40, 40, 500, 40])
+    ]
+
+    result = get_fragments_parallel(TEST_A, TEST_B, iter(sequences), [DnaFragmentType.DONOR], False, 3, 1)
+    assert result[DnaFragmentType.DONOR] == get_donors(TEST_A, TEST_B, sequences, False)
+
+
+def test_iter_fragments():
+    """
+    Check if streamed fragments are the same as got by ``get_donors`` and ``get_acceptors``.
+    """
+    with io.StringIO(TEST_DATA * 2) as f:
+        sequences = dna_data_read(f)
+
+    for overlap in [False, True]:
+        for fragment_type, get_fragments in [(DnaFragmentType.DONOR, get_donors), (DnaFragmentType.ACCEPTOR, get_acceptors)]:
+            records = list(iter_fragments(TEST_A, TEST_B, iter(sequences), fragment_type, overlap))
+            true_seq, false_seq = get_fragments(TEST_A, TEST_B, sequences, overlap)
+
+            assert [x[3] for x in records if x[0] == 1] == true_seq
+            assert [x[3] for x in records if x[0] == 0] == false_seq
+            assert sorted(set(x[1] for x in records)) == [0, 1]
+            for label, seq_id, pos, fragment in records:
+                assert sequences[seq_id]["Sequence"][pos - TEST_A : pos + TEST_B] == fragment
+
+
+def test_save_fragments_stream(tmp_path):
+    """
+    Check if streamed fragments are saved the same as by ``save_sequences_to_file``.
+    """
+    with io.StringIO(TEST_DATA * 2) as f:
+        sequences = dna_data_read(f)
+
+    true_seq, false_seq = get_donors(TEST_A, TEST_B, sequences, False)
+    save_sequences_to_file(true_seq, false_seq, str(tmp_path / "list.dat"))
+
+    saved = save_fragments_stream(
+        iter_fragments(TEST_A, TEST_B, iter(sequences), DnaFragmentType.DONOR, False), str(tmp_path / "stream.dat"), buffer_size=16
+    )
+
+    assert saved == (len(true_seq), len(false_seq))
+    assert (tmp_path / "stream.dat").read_text() == (tmp_path / "list.dat").read_text()
+    assert len(list(tmp_path.iterdir())) == 2
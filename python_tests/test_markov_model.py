@@ -0,0 +1,112 @@
+from python_code.cross_validation import cross_validate_naive_bayes
+from python_code.features import save_features
+from python_code.markov_model import MarkovModel, get_context_codes, load_markov_model, markov_model_command
+from python_code.report import roc_auc, threshold_sweep
+import math
+import numpy as np
+
+
+def create_dependent_data(rows_num=600, positions_num=6, seed=3):
+    """
+    Create random codes where true fragments repeat nucleotide of previous position and frequencies
+    of single nucleotides are the same for both classes.
+    """
+    rng = np.random.RandomState(seed)
+    y = (rng.rand(rows_num) < 0.5).astype(np.uint8)
+    x = rng.randint(0, 4, size=(rows_num, positions_num)).astype(np.uint8)
+    x[y == 1, 3] = x[y == 1, 2]
+    return x, y
+
+
+def markov_log_likelihood(x, y, row, c, laplace, threshold=0.001):
+    """
+    Log likelihood of first order markov model computed position by position from counts.
+    """
+    class_rows = [r for r, label in zip(x, y) if label == c]
+    value = math.log(len(class_rows) / len(x))
+    for pos, code in enumerate(row):
+        context = [r for r in class_rows if pos == 0 or r[pos - 1] == row[pos - 1]]
+        count = sum(r[pos] == code for r in context)
+        prob = (count + laplace) / (len(context) + laplace * 5) if context or laplace else 0
+        value += math.log(prob if prob > 0 else threshold)
+    return value
+
+
+def test_get_context_codes():
+    """
+    Check if codes contain previous nucleotides and start symbol before fragment start.
+    """
+    x = np.array([[0, 1, 2, 3], [4, 4, 0, 2]], dtype=np.uint8)
+
+    assert get_context_codes(x, 1).tolist() == [[25, 1, 7, 13], [29, 24, 20, 2]]
+
+    codes = get_context_codes(x, 2)
+    assert codes.tolist()[0] == [0 + 5 * 5 + 30 * 5, 1 + 5 * 0 + 30 * 5, 2 + 5 * 1 + 30 * 0, 3 + 5 * 2 + 30 * 1]
+    assert codes.max() < 5 * 6**2
+
+    assert np.array_equal(get_context_codes(x, 0), x)
+
+
+def test_predict_proba_like_counts():
+    """
+    Check if log likelihood of first order model is the same as computed from counts of contexts.
+    """
+    x, y = create_dependent_data(rows_num=80)
+    test_x = np.array([[3, 1, 0, 0, 2, 2], [0, 2, 1, 1, 1, 1], [2, 4, 3, 3, 0, 0]], dtype=np.uint8)
+
+    for laplace in [0, 1]:
+        model = MarkovModel(order=1, laplace=laplace).fit(x, y)
+        log_likelihood = model.joint_log_likelihood(test_x, batch_size=2)
+        for row, row_log_likelihood in zip(test_x.tolist(), log_likelihood):
+            for c in [0, 1]:
+                expected = markov_log_likelihood(x.tolist(), y.tolist(), row, c, laplace)
+                assert math.isclose(row_log_likelihood[c], expected, rel_tol=1e-9)
+
+
+def test_fit_with_weights_and_partial_fit():
+    """
+    Check if weighted fragments and training in parts give the same model as repeated fragments.
+    """
+    x, y = create_dependent_data()
+    weights = np.arange(len(x)) % 3 + 1
+
+    weighted = MarkovModel(order=2, laplace=1).fit(x, y, weights)
+    repeated = MarkovModel(order=2, laplace=1).fit(np.repeat(x, weights, axis=0), np.repeat(y, weights))
+    assert np.array_equal(weighted.counts_, repeated.counts_)
+
+    parts = MarkovModel(order=2, laplace=1).partial_fit(x[:100], y[:100], weights[:100])
+    parts.partial_fit(x[100:], y[100:], weights[100:])
+    assert np.allclose(parts.log_prob_, weighted.log_prob_)
+
+
+def test_markov_model_better_than_naive_bayes():
+    """
+    Check if markov model finds dependency of neighbouring positions which naive bayes can't see.
+    """
+    x, y = create_dependent_data(rows_num=2000)
+
+    nb_proba, _ = cross_validate_naive_bayes(x, y, 5, 1.0, 0)
+    markov_proba, _ = cross_validate_naive_bayes(x, y, 5, 1.0, 0, model=MarkovModel(order=1, laplace=1.0))
+
+    assert np.allclose(markov_proba.sum(axis=1), 1)
+    assert roc_auc(threshold_sweep(markov_proba[:, 1], y)) > 0.85
+    assert roc_auc(threshold_sweep(nb_proba[:, 1], y)) < 0.7
+
+
+def test_command_save_load_and_update(tmp_path):
+    """
+    Check if model trained by command in two steps is the same as model trained on all fragments.
+    """
+    x, y = create_dependent_data()
+    save_features(x[:300], y[:300], str(tmp_path / "part1.dat"))
+    save_features(x[300:], y[300:], str(tmp_path / "part2.dat"))
+    model_path = str(tmp_path / "model.npz")
+
+    markov_model_command(["-i", str(tmp_path / "part1.dat"), "-m", model_path, "-k", "2", "-l", "1"])
+    markov_model_command(["-i", str(tmp_path / "part2.dat"), "-m", model_path, "-k", "2", "-u"])
+
+    model = load_markov_model(model_path)
+    expected = MarkovModel(order=2, laplace=1).fit(x, y)
+    assert model.order == 2 and model.laplace == 1
+    assert np.array_equal(model.counts_, expected.counts_)
+    assert np.allclose(model.predict_proba(x), expected.predict_proba(x))
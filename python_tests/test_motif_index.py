@@ -0,0 +1,123 @@
+from python_code import get_acceptors_and_donors
+from python_code.get_acceptors_and_donors import (
+    ACCEPTOR_SEQ,
+    DONOR_SEQ,
+    dna_data_read,
+    find_fragment_positions,
+    get_acceptors_and_donors_command,
+)
+from python_code.motif_index import (
+    attach_motif_positions,
+    create_motif_index,
+    get_motif_index,
+    get_motif_index_path,
+    get_sequence_positions,
+)
+from python_code.synthetic_data import save_synthetic_data
+import os
+import numpy as np
+import pytest
+
+
+def test_create_motif_index(tmp_path):
+    """
+    Check if index has positions found by scan and introns of every sequence in compact arrays.
+    """
+    input_path = str(tmp_path / "data.dat")
+    save_synthetic_data(input_path, 15, 100, 300, intron_density=20, seed=5)
+    with open(input_path) as f:
+        sequences = dna_data_read(f)
+
+    index = create_motif_index(input_path)
+    assert index["Donors"].dtype == np.uint32 and len(index["Donors_offsets"]) == len(sequences) + 1
+
+    for number, dna_sequence in enumerate(sequences):
+        positions = get_sequence_positions(index, number)
+        assert positions["Donors"] == find_fragment_positions(dna_sequence["Sequence"], DONOR_SEQ)
+        assert positions["Acceptors"] == find_fragment_positions(dna_sequence["Sequence"], ACCEPTOR_SEQ)
+        assert positions["Introns"] == dna_sequence["Introns"]
+
+    with pytest.raises(IndexError):
+        get_sequence_positions(index, len(sequences))
+
+
+def test_get_motif_index_is_saved_and_checked(tmp_path):
+    """
+    Check if saved index is used again and created again after change of input file.
+    """
+    input_path = str(tmp_path / "data.dat")
+    save_synthetic_data(input_path, 5, 100, 200, intron_density=20, seed=1)
+
+    index = get_motif_index(input_path)
+    index_path = get_motif_index_path(input_path)
+    assert os.path.isfile(index_path)
+
+    # saved index is loaded, not created
+    mtime = os.stat(index_path).st_mtime_ns
+    assert np.array_equal(get_motif_index(input_path)["Donors"], index["Donors"])
+    assert os.stat(index_path).st_mtime_ns == mtime
+
+    save_synthetic_data(input_path, 8, 100, 200, intron_density=20, seed=2)
+    assert len(get_motif_index(input_path)["Donors_offsets"]) == 9
+
+
+def test_command_with_motif_index(tmp_path, monkeypatch):
+    """
+    Check if command with motif index writes the same files as command which scans sequences
+    and doesn't scan sequences.
+    """
+    input_path = str(tmp_path / "data.dat")
+    save_synthetic_data(input_path, 20, 100, 300, intron_density=20, seed=4)
+    runs = [
+        ["-t", "DONOR"],
+        ["-t", "ACCEPTOR", "-o"],
+        ["-t", "BOTH"],
+        ["-t", "DONOR", "-e", "numpy", "-f", "binary"],
+        ["-t", "ACCEPTOR", "-s", "2,3:4"],
+        ["-t", "DONOR", "--ids", "3", "7", "1"],
+        ["-t", "ACCEPTOR", "-w", "2", "--chunk_size", "4"],
+    ]
+    for i, run in enumerate(runs):
+        get_acceptors_and_donors_command(
+            ["-A", "3", "-B", "4", "-i", input_path, "-r", str(tmp_path / f"scan_{i}.dat")] + run
+        )
+
+    get_motif_index(input_path)
+
+    def fail(*args):
+        raise AssertionError("Sequence was scanned!")
+
+    monkeypatch.setattr(get_acceptors_and_donors, "find_fragment_positions", fail)
+    monkeypatch.setattr(get_acceptors_and_donors, "find_donors_and_acceptors_positions", fail)
+    monkeypatch.setattr("python_code.numpy_fragments.find_fragment_positions_array", fail)
+
+    for i, run in enumerate(runs[:-1]):
+        get_acceptors_and_donors_command(
+            ["-A", "3", "-B", "4", "-i", input_path, "-r", str(tmp_path / f"index_{i}.dat"), "--motif_index"] + run
+        )
+    monkeypatch.undo()
+    get_acceptors_and_donors_command(
+        ["-A", "3", "-B", "4", "-i", input_path, "-r", str(tmp_path / f"index_{len(runs) - 1}.dat"), "--motif_index"]
+        + runs[-1]
+    )
+
+    scan_files = sorted(x for x in os.listdir(tmp_path) if x.startswith("scan_"))
+    assert len(scan_files) > len(runs)
+    for name in scan_files:
+        index_name = name.replace("scan_", "index_")
+        assert (tmp_path / index_name).read_bytes() == (tmp_path / name).read_bytes()
+
+
+def test_attach_motif_positions_of_chosen_sequences(tmp_path):
+    """
+    Check if positions of sequences read out of file order are taken by their numbers.
+    """
+    input_path = str(tmp_path / "data.dat")
+    save_synthetic_data(input_path, 6, 100, 200, intron_density=20, seed=6)
+    with open(input_path) as f:
+        sequences = dna_data_read(f)
+
+    chosen = [sequences[4], sequences[0]]
+    attached = list(attach_motif_positions([dict(x) for x in chosen], get_motif_index(input_path), [4, 0]))
+    for dna_sequence, attached_sequence in zip(chosen, attached):
+        assert attached_sequence["Donors"] == find_fragment_positions(dna_sequence["Sequence"], DONOR_SEQ)
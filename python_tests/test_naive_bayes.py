@@ -0,0 +1,127 @@
+from python_code.features import save_features
+from python_code.naive_bayes import (
+    CategoricalNaiveBayes,
+    load_naive_bayes,
+    naive_bayes_command,
+)
+import math
+import numpy as np
+
+
+def e1071_posterior(x, y, row, laplace, threshold=0.001):
+    """
+    Posterior of true class computed like ``e1071::naiveBayes`` - row by row, feature by feature.
+    """
+    log_likelihood = []
+    for c in [0, 1]:
+        class_rows = [r for r, label in zip(x, y) if label == c]
+        value = math.log(len(class_rows))
+        for pos, code in enumerate(row):
+            levels = len(set(r[pos] for r in x))
+            prob = (sum(r[pos] == code for r in class_rows) + laplace) / (len(class_rows) + laplace * levels)
+            value += math.log(prob if prob > 0 else threshold)
+        log_likelihood.append(value)
+    return 1 / (1 + math.exp(log_likelihood[0] - log_likelihood[1]))
+
+
+def create_random_data(rows_num=200, positions_num=6, seed=42):
+    """
+    Create random codes where first position depends on class.
+    """
+    rng = np.random.RandomState(seed)
+    y = (rng.rand(rows_num) < 0.3).astype(np.uint8)
+    x = rng.randint(0, 5, size=(rows_num, positions_num)).astype(np.uint8)
+    x[y == 1, 0] = 3
+    x[:, 1] = np.where(rng.rand(rows_num) < 0.5, 1, 2)
+    return x, y
+
+
+def test_predict_proba_like_e1071():
+    """
+    Check if posteriors are the same as computed like in ``e1071::naiveBayes``.
+    """
+    x, y = create_random_data()
+    test_x = np.array([[3, 1, 0, 4, 2, 2], [0, 2, 1, 1, 1, 1], [2, 0, 3, 3, 4, 0]], dtype=np.uint8)
+
+    for laplace in [0, 1]:
+        model = CategoricalNaiveBayes(laplace=laplace).fit(x, y)
+        proba = model.predict_proba(test_x, batch_size=2)
+
+        assert np.allclose(proba.sum(axis=1), 1)
+        for row, row_proba in zip(test_x.tolist(), proba):
+            assert math.isclose(row_proba[1], e1071_posterior(x.tolist(), y.tolist(), row, laplace), rel_tol=1e-9)
+
+
+def test_fit_with_weights():
+    """
+    Check if weighted fragments give the same model as repeated fragments.
+    """
+    x, y = create_random_data()
+    weights = np.arange(len(x)) % 3 + 1
+
+    weighted_model = CategoricalNaiveBayes(laplace=1).fit(x, y, weights)
+    repeated_model = CategoricalNaiveBayes(laplace=1).fit(np.repeat(x, weights, axis=0), np.repeat(y, weights))
+
+    assert np.allclose(weighted_model.predict_proba(x), repeated_model.predict_proba(x))
+
+
+def test_priors_and_log_odds():
+    """
+    Check if given priors are used and log odds table gives the same scores as posteriors.
+    """
+    x, y = create_random_data()
+    model = CategoricalNaiveBayes(laplace=1, priors=[0.5, 0.5]).fit(x, y)
+
+    log_proba = model.predict_log_proba(x)
+    scores = model.log_odds_table()[np.arange(x.shape[1]), x].sum(axis=1) + model.log_prior_odds()
+
+    assert np.allclose(scores, log_proba[:, 1] - log_proba[:, 0])
+    assert model.predict(x).tolist() == (scores > 0).astype(int).tolist()
+
+
+def test_partial_fit_and_merge():
+    """
+    Check if model trained on batches or merged from parts is the same as trained at once.
+    """
+    x, y = create_random_data()
+    model = CategoricalNaiveBayes(laplace=1).fit(x, y)
+
+    partial_model = CategoricalNaiveBayes(laplace=1)
+    for begin in range(0, len(x), 70):
+        partial_model.partial_fit(x[begin : begin + 70], y[begin : begin + 70])
+
+    merged_model = CategoricalNaiveBayes(laplace=1).fit(x[:50], y[:50]).merge(
+        CategoricalNaiveBayes(laplace=1).fit(x[50:], y[50:])
+    )
+
+    for other in [partial_model, merged_model]:
+        assert np.array_equal(other.counts_, model.counts_)
+        assert np.allclose(other.predict_proba(x), model.predict_proba(x))
+
+
+def test_save_and_load(tmp_path):
+    """
+    Check if loaded model gives the same posteriors and can be updated.
+    """
+    x, y = create_random_data()
+    model_path = str(tmp_path / "model.npz")
+    CategoricalNaiveBayes(laplace=1, priors=[0.4, 0.6]).fit(x[:100], y[:100]).save(model_path)
+
+    model = load_naive_bayes(model_path).partial_fit(x[100:], y[100:])
+
+    assert np.allclose(model.predict_proba(x), CategoricalNaiveBayes(laplace=1, priors=[0.4, 0.6]).fit(x, y).predict_proba(x))
+
+
+def test_naive_bayes_command_update(tmp_path):
+    """
+    Check if command trained on two files one by one gives the same model as trained on both.
+    """
+    x, y = create_random_data()
+    for name, part in [("first.dat", slice(0, 120)), ("second.dat", slice(120, None))]:
+        save_features(x[part], y[part], str(tmp_path / name))
+
+    model_path = str(tmp_path / "model.npz")
+    naive_bayes_command(["-i", str(tmp_path / "first.dat"), "-m", model_path, "-l", "1"])
+    naive_bayes_command(["-i", str(tmp_path / "second.dat"), "-m", model_path, "-u"])
+
+    assert np.array_equal(load_naive_bayes(model_path).counts_, CategoricalNaiveBayes().fit(x, y).counts_)
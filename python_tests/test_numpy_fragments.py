@@ -0,0 +1,107 @@
+from python_code.get_acceptors_and_donors import (
+    dna_data_read,
+    get_acceptors,
+    get_donors,
+    get_false_fragments,
+    get_true_fragments,
+    create_true_positions_index,
+    have_collisions_with_true_fragments,
+    find_fragment_positions,
+    DONOR_SEQ,
+    ACCEPTOR_SEQ,
+)
+from python_code.numpy_fragments import (
+    encode_sequence,
+    find_fragment_positions_array,
+    fragments_array_to_list,
+    get_collisions_mask,
+    get_false_fragments_array,
+    get_fragments_arrays,
+    get_true_fragments_array,
+)
+import io
+import random
+import numpy as np
+from python_tests.tests_utils import (
+    TEST_DATA,
+    TEST_A,
+    TEST_B,
+)
+
+
+def full_fragments(fragments, a_len, b_len):
+    """
+    Take only fragments of length ``a_len + b_len`` - numpy engine skips truncated fragments.
+    """
+    return [x for x in fragments if len(x) == a_len + b_len]
+
+
+def test_find_fragment_positions_array():
+    """
+    Check if vectorized scan finds the same positions as ``find_fragment_positions``.
+    """
+    rng = random.Random(42)
+    for sequence in ["", "G", "AGTAGT", "".join(rng.choice("ACGTN") for _ in range(1000))]:
+        for fragment in [DONOR_SEQ, ACCEPTOR_SEQ]:
+            positions = find_fragment_positions_array(encode_sequence(sequence), fragment)
+            assert positions.tolist() == find_fragment_positions(sequence, fragment)
+
+
+def test_get_collisions_mask():
+    """
+    Check if vectorized collisions check gives the same results as ``have_collisions_with_true_fragments``.
+    """
+    rng = random.Random(42)
+    for overlap in [False, True]:
+        for _ in range(50):
+            a = rng.randint(0, 15)
+            b = rng.randint(0, 15)
+            true_positions = sorted(rng.randint(0, 500) for _ in range(rng.randint(0, 20)))
+            positions = sorted(rng.randint(0, 500) for _ in range(100))
+
+            mask = get_collisions_mask(np.array(true_positions, dtype=np.int64), a, b, np.array(positions), overlap)
+            assert mask.tolist() == have_collisions_with_true_fragments(
+                create_true_positions_index(true_positions), a, b, positions, overlap
+            )
+
+
+def test_fragments_arrays_equal_reference():
+    """
+    Check if array engine gives the same fragments as reference functions on random sequences.
+    """
+    rng = random.Random(42)
+    for _ in range(30):
+        sequence = "".join(rng.choice("ACGTN") for _ in range(rng.randint(0, 300)))
+        true_positions = sorted(rng.sample(range(len(sequence)), min(5, len(sequence))))
+        a = rng.randint(0, 20)
+        b = rng.randint(0, 20)
+        codes = encode_sequence(sequence)
+
+        assert fragments_array_to_list(
+            get_true_fragments_array(np.array(true_positions, dtype=np.int64), a, b, codes)
+        ) == full_fragments(get_true_fragments(true_positions, a, b, sequence), a, b)
+
+        for overlap in [False, True]:
+            for fragment in [DONOR_SEQ, ACCEPTOR_SEQ]:
+                assert fragments_array_to_list(
+                    get_false_fragments_array(np.array(true_positions, dtype=np.int64), a, b, codes, fragment, overlap)
+                ) == full_fragments(get_false_fragments(true_positions, a, b, sequence, fragment, overlap), a, b)
+
+
+def test_get_fragments_arrays():
+    """
+    Check if array engine gives the same donors and acceptors as ``get_donors`` and ``get_acceptors``.
+    """
+    with io.StringIO(TEST_DATA) as f:
+        sequences = dna_data_read(f)
+
+    for overlap in [False, True]:
+        true_seq, false_seq = get_fragments_arrays(TEST_A, TEST_B, sequences, DONOR_SEQ, overlap)
+        assert (fragments_array_to_list(true_seq), fragments_array_to_list(false_seq)) == get_donors(
+            TEST_A, TEST_B, sequences, overlap
+        )
+
+        true_seq, false_seq = get_fragments_arrays(TEST_A, TEST_B, sequences, ACCEPTOR_SEQ, overlap)
+        assert (fragments_array_to_list(true_seq), fragments_array_to_list(false_seq)) == get_acceptors(
+            TEST_A, TEST_B, sequences, overlap
+        )
@@ -0,0 +1,119 @@
+from python_code.binary_fragments import load_fragments_binary
+from python_code.cross_validation import stratified_split
+from python_code.pipeline import pipeline_command
+from python_code.synthetic_data import save_synthetic_data
+import os
+import numpy as np
+import pytest
+
+
+def test_stratified_split():
+    """
+    Check if train set has given proportion of each class.
+    """
+    labels = np.array([1] * 20 + [0] * 80)
+    train = stratified_split(labels, 0.25, seed=1)
+
+    assert train[labels == 1].sum() == 5
+    assert train[labels == 0].sum() == 20
+
+
+def test_pipeline_command(tmp_path):
+    """
+    Check if pipeline creates report directory with fragments, report and description of run.
+    """
+    input_path = str(tmp_path / "data.dat")
+    save_synthetic_data(input_path, 20, 200, 400, intron_density=20, seed=3)
+
+    for validation in ["sv", "cv"]:
+        report_root = tmp_path / validation
+        pipeline_command(
+            ["-i", input_path, "-A", "5", "-B", "5", "-t", "DONOR", "-v", validation,
+             "-k", "3", "-l", "1", "-s", "1", "-r", str(report_root), "--profile"]
+        )
+
+        report_dirs = os.listdir(report_root)
+        assert len(report_dirs) == 1 and report_dirs[0].startswith("report_")
+        report_dir = report_root / report_dirs[0]
+        assert sorted(os.listdir(report_dir)) == ["donor.dat", "nb_report.txt", "profile.json", "report.txt"]
+
+        fragments = load_fragments_binary(str(report_dir / "donor.dat"))
+        assert fragments["a_len"] == 5 and fragments["labels"].sum() > 0
+        assert "Confusion Matrix and Statistics" in (report_dir / "nb_report.txt").read_text()
+        assert (report_dir / "report.txt").read_text() == (
+            f"A length: 5, B length: 5\nType: DONOR\nOverlap: \nValidation: {validation}\n"
+        )
+
+
+def test_pipeline_command_markov_model(tmp_path):
+    """
+    Check if pipeline validates markov model and names report by model.
+    """
+    input_path = str(tmp_path / "data.dat")
+    save_synthetic_data(input_path, 20, 200, 400, intron_density=20, seed=3)
+
+    pipeline_command(
+        ["-i", input_path, "-A", "5", "-B", "5", "-t", "ACCEPTOR", "-m", "markov", "--order", "2",
+         "-k", "3", "-l", "1", "-r", str(tmp_path / "markov")]
+    )
+
+    report_dir = tmp_path / "markov" / os.listdir(tmp_path / "markov")[0]
+    assert "markov_report.txt" in os.listdir(report_dir)
+    assert "Confusion Matrix and Statistics" in (report_dir / "markov_report.txt").read_text()
+
+
+def test_pipeline_command_error_doesnt_create_report_dir(tmp_path):
+    """
+    Check if pipeline which can't read input file doesn't leave empty report directory.
+    """
+    input_path = str(tmp_path / "data.dat.gz")
+    save_synthetic_data(input_path, 30, 40, 120, intron_density=20, seed=2)
+    with open(input_path, "rb") as f:
+        data = f.read()
+    # truncated gzip stream
+    with open(input_path, "wb") as f:
+        f.write(data[: len(data) // 2])
+    report_root = tmp_path / "reports"
+    report_root.mkdir()
+
+    with pytest.raises(EOFError):
+        pipeline_command(["-i", input_path, "-A", "4", "-B", "4", "-t", "DONOR", "-r", str(report_root)])
+    assert os.listdir(report_root) == []
+
+
+def test_pipeline_command_different_a_and_b(tmp_path):
+    """
+    Check if python engine with A != B skips fragments which don't fit in sequence like numpy engine.
+    """
+    input_path = str(tmp_path / "data.dat")
+    save_synthetic_data(input_path, 30, 40, 120, intron_density=20, seed=2)
+
+    for engine in ["python", "numpy"]:
+        pipeline_command(
+            ["-i", input_path, "-A", "4", "-B", "10", "-t", "DONOR", "-e", engine, "-r", str(tmp_path / engine)]
+        )
+
+    python_fragments, numpy_fragments = [
+        load_fragments_binary(str(tmp_path / engine / os.listdir(tmp_path / engine)[0] / "donor.dat"))
+        for engine in ["python", "numpy"]
+    ]
+    assert python_fragments["labels"].sum() > 0
+    assert np.array_equal(python_fragments["fragments"], numpy_fragments["fragments"])
+    assert np.array_equal(python_fragments["labels"], numpy_fragments["labels"])
+
+
+def test_pipeline_command_cache_size(tmp_path):
+    """
+    Check if pipeline stores fragments in cache directory with given size limit.
+    """
+    input_path = str(tmp_path / "data.dat")
+    save_synthetic_data(input_path, 20, 200, 400, intron_density=20, seed=3)
+    cache_dir = tmp_path / "cache"
+
+    # with limit 0 new entry removes all entries
+    for window, cache_size, entries_num in [("5", "1", 1), ("6", "0", 0)]:
+        pipeline_command(
+            ["-i", input_path, "-A", window, "-B", window, "-t", "DONOR", "-r", str(tmp_path / window),
+             "--cache_dir", str(cache_dir), "--cache_size", cache_size]
+        )
+        assert len([x for x in os.listdir(cache_dir) if x.endswith(".dnaf")]) == entries_num
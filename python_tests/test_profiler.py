@@ -0,0 +1,84 @@
+from python_code.get_acceptors_and_donors import get_acceptors_and_donors_command
+from python_code.profiler import StageProfiler, profile_stage
+import json
+import time
+import pytest
+from python_tests.tests_utils import (
+    TEST_DATA,
+    TEST_A,
+    TEST_B,
+)
+
+
+def test_stage_profiler():
+    """
+    Check if time of nested stage isn't counted in outer stage and elements of iterable are counted.
+    """
+    profiler = StageProfiler(trace_memory=False)
+    with profiler.stage("outer"):
+        with profiler.stage("inner"):
+            time.sleep(0.05)
+        assert list(profiler.iter_stage("read", range(3), "elements")) == [0, 1, 2]
+    profiler.count("events", 5)
+
+    report = profiler.report()
+    assert report["stages"]["inner"]["time"] >= 0.05
+    assert report["stages"]["outer"]["time"] < 0.05
+    assert report["stages"]["read"]["calls"] == 4
+    assert report["counters"] == {"elements": 3, "events": 5}
+
+
+def test_stage_profiler_memory():
+    """
+    Check if peak memory of stage contains memory allocated inside it.
+    """
+    profiler = StageProfiler()
+    with profiler.stage("allocate"):
+        data = bytearray(10 ** 6)
+    del data
+    report = profiler.report()
+    profiler.save("-")
+
+    assert report["stages"]["allocate"]["peak_memory"] >= 10 ** 6
+    assert report["peak_memory"] >= 10 ** 6
+
+
+def test_command_profile(tmp_path):
+    """
+    Check if command with profile saves the same result and reports stages and counters.
+    """
+    input_path = tmp_path / "data.dat"
+    input_path.write_text(TEST_DATA)
+
+    for seq_type in ["DONOR", "BOTH"]:
+        args = ["-A", str(TEST_A), "-B", str(TEST_B), "-i", str(input_path), "-t", seq_type]
+        get_acceptors_and_donors_command(args + ["-r", str(tmp_path / "result.dat")])
+        get_acceptors_and_donors_command(
+            args + ["-r", str(tmp_path / "profiled.dat"), "--profile", str(tmp_path / "profile.json")]
+        )
+
+        suffix = "_donor" if seq_type == "BOTH" else ""
+        result = (tmp_path / f"result{suffix}.dat").read_text()
+        assert result == (tmp_path / f"profiled{suffix}.dat").read_text()
+
+        with open(tmp_path / "profile.json") as profile_f:
+            report = json.load(profile_f)
+        assert {"parse", "motif_scan", "collision_filtering", "slicing", "write"} <= set(report["stages"])
+        assert report["counters"]["sequences_read"] == 1
+
+    # counters of last run with both types
+    written_lines = sum(len((tmp_path / f"profiled_{x}.dat").read_text().splitlines()) for x in ["donor", "acceptor"])
+    assert report["counters"]["fragments_written"] == written_lines // 2
+    assert report["counters"]["true_fragments"] == 2
+
+
+def test_profile_stage_without_profiler():
+    """
+    Check if stage without profiler does nothing and doesn't hide exceptions.
+    """
+    with profile_stage(None, "stage") as stage:
+        assert stage is None
+
+    with pytest.raises(KeyError):
+        with profile_stage(None, "stage"):
+            raise KeyError("stage")
@@ -0,0 +1,101 @@
+from python_code.features import save_features
+from python_code.report import (
+    binomial_confidence_interval,
+    confusion_matrix,
+    confusion_matrix_statistics,
+    pr_auc,
+    report_command,
+    roc_auc,
+    threshold_sweep,
+)
+import numpy as np
+
+
+def test_threshold_sweep():
+    """
+    Check if precision and recall of every cutoff are the same as computed directly, also for equal scores.
+    """
+    rng = np.random.RandomState(7)
+    labels = rng.randint(0, 2, 300)
+    scores = np.round(rng.rand(300) + labels * 0.3, 1)
+
+    sweep = threshold_sweep(scores, labels)
+
+    assert np.array_equal(sweep["thresholds"], np.unique(scores)[::-1])
+    for i, cutoff in enumerate(sweep["thresholds"]):
+        predicted = scores >= cutoff
+        tp = (predicted & (labels == 1)).sum()
+        assert sweep["tp"][i] == tp
+        assert np.isclose(sweep["precision"][i], tp / predicted.sum())
+        assert np.isclose(sweep["recall"][i], tp / labels.sum())
+
+
+def test_roc_auc():
+    """
+    Check if ROC AUC is the same as probability that true fragment has higher score than false one.
+    """
+    rng = np.random.RandomState(3)
+    labels = rng.randint(0, 2, 200)
+    scores = np.round(rng.rand(200) + labels * 0.5, 1)
+
+    true_scores = scores[labels == 1][:, np.newaxis]
+    false_scores = scores[labels == 0][np.newaxis, :]
+    expected = ((true_scores > false_scores) + 0.5 * (true_scores == false_scores)).mean()
+
+    assert np.isclose(roc_auc(threshold_sweep(scores, labels)), expected)
+
+
+def test_pr_auc():
+    """
+    Check PR AUC of perfect and reversed scores.
+    """
+    labels = np.array([1, 1, 0, 0, 0])
+    assert np.isclose(pr_auc(threshold_sweep(np.array([5, 4, 3, 2, 1]), labels)), 1)
+    assert pr_auc(threshold_sweep(np.array([1, 2, 3, 4, 5]), labels)) < 0.5
+
+
+def test_confusion_matrix_statistics():
+    """
+    Check statistics against values computed by ``caret::confusionMatrix`` and ``binom.test``.
+    """
+    predicted = np.array([0] * 50 + [1] * 50)
+    labels = np.array([0] * 45 + [1] * 5 + [0] * 10 + [1] * 40)
+    matrix = confusion_matrix(predicted, labels)
+    assert matrix.tolist() == [[45, 5], [10, 40]]
+
+    statistics = confusion_matrix_statistics(matrix)
+    assert np.isclose(statistics["Accuracy"], 0.85)
+    assert np.isclose(statistics["Sensitivity"], 45 / 55)
+    assert np.isclose(statistics["Specificity"], 40 / 45)
+    assert np.isclose(statistics["Kappa"], 0.7)
+    assert np.isclose(statistics["McnemarPValue"], 0.3017, atol=1e-4)
+    assert np.allclose(binomial_confidence_interval(95, 100), (0.8871651, 0.9835681))
+
+
+def test_report_command(tmp_path):
+    """
+    Check if report file contains aucs and confusion matrix.
+    """
+    labels = np.array([1, 1, 0, 0, 0, 1], dtype=np.uint8)
+    save_features(np.zeros((6, 2), dtype=np.uint8), labels, str(tmp_path / "result.dat"))
+    np.save(tmp_path / "proba.npy", np.array([0.9, 0.8, 0.3, 0.6, 0.1, 0.4]))
+
+    report_command(
+        [
+            "-p",
+            str(tmp_path / "proba.npy"),
+            "-i",
+            str(tmp_path / "result.dat"),
+            "-r",
+            str(tmp_path),
+            "--sweep",
+            str(tmp_path / "sweep.tsv"),
+        ]
+    )
+
+    report = (tmp_path / "nb_report.txt").read_text()
+    assert "ROC 0.8888889" in report
+    assert "Confusion Matrix and Statistics" in report
+    assert "         0 2 1" in report
+    assert "       'Positive' Class : 0" in report
+    assert len((tmp_path / "sweep.tsv").read_text().splitlines()) == 7
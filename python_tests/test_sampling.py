@@ -0,0 +1,139 @@
+from python_code.get_acceptors_and_donors import (
+    DONOR_SEQ,
+    DnaFragmentType,
+    get_acceptors_and_donors,
+    get_acceptors_and_donors_command,
+    get_donors,
+    get_fragments_profiled,
+    iter_fragments,
+)
+from python_code.numpy_fragments import fragments_array_to_list, get_fragments_arrays
+from python_code.profiler import StageProfiler
+from python_code.sampling import FalseFragmentsSampler
+from python_code.synthetic_data import create_synthetic_sequences, save_synthetic_data
+import pytest
+
+
+def is_subsequence(fragments, all_fragments):
+    """
+    Check if ``fragments`` are in ``all_fragments`` in the same order.
+    """
+    all_iter = iter(all_fragments)
+    return all(x in all_iter for x in fragments)
+
+
+def test_sampler_arguments():
+    """
+    Check if sampler needs exactly one of count and ratio.
+    """
+    with pytest.raises(ValueError):
+        FalseFragmentsSampler()
+    with pytest.raises(ValueError):
+        FalseFragmentsSampler(count=1, ratio=1.0)
+    with pytest.raises(ValueError):
+        FalseFragmentsSampler(count=-1)
+
+
+def test_sampler_count():
+    """
+    Check if reservoir keeps given number of fragments in order of stream and draws them uniformly.
+    """
+    hits = [0] * 10
+    for seed in range(2000):
+        sampler = FalseFragmentsSampler(count=3, seed=seed)
+        assert sampler.sample(list(range(4)), 1, str) == []
+        assert sampler.sample(list(range(4, 10)), 1, str) == []
+        drawn = sampler.finish()
+
+        assert len(drawn) == 3 and drawn == sorted(drawn, key=int)
+        for x in drawn:
+            hits[int(x)] += 1
+    assert all(abs(x / 2000 - 0.3) < 0.05 for x in hits)
+
+    sampler = FalseFragmentsSampler(count=20, seed=1)
+    sampler.sample(list(range(10)), 1, str)
+    assert sampler.finish() == [str(x) for x in range(10)]
+    assert sampler.finish() == []
+
+
+def test_sampler_ratio():
+    """
+    Check if each sequence gets quota for its true fragments and not used quota moves to next sequences.
+    """
+    sampler = FalseFragmentsSampler(ratio=1.5, seed=1)
+    first = sampler.sample(list(range(10)), 2, str)
+    assert len(first) == 3 and first == sorted(first, key=int)
+    # quota 0.5 + 3 is bigger than number of fragments
+    assert sampler.sample([10, 11], 2, str) == ["10", "11"]
+    assert len(sampler.sample(list(range(12, 30)), 0, str)) == 1
+    assert sampler.sample(list(range(30, 40)), 0, str) == []
+    assert sampler.finish() == []
+
+
+def test_get_donors_sampled():
+    """
+    Check if sampled false donors are drawn from all false donors and true donors are unchanged.
+    """
+    sequences = list(create_synthetic_sequences(30, 200, 400, 20.0, 0.0, 7))
+    true_seq, false_seq = get_donors(5, 5, sequences, False)
+
+    sampled_true, sampled_false = get_donors(5, 5, sequences, False, FalseFragmentsSampler(count=25, seed=2))
+    assert sampled_true == true_seq
+    assert len(sampled_false) == 25 and is_subsequence(sampled_false, false_seq)
+    assert get_donors(5, 5, sequences, False, FalseFragmentsSampler(count=25, seed=2))[1] == sampled_false
+
+    sampled_true, sampled_false = get_donors(5, 5, sequences, False, FalseFragmentsSampler(ratio=0.5, seed=2))
+    assert sampled_true == true_seq
+    assert len(sampled_false) == len(true_seq) // 2 and is_subsequence(sampled_false, false_seq)
+
+
+def test_sampled_engines():
+    """
+    Check if all ways of getting fragments draw the same false fragments for the same seed.
+    """
+    sequences = list(create_synthetic_sequences(30, 200, 400, 20.0, 0.0, 7))
+
+    for parameters in [{"count": 25}, {"ratio": 1.5}]:
+        expected = get_donors(5, 5, sequences, True, FalseFragmentsSampler(seed=3, **parameters))
+
+        true_array, false_array = get_fragments_arrays(
+            5, 5, sequences, DONOR_SEQ, True, FalseFragmentsSampler(seed=3, **parameters)
+        )
+        assert (fragments_array_to_list(true_array), fragments_array_to_list(false_array)) == expected
+
+        sampler = FalseFragmentsSampler(seed=3, **parameters)
+        records = list(iter_fragments(5, 5, sequences, DnaFragmentType.DONOR, True, sampler=sampler))
+        records += sampler.finish()
+        assert [x[3] for x in records if x[0] == 0] == expected[1]
+
+        samplers = {x: FalseFragmentsSampler(seed=3, **parameters) for x in DnaFragmentType}
+        profiled = get_fragments_profiled(5, 5, sequences, list(DnaFragmentType), True, StageProfiler(False), samplers)
+        assert profiled[DnaFragmentType.DONOR] == expected
+
+        samplers = {x: FalseFragmentsSampler(seed=3, **parameters) for x in DnaFragmentType}
+        assert get_acceptors_and_donors(5, 5, sequences, True, samplers)[:2] == expected
+
+
+def test_command_sampling(tmp_path):
+    """
+    Check if command saves given number of false fragments.
+    """
+    input_path = str(tmp_path / "data.dat")
+    save_synthetic_data(input_path, 30, 200, 400, intron_density=20, seed=7)
+
+    for engine in ["python", "numpy"]:
+        output = tmp_path / f"{engine}.dat"
+        get_acceptors_and_donors_command(
+            ["-A", "5", "-B", "5", "-i", input_path, "-t", "DONOR", "-r", str(output), "-e", engine,
+             "--false_count", "25", "--sampling_seed", "1"]
+        )
+        labels = output.read_text().splitlines()[::2]
+        assert labels.count("0") == 25 and labels.count("1") > 0
+
+    assert (tmp_path / "python.dat").read_text() == (tmp_path / "numpy.dat").read_text()
+
+    with pytest.raises(SystemExit):
+        get_acceptors_and_donors_command(
+            ["-A", "5", "-B", "5", "-i", input_path, "-t", "DONOR", "-r", str(output),
+             "--false_count", "25", "--false_ratio", "1"]
+        )
@@ -0,0 +1,87 @@
+from python_code.features import fragments_to_numbers
+from python_code.get_acceptors_and_donors import DONOR_SEQ, find_fragment_positions
+from python_code.naive_bayes import CategoricalNaiveBayes
+from python_code.numpy_fragments import encode_sequence
+from python_code.scanner import (
+    iter_sequence_chunks,
+    scan_command,
+    scan_sequence,
+)
+import io
+import random
+import numpy as np
+from python_tests.test_naive_bayes import create_random_data
+
+
+def scan_whole_sequence(sequence, model, a_len, b_len):
+    """
+    Score every donor in whole sequence with ``predict_log_proba``.
+    """
+    positions = [
+        x for x in find_fragment_positions(sequence, DONOR_SEQ) if x - a_len >= 0 and x + b_len <= len(sequence)
+    ]
+    if not positions:
+        return []
+    fragments = np.stack([encode_sequence(sequence[x - a_len : x + b_len]) for x in positions])
+    log_proba = model.predict_log_proba(fragments_to_numbers(fragments))
+    return list(zip(positions, (log_proba[:, 1] - log_proba[:, 0]).tolist()))
+
+
+def test_scan_sequence_chunks():
+    """
+    Check if scanning in chunks gives the same hits as scoring whole sequence.
+    """
+    rng = random.Random(42)
+    sequence = "".join(rng.choice("ACGTN") for _ in range(2000))
+    x, y = create_random_data(positions_num=6)
+    model = CategoricalNaiveBayes(laplace=1).fit(x, y)
+
+    for a_len in [0, 2, 6]:
+        expected = scan_whole_sequence(sequence, model, a_len, 6 - a_len)
+        for chunk_size in [1, 7, 100, 5000]:
+            chunks = [sequence[x : x + chunk_size] for x in range(0, len(sequence), chunk_size)]
+            hits = list(scan_sequence(chunks, model.log_odds_table(), model.log_prior_odds(), a_len, DONOR_SEQ, -np.inf))
+
+            assert [x[0] for x in hits] == [x[0] for x in expected]
+            assert np.allclose([x[1] for x in hits], [x[1] for x in expected])
+
+
+def test_iter_sequence_chunks():
+    """
+    Check if FASTA sequences are split to chunks and sequences with the same name are separated.
+    """
+    with io.StringIO(">a\nACGT\nAC\n>a\nGG\n") as f:
+        assert list(iter_sequence_chunks(f, 4)) == [(1, "a", "ACGT"), (1, "a", "AC"), (2, "a", "GG")]
+
+
+def test_scan_command(tmp_path):
+    """
+    Check if command saves hits of all sequences.
+    """
+    x, y = create_random_data(positions_num=6)
+    model_path = str(tmp_path / "model.npz")
+    model = CategoricalNaiveBayes(laplace=1).fit(x, y)
+    model.save(model_path)
+
+    (tmp_path / "genome.fa").write_text(">first\nAAGTAAAGTCC\nCGTAA\n>second\nTTTGTAAA\n")
+    scan_command(
+        [
+            "-m",
+            model_path,
+            "-A",
+            "3",
+            "-i",
+            str(tmp_path / "genome.fa"),
+            "-t",
+            "DONOR",
+            "-r",
+            str(tmp_path / "hits.tsv"),
+            "--threshold",
+            "-1000",
+            "--chunk_size",
+            "3",
+        ]
+    )
+
+    hits = [line.split("\t")[:2] for line in (tmp_path / "hits.tsv").read_text().splitlines()]
+    assert hits == [["first", "7"], ["first", "12"], ["second", "3"]]
@@ -0,0 +1,126 @@
+from python_code import sweep
+from python_code.sweep import get_point_name, sweep_command
+from python_code.synthetic_data import save_synthetic_data
+import os
+
+
+def test_get_point_name():
+    """
+    Check names of files with results of grid points.
+    """
+    assert get_point_name(("DONOR", 10, 20, True)) == "donor_10_20_overlap.json"
+    assert get_point_name(("ACCEPTOR", 5, 5, False)) == "acceptor_5_5_no_overlap.json"
+
+
+def test_sweep_command(tmp_path, monkeypatch):
+    """
+    Check if sweep saves row of results for each grid point and skips points computed by earlier run.
+    """
+    input_path = str(tmp_path / "data.dat")
+    save_synthetic_data(input_path, 20, 200, 400, intron_density=20, seed=3)
+    result_dir = tmp_path / "sweep"
+    command_args = ["-i", input_path, "-w", "3,5:4", "-t", "DONOR", "ACCEPTOR", "-k", "3", "-l", "1",
+                    "-r", str(result_dir)]
+
+    sweep_command(command_args)
+
+    lines = (result_dir / "results.tsv").read_text().splitlines()
+    assert lines[0].split("\t") == sweep.SWEEP_COLUMNS
+    rows = [line.split("\t") for line in lines[1:]]
+    assert [row[:4] for row in rows] == [
+        [fragment_type, a_len, "4", overlap]
+        for fragment_type in ["DONOR", "ACCEPTOR"]
+        for a_len in ["3", "5"]
+        for overlap in ["False", "True"]
+    ]
+    assert all(0 <= float(row[6]) <= 1 and int(row[4]) > 0 for row in rows)
+    assert len(list(result_dir.glob("*.json"))) == 8
+
+    # all points are done, so second run doesn't evaluate any point
+    def fail(*_):
+        raise AssertionError("point evaluated again")
+
+    monkeypatch.setattr(sweep, "evaluate_sweep_point", fail)
+    sweep_command(command_args)
+    assert (result_dir / "results.tsv").read_text().splitlines() == lines
+
+    # only missing point is evaluated
+    (result_dir / "donor_3_4_no_overlap.json").unlink()
+    calls = []
+
+    def evaluate(point, config):
+        calls.append(point)
+        return dict(zip(sweep.SWEEP_COLUMNS, list(point) + [0] * 10))
+
+    monkeypatch.setattr(sweep, "evaluate_sweep_point", evaluate)
+    sweep_command(command_args)
+    assert calls == [("DONOR", 3, 4, False)]
+
+    # other configuration of validation invalidates saved points
+    sweep_command(command_args + ["-k", "4"])
+    assert len(calls) == 9
+
+    # new content of input file at the same path invalidates saved points
+    sweep_command(command_args)
+    assert len(calls) == 17
+    save_synthetic_data(input_path, 20, 200, 400, intron_density=20, seed=4)
+    sweep_command(command_args)
+    assert len(calls) == 25
+
+
+def test_sweep_command_resume_doesnt_read_input(tmp_path, monkeypatch):
+    """
+    Check if sweep with all points done doesn't read input file and if moved input file doesn't invalidate
+    saved points.
+    """
+    input_path = str(tmp_path / "data.dat")
+    save_synthetic_data(input_path, 20, 200, 400, intron_density=20, seed=3)
+    result_dir = str(tmp_path / "sweep")
+    sweep_command(["-i", input_path, "-w", "3:4", "-o", "no", "-r", result_dir])
+
+    def fail(*_):
+        raise AssertionError("input read again")
+
+    monkeypatch.setattr(sweep, "read_sweep_sequences", fail)
+    moved_path = str(tmp_path / "moved.dat")
+    os.rename(input_path, moved_path)
+    for workers in ["1", "2"]:
+        sweep_command(["-i", moved_path, "-w", "3:4", "-o", "no", "-j", workers, "-r", result_dir])
+
+
+def test_sweep_command_workers(tmp_path):
+    """
+    Check if points evaluated on pool of processes have the same results as points evaluated in one process.
+    """
+    input_path = str(tmp_path / "data.dat")
+    save_synthetic_data(input_path, 20, 200, 400, intron_density=20, seed=3)
+
+    tables = []
+    for workers in ["1", "2"]:
+        result_dir = tmp_path / workers
+        sweep_command(["-i", input_path, "-w", "3:4", "5:5", "-o", "no", "-j", workers, "-r", str(result_dir)])
+        lines = (result_dir / "results.tsv").read_text().splitlines()
+        # without time column
+        tables.append([line.split("\t")[:-1] for line in lines])
+
+    assert len(tables[0]) == 5
+    assert tables[0] == tables[1]
+
+
+def test_sweep_command_python_engine_different_a_and_b(tmp_path):
+    """
+    Check if python engine with A != B gives the same results as numpy engine, which skips fragments
+    cut at edges of sequence.
+    """
+    input_path = str(tmp_path / "data.dat")
+    save_synthetic_data(input_path, 30, 40, 120, intron_density=20, seed=2)
+
+    tables = []
+    for engine in ["python", "numpy"]:
+        result_dir = tmp_path / engine
+        sweep_command(["-i", input_path, "-w", "4:10", "10:4", "-v", "sv", "-e", engine, "-r", str(result_dir)])
+        lines = (result_dir / "results.tsv").read_text().splitlines()
+        tables.append([line.split("\t")[:-1] for line in lines])
+
+    assert len(tables[0]) == 9
+    assert tables[0] == tables[1]
@@ -0,0 +1,45 @@
+from python_code.get_acceptors_and_donors import (
+    ACCEPTOR_SEQ,
+    DONOR_SEQ,
+    DnaFragmentType,
+    dna_data_read,
+    get_true_positions,
+)
+from python_code.synthetic_data import save_synthetic_data
+
+
+def test_save_synthetic_data(tmp_path):
+    """
+    Check if generated file can be read and its introns begin with donor and end with acceptor.
+    """
+    output = str(tmp_path / "synthetic.dat")
+    bases_num = save_synthetic_data(output, 50, 100, 400, intron_density=10, n_rate=0.1, seed=1)
+
+    with open(output) as dna_file:
+        dna_sequences = dna_data_read(dna_file)
+
+    assert len(dna_sequences) == 50
+    assert sum(len(x["Sequence"]) for x in dna_sequences) == bases_num
+    assert 0.05 < sum(x["Sequence"].count("N") for x in dna_sequences) / bases_num < 0.15
+    for dna_sequence in dna_sequences:
+        sequence = dna_sequence["Sequence"]
+        assert 100 <= len(sequence) <= 400
+        assert dna_sequence["Introns"]
+        for position in get_true_positions(dna_sequence, DnaFragmentType.DONOR):
+            assert sequence[position : position + len(DONOR_SEQ)] == DONOR_SEQ
+        for position in get_true_positions(dna_sequence, DnaFragmentType.ACCEPTOR):
+            assert sequence[position : position + len(ACCEPTOR_SEQ)] == ACCEPTOR_SEQ
+
+        # exons and introns cover whole sequence
+        parts = sorted(dna_sequence["Introns"] + dna_sequence["Exons"])
+        assert parts[0][0] == 0 and parts[-1][1] == len(sequence) - 1
+        assert all(x[1] + 1 == y[0] for x, y in zip(parts, parts[1:]))
+
+
+def test_save_synthetic_data_seed(tmp_path):
+    """
+    Check if the same seed gives the same file.
+    """
+    for name in ["first.dat", "second.dat"]:
+        save_synthetic_data(str(tmp_path / name), 5, 50, 100, seed=7)
+    assert (tmp_path / "first.dat").read_text() == (tmp_path / "second.dat").read_text()